@@ -0,0 +1,302 @@
+# ===============================================================
+# 🔌 JSON API over the slide computations
+# ===============================================================
+"""
+The aggregates behind the slides, as JSON over HTTP (tornado).
+
+Every endpoint reads the same memoized ``compute_*`` functions as
+streamlit_app.py:
+
+- ``GET /v1/games/top?game_type=All``: top 15 games by prize pool and
+  the slide 1 KPIs,
+- ``GET /v1/countries``: players and prize money per country and per
+  continent (slide 3),
+- ``GET /v1/earnings/yearly``: median yearly earnings by GameType, with
+  quartiles and 95% CI (slide 5),
+- ``GET /v1/careers/profiles``: career profile distribution, overall and
+  by GameType (slide 6),
+- ``GET /metrics``: request count and latency percentiles per endpoint.
+
+A response body is serialized once per endpoint, parameters and data
+version, together with its gzip copy and a strong ETag. A repeated
+request costs a cache lookup. ``If-None-Match`` gets a 304, and clients
+sending ``Accept-Encoding: gzip`` get the compressed copy. ``HEAD`` gets
+the headers of the matching ``GET``.
+
+    python api.py [--port 8502]
+    python api.py --bench [--seconds 5] [--connections 16]
+"""
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import Counter, deque
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import tornado.ioloop
+import tornado.web
+
+import compute
+import schema
+from memo import memoize
+
+BASE_DIR = Path(__file__).parent
+DEFAULT_PORT = 8502
+
+# Latencies kept per endpoint for the percentiles of /metrics
+LATENCY_WINDOW = 10_000
+
+
+# ===============================================================
+# 📊 Endpoints
+# ===============================================================
+def _records(df):
+    return json.loads(df.to_json(orient="records"))
+
+
+def top_games(game_type="All"):
+    _, top15_df = compute.compute_prize_bar(game_type)
+    kpis = compute.compute_prize_kpis(game_type, False)
+    columns = ["GameName", "GameType", "TotalUSDPrize", "TotalPlayers", "TotalTournaments"]
+    return {
+        "game_type": game_type,
+        "total_prize": float(kpis["total_prize"]),
+        "games": kpis["games"],
+        "players": kpis["players"],
+        "tournaments": kpis["tournaments"],
+        "top_games": _records(top15_df[columns]),
+    }
+
+
+def countries():
+    df_country, df_continent = compute.compute_country_stats()
+    with_players = (df_country[df_country["PlayerCount"] > 0]
+                    .astype({"PlayerCount": int})
+                    .sort_values("PlayerCount", ascending=False))
+    return {
+        "countries": _records(with_players),
+        "continents": _records(df_continent),
+    }
+
+
+def yearly_earnings():
+    data = compute.compute_yearly_earnings()
+    return {
+        "global_median": float(data["global_median"]),
+        "by_game_type": _records(data["median_by_game"]),
+    }
+
+
+def career_profiles():
+    df_counts, _ = compute.compute_earnings_shape()
+    by_profile = df_counts.groupby("CareerProfile", observed=False)["Count"].sum()
+    return {
+        "profiles": [
+            {"CareerProfile": profile, "Count": int(count), "Share": count / by_profile.sum()}
+            for profile, count in by_profile.items()
+        ],
+        "by_game_type": _records(df_counts[df_counts["Count"] > 0]),
+    }
+
+
+# path: (function, {parameter: (default, allowed values)})
+ENDPOINTS = {
+    "/v1/games/top": (top_games, {"game_type": ("All", compute.game_type_options)}),
+    "/v1/countries": (countries, {}),
+    "/v1/earnings/yearly": (yearly_earnings, {}),
+    "/v1/careers/profiles": (career_profiles, {}),
+}
+
+
+class Response(NamedTuple):
+    body: bytes
+    gzipped: bytes
+    etag: str
+
+
+@memoize(maxsize=64, version=schema.datasets_version)
+def response(path, params):
+    """Serialized body, gzip copy and ETag of one endpoint call."""
+    function, _ = ENDPOINTS[path]
+    body = json.dumps(function(**params), separators=(",", ":")).encode()
+    return Response(body, gzip.compress(body, 6), hashlib.sha1(body).hexdigest())
+
+
+# ===============================================================
+# ⏱️ Latency per endpoint
+# ===============================================================
+class EndpointStats:
+    def __init__(self):
+        self.requests = Counter()
+        self.latencies = {}
+
+    def record(self, endpoint, status, seconds):
+        self.requests[endpoint, status] += 1
+        self.latencies.setdefault(endpoint, deque(maxlen=LATENCY_WINDOW)).append(seconds)
+
+    def summary(self):
+        summary = {}
+        for endpoint, latencies in sorted(self.latencies.items()):
+            ms = np.array(latencies) * 1000
+            summary[endpoint] = {
+                "requests": {str(status): n for (e, status), n in sorted(self.requests.items()) if e == endpoint},
+                "latency_ms": {
+                    "mean": ms.mean(),
+                    "p50": np.percentile(ms, 50),
+                    "p95": np.percentile(ms, 95),
+                    "p99": np.percentile(ms, 99),
+                    "max": ms.max(),
+                },
+            }
+        return summary
+
+
+endpoint_stats = EndpointStats()
+
+
+def log_request(handler):
+    """Tornado ``log_function``: per-endpoint latency instead of access logs."""
+    endpoint = handler.request.path if handler.request.path in ENDPOINTS or handler.request.path == "/metrics" else "other"
+    endpoint_stats.record(endpoint, handler.get_status(), handler.request.request_time())
+
+
+# ===============================================================
+# 🌐 Handlers
+# ===============================================================
+class EndpointHandler(tornado.web.RequestHandler):
+    def initialize(self, endpoint):
+        self.endpoint = endpoint
+        self.etag = None
+
+    def compute_etag(self):
+        # Tornado answers 304 when If-None-Match matches
+        return self.etag
+
+    def get(self):
+        _, parameters = ENDPOINTS[self.endpoint]
+        params = {}
+        for name, (default, options) in parameters.items():
+            value = self.get_argument(name, default)
+            if value not in options():
+                raise tornado.web.HTTPError(400, reason=f"Unknown {name} {value!r}")
+            params[name] = value
+
+        result = response(self.endpoint, params)
+        self.set_header("Content-Type", "application/json")
+        self.set_header("Vary", "Accept-Encoding")
+        if "gzip" in self.request.headers.get("Accept-Encoding", ""):
+            # Same resource, different bytes: its own strong ETag
+            self.etag = f'"{result.etag}-gzip"'
+            self.set_header("Content-Encoding", "gzip")
+            self.write(result.gzipped)
+        else:
+            self.etag = f'"{result.etag}"'
+            self.write(result.body)
+
+    # Same headers, ETag and status as GET; tornado drops the body
+    head = get
+
+
+class MetricsHandler(tornado.web.RequestHandler):
+    def compute_etag(self):
+        return None
+
+    def get(self):
+        self.write(endpoint_stats.summary())
+
+
+def make_app():
+    return tornado.web.Application(
+        [(path, EndpointHandler, dict(endpoint=path)) for path in ENDPOINTS]
+        + [("/metrics", MetricsHandler)],
+        log_function=log_request,
+    )
+
+
+# ===============================================================
+# 🏋️ Load test
+# ===============================================================
+async def _client(port, path, headers, deadline, latencies):
+    """One keep-alive connection sending ``path`` until ``deadline``."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    request = f"GET {path} HTTP/1.1\r\nHost: localhost\r\n{headers}\r\n".encode()
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        writer.write(request)
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = int(head.split(b"Content-Length: ", 1)[1].split(b"\r\n", 1)[0]) if b"Content-Length: " in head else 0
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def _load(port, path, headers, seconds, connections):
+    latencies = []
+    deadline = time.perf_counter() + seconds
+    await asyncio.gather(*(_client(port, path, headers, deadline, latencies) for _ in range(connections)))
+    return latencies
+
+
+def bench(port=DEFAULT_PORT + 1, seconds=5.0, connections=16):
+    """Start the API in a subprocess and hammer every cached endpoint."""
+    server = subprocess.Popen([sys.executable, str(BASE_DIR / "api.py"), "--port", str(port)], cwd=BASE_DIR)
+    try:
+        for _ in range(600):
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics")
+                break
+            except OSError:
+                time.sleep(0.1)
+
+        etags = {}
+        for path in ENDPOINTS:
+            # First call computes and caches the response
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}") as r:
+                etags[path] = r.headers["ETag"]
+
+        cases = []
+        for path in ENDPOINTS:
+            cases.append((path, "identity", ""))
+            cases.append((path, "gzip", "Accept-Encoding: gzip\r\n"))
+            cases.append((path, "304", f"If-None-Match: {etags[path]}\r\n"))
+
+        print(f"{'endpoint':24s} {'mode':9s} {'req/s':>8s} {'p50 ms':>7s} {'p99 ms':>7s}")
+        for path, mode, headers in cases:
+            latencies = asyncio.run(_load(port, path, headers, seconds, connections))
+            ms = np.array(latencies) * 1000
+            print(f"{path:24s} {mode:9s} {len(latencies) / seconds:8,.0f} "
+                  f"{np.percentile(ms, 50):7.2f} {np.percentile(ms, 99):7.2f}")
+
+        # Time spent in the server itself (tornado's request_time)
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as r:
+            for path, summary in json.load(r).items():
+                if path in ENDPOINTS:
+                    latency = summary["latency_ms"]
+                    print(f"{path:24s} server    p50 {latency['p50']:.3f} ms  p99 {latency['p99']:.3f} ms")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JSON API over the slide computations")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--address", default="127.0.0.1", help="interface to listen on (0.0.0.0 for all)")
+    parser.add_argument("--bench", action="store_true", help="run the local load test")
+    parser.add_argument("--seconds", type=float, default=5.0, help="load test duration per case")
+    parser.add_argument("--connections", type=int, default=16, help="load test concurrent connections")
+    args = parser.parse_args()
+
+    if args.bench:
+        bench(seconds=args.seconds, connections=args.connections)
+    else:
+        make_app().listen(args.port, address=args.address)
+        print(f"✅ API on http://{args.address}:{args.port}")
+        tornado.ioloop.IOLoop.current().start()
@@ -0,0 +1,83 @@
+# ===============================================================
+# 🖼️ Responsive images
+# ===============================================================
+"""
+Shows the image variants built by ``python -m pipeline.images``.
+
+``image(name, sizes)`` writes a ``<picture>`` of the variants in
+``app/static/``: WebP with a JPEG fallback, each at every built width, so
+the browser downloads the smallest file covering the slot (``sizes``, in
+CSS units) at the screen's pixel density. Images off the first tab are
+marked ``lazy`` and only load when their tab opens.
+
+Without static file serving (``server.enableStaticServing``) or without
+built variants, it falls back to ``st.image`` with the variant closest to
+``fallback_width``, then to the original file.
+"""
+import html
+from pathlib import Path
+
+import streamlit as st
+
+BASE_DIR = Path(__file__).parent
+STATIC_DIR = BASE_DIR / "static"
+STATIC_URL = "app/static"
+
+FORMATS = {"webp": "image/webp", "jpg": "image/jpeg"}
+
+# Columns stack on narrow screens (Streamlit breakpoint)
+STACKED = "(max-width: 640px) 100vw"
+
+CAPTION_STYLE = "text-align:center; font-size:0.875rem; color:rgba(49, 51, 63, 0.6); margin-top:0.375rem;"
+
+
+def variants(name, extension):
+    """``{width: file}`` of the built variants of ``name``, narrowest first."""
+    stem = Path(name).stem
+    found = {}
+    for path in STATIC_DIR.glob(f"{stem}-*.{extension}"):
+        width = path.stem.rsplit("-", 1)[1]
+        if width.isdigit():
+            found[int(width)] = path
+    return dict(sorted(found.items()))
+
+
+def variant_path(name, width, extension="webp"):
+    """The narrowest variant at least ``width`` pixels wide (else the widest, else the original)."""
+    built = variants(name, extension)
+    if not built:
+        return BASE_DIR / name
+    return next((path for w, path in built.items() if w >= width), list(built.values())[-1])
+
+
+def picture_html(name, sizes, alt="", lazy=False):
+    sources = []
+    for extension, mime in FORMATS.items():
+        srcset = ", ".join(f"{STATIC_URL}/{path.name} {width}w" for width, path in variants(name, extension).items())
+        if srcset:
+            sources.append((mime, srcset))
+    if not sources:
+        return None
+
+    *preferred, (_, fallback_srcset) = sources
+    fallback = fallback_srcset.rsplit(", ", 1)[-1].split(" ")[0]
+    loading = "lazy" if lazy else "eager"
+    return (
+        "<picture>"
+        + "".join(f"<source type='{mime}' srcset='{srcset}' sizes='{sizes}'>" for mime, srcset in preferred)
+        + f"<img src='{fallback}' srcset='{fallback_srcset}' sizes='{sizes}' alt='{html.escape(alt)}' loading='{loading}'"
+        + " style='width:100%; height:auto; display:block;'>"
+        + "</picture>"
+    )
+
+
+def image(name, sizes, caption=None, lazy=False, fallback_width=1280):
+    """Responsive stand-in for ``st.image(BASE_DIR / name, use_container_width=True)``."""
+    markup = picture_html(name, f"{STACKED}, {sizes}", alt=caption or "", lazy=lazy)
+    if markup is None or not st.get_option("server.enableStaticServing"):
+        st.image(variant_path(name, fallback_width), use_container_width=True, caption=caption)
+        return
+    if caption:
+        markup = (f"<figure style='margin:0;'>{markup}"
+                  f"<figcaption style='{CAPTION_STYLE}'>{html.escape(caption)}</figcaption></figure>")
+    st.markdown(markup, unsafe_allow_html=True)
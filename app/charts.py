@@ -0,0 +1,969 @@
+# ===============================================================
+# 📈 Plotly figure builders (no Streamlit calls)
+# ===============================================================
+"""
+Figure construction for each slide.
+
+Builders take the same widget values as the matching ``compute_*`` function
+in compute.py and are memoized on them, so a repeated widget state reuses
+the already-built figure.
+"""
+import matplotlib.colors as mcolors
+import plotly.express as px
+import plotly.graph_objects as go
+
+import compute
+from memo import memoize
+
+# Color palette by GameType (shared by slides 1, 4, 5 and 6)
+GAME_TYPE_COLORS = {
+    'MOBA': '#5f78ff',
+    'Battle Royale': '#ff6361',
+    'FPS': '#43d9a5',
+    'Sports': '#b266ff',
+    'RTS': '#ffa600',
+    'Card Game': '#00c2ff',
+    'Auto Battler': '#ffc658',
+    'Fighting': '#e377c2',      # couleur cohérente avec Plotly pastel
+    'Strategy': '#bcbd22',      # jaune olive doux
+    'Racing': '#17becf'         # bleu clair
+}
+
+# Color scale for the geographic slide
+COUNTRY_COLORSCALE = [
+    [0.0, "#ffffff"],
+    [0.00001, "#bfe0eb"],
+    [0.1, "#6fb5d1"],
+    [0.3, "#4a8cbf"],
+    [0.5, "#7a5eb6"],
+    [0.7, "#c55fa0"],
+    [0.9, "#f27c5b"],
+    [1.0, "#f4c542"]
+]
+
+# Palette personnalisée par GameType (slide 7 timelines)
+TIMELINE_COLORS = {
+    "MOBA": "#ff6b6b",
+    "RTS": "#f7b801",
+    "FPS": "#6a4c93",
+    "Battle Royale": "#1982c4",
+    "Fighting": "#8ac926",
+    "Card/Board": "#ff924c",
+    "Sports": "#1f7a8c",
+    "Racing": "#c32bad",
+    "Other": "#cccccc"
+}
+
+
+def hex_to_rgba(hex_color, alpha=0.8):
+    """Convert a hex color to an rgba string accepted by Plotly."""
+    rgb = mcolors.to_rgb(hex_color)
+    return f"rgba({int(rgb[0]*255)}, {int(rgb[1]*255)}, {int(rgb[2]*255)}, {alpha})"
+
+
+# ===============================================================
+# 🖱️ Client-side filters (opt-in)
+# ===============================================================
+# One figure carries the traces of every filter option; a Plotly dropdown
+# toggles which group is visible, so changing the filter needs no rerun.
+# Above this many points the figure gets too heavy: stay server-driven.
+CLIENT_FILTER_MAX_POINTS = 20_000
+
+
+def client_filter_figure(build, options):
+    """
+    ``build(option)`` for every option in one figure with a dropdown, or None
+    when the combined figure would exceed CLIENT_FILTER_MAX_POINTS.
+    """
+    variants = {option: build(option) for option in options}
+    points = sum(len(trace.x) for variant in variants.values() for trace in variant.data)
+    if points > CLIENT_FILTER_MAX_POINTS:
+        return None
+
+    first = variants[options[0]]
+    fig = go.Figure(layout=first.layout)
+    groups = {}
+    for option, variant in variants.items():
+        start = len(fig.data)
+        fig.add_traces(variant.data)
+        groups[option] = range(start, len(fig.data))
+
+    buttons = []
+    for option, variant in variants.items():
+        visible = [i in groups[option] for i in range(len(fig.data))]
+        # Shapes and annotations (e.g. median lines) differ between options
+        layout = {
+            "shapes": [shape.to_plotly_json() for shape in variant.layout.shapes],
+            "annotations": [note.to_plotly_json() for note in variant.layout.annotations],
+        }
+        buttons.append(dict(label=option, method="update", args=[{"visible": visible}, layout]))
+
+    for i, trace in enumerate(fig.data):
+        trace.visible = i in groups[options[0]]
+    fig.update_layout(updatemenus=[dict(
+        buttons=buttons,
+        direction="down",
+        x=0, xanchor="left",
+        y=1.12, yanchor="top",
+        bgcolor="white",
+        font=dict(color="black", size=16),
+    )])
+    return fig
+
+
+# ===============================================================
+# 📊 Slide 1 – Prize Pool Bar Chart (Top 15)
+# ===============================================================
+@memoize(version=compute.data_version)
+def prize_bar_figure(selected_type):
+    _, top15_df = compute.compute_prize_bar(selected_type)
+
+    fig_bar = px.bar(
+        top15_df,
+        x="PrizeMillions",
+        y="GameName",
+        color="GameType",
+        color_discrete_map={**GAME_TYPE_COLORS, "Other": "#888"},
+        orientation="h",
+        text="PrizeText",
+        custom_data=["GameType", "TotalPlayers", "TotalTournaments"],
+        title="Top 15 Esports Games by Total Prize Pool",
+        labels={"PrizeMillions": "Prize Pool (Million USD)", "GameName": "Game"}
+    )
+
+    fig_bar.update_traces(
+        hovertemplate=(
+            "<b>Game Type:</b> %{customdata[0]}<br>" +
+            "<b>Game:</b> %{y}<br>" +
+            "<b>Prize Pool:</b> $%{x:.1f}M<br>" +
+            "<b>Total Players:</b> %{customdata[1]}<br>" +
+            "<b>Total Tournaments:</b> %{customdata[2]}<extra></extra>"
+        )
+    )
+
+    fig_bar.update_layout(
+        xaxis_title="Total Prize Pool (in Millions USD)",
+        yaxis_title="",
+        yaxis=dict(
+            autorange="reversed",
+            color="white",
+            tickfont=dict(color="white", size=24)
+        ),
+        xaxis=dict(
+            color="white",
+            tickfont=dict(color="white", size=24),
+            showgrid=True,  # ✅ Active les lignes verticales
+            gridcolor='rgba(255, 255, 255, 0.1)',  # ✅ Couleur blanche très transparente
+            gridwidth=1
+        ),
+        plot_bgcolor='#0d1b2a',
+        paper_bgcolor='#0d1b2a',
+        font=dict(color='white', size=18),
+        height=700,
+        title=dict(x=0.3, font=dict(color="white", size=26)),
+        showlegend=True,
+        legend=dict(
+            title="Game Type",
+            title_font=dict(size=1.4 * 16, color='white'),
+            font=dict(size=1.3 * 16, color='white')
+        )
+    )
+
+    fig_bar.update_layout(
+        title=dict(
+            text=f"Top 15 Esports Games by Total Prize Pool",
+            font=dict(size=32, color="white"),
+            x=0.5,
+            y=0.97,  # 👈 contrôle vertical
+            xanchor='center',
+            yanchor='top'
+        ),
+        xaxis=dict(title_font=dict(color="white", size=26), tickfont=dict(color="white", size=24)),
+        yaxis=dict(title_font=dict(size=22), tickfont=dict(color="white", size=20))
+    )
+    fig_bar.update_traces(
+        textfont=dict(
+            family="Arial Bold",  # ou "Helvetica Bold", etc.
+            size=20
+        )
+    )
+    return fig_bar
+
+
+@memoize(maxsize=1, version=compute.data_version)
+def prize_bar_client_figure():
+    """Slide 1 chart with every GameType filter switched in the browser."""
+    return client_filter_figure(prize_bar_figure, compute.game_type_options())
+
+
+# ===============================================================
+# 📊 Slide 2 – Prize distribution top 5k-1k
+# ===============================================================
+@memoize(version=compute.data_version)
+def prize_distribution_figure(selection):
+    data = compute.compute_prize_distribution(selection)
+    df_display = data["df"]
+    title = f"{selection} Players – Earnings Distribution"
+    line_color = 'deepskyblue'
+
+    fig = px.area(
+        df_display,
+        x="Rank",
+        y="TotalUSDPrize",
+        template="plotly_dark",
+    )
+
+    fig.update_traces(
+        line=dict(color=line_color, width=1),
+        mode="lines+markers",  # 👈 ajoute les points visibles
+        marker=dict(size=5),  # 👈 style des points
+        hovertemplate="<b>Rank:</b> %{x}<br>" +
+                "<b>Player:</b> %{customdata}<br>" +
+                "<b>Total Earnings:</b> $%{y:,.0f}<extra></extra>",
+        customdata=df_display["CurrentHandle"]
+    )
+
+    fig.update_layout(
+        title=dict(
+            text=title,
+            font=dict(size=30, color="white"),
+            x=0.5,
+            y=0.97,  # 👈 contrôle vertical
+            xanchor='center',
+            yanchor='top'
+        ),
+        xaxis_title="Player Rank",
+        yaxis_title="Total Prize (USD)",
+        xaxis=dict(
+            tickfont=dict(size=26, color='white'),
+            title_font=dict(size=24, color='white'),
+        ),
+        yaxis=dict(
+            tickfont=dict(size=26, color='white'),
+            title_font=dict(size=24, color='white')
+        ),
+        plot_bgcolor='#0d1b2a',
+        paper_bgcolor='#0d1b2a',
+        font=dict(color='white', size=14),
+        height=700,
+    )
+
+    # Ligne médiane
+    median_val = data["median"]
+    fig.add_hline(
+        y=median_val,
+        line_dash="dot",
+        line_color="red",
+        annotation=dict(
+            text=f"Median ≈ ${median_val/1000:.0f}K",
+            font=dict(color="red", size=33, weight="bold"),
+            x=0.95,
+            xanchor="right",
+            yanchor="bottom",
+            showarrow=False,
+            bgcolor="rgba(0,0,0,0.4)",
+        )
+    )
+
+    # Threshold annotations
+    for rank, prize, label, ax_offset in data["markers"]:
+        fig.add_annotation(
+            x=rank,
+            y=prize,
+            text=f"{label}",
+            showarrow=True,
+            arrowhead=2,
+            arrowsize=1,
+            arrowwidth=3,
+            ax=ax_offset,
+            ay=-120,
+            font=dict(color="deepskyblue", size=30),
+            bgcolor="rgba(0,0,0,0.6)",
+            bordercolor=None,
+            borderwidth=1
+        )
+    return fig
+
+
+# ===============================================================
+# 📊 Slide 3 – Geographic distribution
+# ===============================================================
+# Country hover: the name as hovertext, the numbers as one float customdata
+# array (sent as binary) formatted in the browser
+COUNTRY_HOVER_COLUMNS = ["PlayerCount", "TotalPrize", "AvgPrize"]
+COUNTRY_HOVERTEMPLATE = (
+    "%{hovertext}<br>Players: %{customdata[0]:.0f}"
+    "<br>Total earnings: $%{customdata[1]:,.0f}"
+    "<br>Average per player: $%{customdata[2]:,.0f}<extra></extra>"
+)
+
+COUNTRY_TITLES = {
+    "PlayerCount": "Number of Top 1000 Players per Country",
+    "TotalPrize": "Total Prize Money by Country (USD)"
+}
+
+
+@memoize(version=compute.data_version)
+def country_map_figure(metric, metric_column):
+    df_country, _ = compute.compute_country_stats()
+
+    fig_map = go.Figure(data=go.Choropleth(
+        locations=df_country['CountryISO3'],
+        z=df_country[metric_column],
+        locationmode='ISO-3',
+        colorscale=COUNTRY_COLORSCALE,
+        colorbar_title=COUNTRY_TITLES[metric_column],
+        zmin=0,
+        zmax=df_country[metric_column].max(),
+        hovertext=df_country["CountryName"],
+        customdata=df_country[COUNTRY_HOVER_COLUMNS].to_numpy(),
+        hovertemplate=COUNTRY_HOVERTEMPLATE,
+    ))
+
+    fig_map.update_layout(
+        title_text=COUNTRY_TITLES[metric_column],
+        geo=dict(
+            showframe=False,
+            showcoastlines=False,
+            projection_type='equirectangular',
+            bgcolor='#0b132b',
+            center=dict(lat=20, lon=0),
+            projection_scale=1.1,
+        ),
+        margin=dict(l=30, r=50, t=60, b=50),  # ⬅️ réduit les marges autour de la figure
+
+        legend=dict(font=dict(size=25)),
+        paper_bgcolor='#0b132b',
+        plot_bgcolor='#0b132b',
+        height=600,
+        font=dict(color='white'),
+        title=dict(
+            text=f"Top 10 Countries by {metric}",
+            font=dict(size=30, color="white"),
+            x=0.5,
+            y=0.97,  # 👈 contrôle vertical
+            xanchor='center',
+            yanchor='top'
+        ),
+
+    )
+
+    fig_map.data[0].colorbar.title = None
+    fig_map.data[0].colorbar.tickfont = dict(color='white', size=13)
+    fig_map.update_traces(
+        colorbar=dict(
+            tickfont=dict(size=23, color="white"),
+        )
+    )
+    return fig_map
+
+
+@memoize(version=compute.data_version)
+def top_countries_figure(metric, metric_column):
+    df_country, _ = compute.compute_country_stats()
+    top10 = compute.compute_top_countries(metric_column)
+
+    bar_text = (
+        top10["PlayerCount"].astype(int).astype(str) + " "
+        if metric_column == "PlayerCount"
+        else top10["TotalPrize"].apply(lambda x: f"${x/1e6:.1f}M ")
+    )
+
+    fig_bar = go.Figure()
+    fig_bar.add_trace(go.Bar(
+        x=top10[metric_column],
+        y=top10["CountryName"],
+        orientation="h",
+        text=bar_text,
+        textposition='inside',
+        textfont=dict(size=20),
+        marker=dict(
+            color=top10[metric_column],
+            colorscale=COUNTRY_COLORSCALE,
+            cmin=0,
+            cmax=df_country[metric_column].max(),
+            line=dict(width=0)
+        ),
+        hovertext=top10["CountryName"],
+        customdata=top10[COUNTRY_HOVER_COLUMNS].to_numpy(),
+        hovertemplate=COUNTRY_HOVERTEMPLATE,
+    ))
+
+    fig_bar.update_layout(
+        title=dict(
+            text=f"Top 10 Countries by {metric}",
+            font=dict(size=30, color="white"),
+            x=0.5,
+            y=0.97,  # 👈 contrôle vertical
+            xanchor='center',
+            yanchor='top'
+        ),
+        paper_bgcolor="#0b132b",
+        plot_bgcolor="#0b132b",
+        font=dict(color="white", size=14),
+        xaxis=dict(
+            title=dict(text=metric, font=dict(size=26, color='white')),
+            tickfont=dict(size=24, color='white'),
+            showgrid=True,  # ✅ Active les lignes verticales
+            gridcolor='rgba(255, 255, 255, 0.2)',  # ✅ Couleur blanche très transparente
+            gridwidth=3
+        ),
+        yaxis=dict(
+            title=None,
+            tickfont=dict(size=23, color='white'),
+            automargin=True
+        ),
+        margin=dict(l=220),
+        height=600
+    )
+    fig_bar.update_coloraxes(colorbar_title=None, showscale=False)
+    return fig_bar
+
+
+# ===============================================================
+# 📊 Slide 4 – Careers Structure
+# ===============================================================
+TOURNAMENT_TICKS = [50, 100, 200, 300, 400, 500, 600, 700]
+
+# Rendering by point count: SVG, WebGL (scattergl) from SCATTERGL_MIN_POINTS,
+# then from BINNED_MIN_POINTS one marker per occupied grid cell and GameType
+# (sized by player count), so the payload stops growing with the players.
+# WebGL from 1,000 points is plotly express's own render_mode="auto" cut-off
+# (SVG draws one DOM node per point). tests/bench_scatter.py, players
+# resampled from the career dataset, median of 7 runs:
+#    players  view    markers  build   to_json  validate  payload
+#      5,000  points    5,000  115 ms    24 ms      7 ms   287 KiB
+#      5,000  binned      747  115 ms     4 ms      4 ms    32 KiB
+#     50,000  points   50,000  164 ms   242 ms     35 ms  2746 KiB
+#     50,000  binned      752   96 ms     4 ms      4 ms    33 KiB
+# Points cost ~55 KiB and ~5 ms of to_json per 1,000 players; binned stays
+# flat, so from 20,000 players (~1 MiB, ~100 ms) the binned view is kept
+SCATTERGL_MIN_POINTS = 1_000
+BINNED_MIN_POINTS = 20_000
+
+SCATTER_LABELS = {
+    "CareerLengthYears": "Career Length (years)",
+    "CompressedTournaments": "Total Tournaments Played",
+}
+
+
+@memoize(version=compute.data_version)
+def careers_scatter_figure(selected_type):
+    data = compute.compute_careers_structure(selected_type)
+    return careers_scatter(data["df"], data["median_career_length"])
+
+
+def careers_scatter(filtered_df, median_career_length, binned=None):
+    """
+    Slide 4 scatter of ``filtered_df``. ``binned`` forces (True) or disables
+    (False) the aggregated view; by default it follows BINNED_MIN_POINTS.
+    """
+    tick_values_compressed = compute.compress_y(TOURNAMENT_TICKS).tolist()
+    tick_labels = [str(val) for val in TOURNAMENT_TICKS]
+
+    n_points = len(filtered_df)
+    if binned is None:
+        binned = n_points >= BINNED_MIN_POINTS
+    render_mode = "webgl" if n_points >= SCATTERGL_MIN_POINTS else "svg"
+
+    if binned:
+        fig = px.scatter(
+            compute.bin_careers(filtered_df),
+            x="CareerLengthYears",
+            y="CompressedTournaments",
+            color="GameType",
+            color_discrete_map=GAME_TYPE_COLORS,
+            size="Players",
+            size_max=24,
+            labels=SCATTER_LABELS,
+            custom_data=["Players"],
+            render_mode=render_mode,
+        )
+        fig.update_traces(
+            marker=dict(opacity=0.8, line=dict(width=0)),
+            hovertemplate=(
+                "GameType=%{fullData.name}<br>"
+                "Career Length (years)≈%{x:.1f}<br>"
+                "Players=%{customdata[0]}<extra></extra>"
+            ),
+        )
+    else:
+        fig = px.scatter(
+            filtered_df,
+            x="CareerLengthYears",
+            y="CompressedTournaments",
+            color="GameType",
+            color_discrete_map=GAME_TYPE_COLORS,
+            labels=SCATTER_LABELS,
+            custom_data=["CurrentHandle", "GameName", "TotalTournaments"],
+            opacity=1,
+            render_mode=render_mode,
+        )
+        fig.update_traces(
+            marker=dict(size=8, opacity=0.9),
+            # One trace per GameType: the type comes from the trace name, not from every point
+            hovertemplate=(
+                "GameType=%{fullData.name}<br>"
+                "Career Length (years)=%{x:.1f}<br>"
+                "CurrentHandle=%{customdata[0]}<br>"
+                "GameName=%{customdata[1]}<br>"
+                "TotalTournaments=%{customdata[2]}<extra></extra>"
+            ),
+        )
+
+    fig.update_layout(
+        title_font=dict(size=30, color='white'),
+        paper_bgcolor='#0b132b',
+        plot_bgcolor='#0b132b',
+        font=dict(color='white', size=14),
+        title=dict(
+            text="Career Structure",
+            font=dict(size=30, color="white"),
+            x=0.5,
+            y=0.97,  # 👈 contrôle vertical
+            xanchor='center',
+            yanchor='top'
+    ),
+        height=650,
+        legend=dict(
+        title="Game Type",
+        title_font=dict(size=20, color='white'),
+        font=dict(size=20, color='white')),
+        xaxis=dict(
+            title=dict(font=dict(size=22, color='white')),
+            tickfont=dict(size=24, color='white'),
+            showgrid=True,
+            gridcolor='rgba(255,255,255,0.1)'
+        ),
+        yaxis=dict(
+            showgrid=True,
+            gridcolor='rgba(255,255,255,0.1)',
+            tickfont=dict(size=24, color='white'),
+            tickvals=tick_values_compressed,
+            ticktext=tick_labels,
+            title=(dict(text="Total Tournaments Played",font=dict(size=22, color='white')))
+        )
+    )
+
+    # Median line
+    fig.add_vline(
+        x=median_career_length,
+        line=dict(color='rgba(255,0,0,0.5)', dash='dash', width=2),
+        annotation_text=f"Median ≈ {median_career_length:.1f} yrs",
+        annotation_position="top",
+        annotation_font=dict(color='red', size=24),
+        annotation_xshift=-100,
+        annotation_y=0.95
+    )
+    return fig
+
+
+@memoize(maxsize=1, version=compute.data_version)
+def careers_scatter_client_figure():
+    """Slide 4 scatter with every GameType filter switched in the browser."""
+    return client_filter_figure(careers_scatter_figure, compute.career_type_options())
+
+
+@memoize(maxsize=1, version=compute.data_version)
+def intensity_bar_figure():
+    summary_df = compute.compute_intensity_summary()
+
+    # Create single-bar chart for intensity (Tournaments/Year)
+    fig_bar = go.Figure()
+
+    fig_bar.add_trace(go.Bar(
+        x=summary_df["GameType"],
+        y=summary_df["MedianTournamentsPerYear"],
+        marker_color=[GAME_TYPE_COLORS.get(gt, '#888') for gt in summary_df["GameType"]],
+        name="Median Tournaments / Year"
+    ))
+
+    # Apply layout styling
+    fig_bar.update_layout(
+    title=dict(
+        text="Tournaments per Year (median)",
+        font=dict(size=30, color="white"),
+        x=0.5,
+        y=0.97,  # 👈 contrôle vertical
+        xanchor='center',
+        yanchor='top'
+    ),
+        paper_bgcolor='#0b132b',
+        plot_bgcolor='#0b132b',
+        font=dict(color='white', size=14),
+        height=650,
+        legend=dict(
+            title="Metric",
+            title_font=dict(size=8, color='white'),
+            font=dict(size=20, color='white'),
+            x=0.75,
+            y=0.95,
+            bgcolor='rgba(0,0,0,0)'
+        ),
+        xaxis=dict(
+            #title=dict(text="Game Type", font=dict(size=22, color='white')),
+            title=None,
+            tickfont=dict(size=22, color='white'),
+            showgrid=True,
+            gridcolor='rgba(255,255,255,0.1)'
+        ),
+        yaxis=dict(
+            #title=dict(text="Median Tournaments per Year", font=dict(size=22, color='white')),
+            title=None,
+            tickfont=dict(size=24, color='white'),
+            showgrid=True,
+            gridcolor='rgba(255,255,255,0.1)'
+        ),
+        margin=dict(l=40, r=40, t=60, b=40)
+    )
+    return fig_bar
+
+
+# ===============================================================
+# 📊 Slide 5 – Median Yearly Earnings by Game Type
+# ===============================================================
+# Error bar options for slide 5: label -> (lower, upper) bound columns
+ERROR_BAR_BOUNDS = {
+    "None": None,
+    "Interquartile range": ("Q1", "Q3"),
+    "95% CI of the median": ("CILow", "CIHigh"),
+}
+
+
+@memoize(maxsize=4, version=compute.data_version)
+def yearly_earnings_figure(error_bars="None"):
+    data = compute.compute_yearly_earnings()
+    median_by_game = data["median_by_game"]
+
+    # Optional asymmetric error bars around each median
+    bounds = ERROR_BAR_BOUNDS[error_bars]
+    error_y = {}
+    if bounds is not None:
+        low, high = bounds
+        error_y = dict(
+            error_y=median_by_game[high] - median_by_game["AvgEarningsPerYear"],
+            error_y_minus=median_by_game["AvgEarningsPerYear"] - median_by_game[low],
+        )
+
+    fig = px.bar(
+        median_by_game,
+        x="GameType",
+        y="AvgEarningsPerYear",
+        color="GameType",
+        color_discrete_map=GAME_TYPE_COLORS,
+        labels={
+            "GameType": "Game Type",
+            "AvgEarningsPerYear": "Median Earnings per Year (USD)"
+        },
+        title="Median Yearly Earnings",
+        **error_y
+    )
+
+    # Add number of players as annotations at the bottom of each bar
+    for gametype, count in zip(median_by_game["GameType"], median_by_game["Count"]):
+        fig.add_annotation(
+            x=gametype,
+            y=2000,  # offset above the zero line
+            text=f"{count} players",
+            showarrow=False,
+            font=dict(color="black", size=24),
+            yanchor="bottom"
+        )
+
+    # Global median line (dashed)
+    fig.add_hline(
+        y=data["global_median"],
+        line_dash="dash",
+        line_color="red",
+        annotation_text="Global Median",
+        annotation_position="top right",
+        annotation_font_color="red",
+        annotation_font_size=27,
+        annotation_xshift=-580,
+        annotation_yshift=5  # 👈 Taille du texte ici
+
+    )
+
+    # Style settings
+    fig.update_layout(
+        title=dict(
+            text="Yearly Earnings by Game Type",
+            font=dict(size=34, color='white'),
+            x=0.5,
+            xanchor='center'
+        ),
+        paper_bgcolor='#0b132b',
+        plot_bgcolor='#0b132b',
+        font=dict(color='white', size=14),
+        height=650,
+        xaxis=dict(
+            title=None,
+            tickfont=dict(size=24, color='white'),
+            showgrid=False
+        ),
+        yaxis=dict(
+            title_font=dict(size=26, color='white'),
+            tickfont=dict(size=24, color='white'),
+            showgrid=True,
+            gridcolor='rgba(255,255,255,0.3)'
+        ),
+        showlegend=False
+    )
+    return fig
+
+
+# ===============================================================
+# 📊 Slide 6 – Earnings Shape
+# ===============================================================
+@memoize(maxsize=1, version=compute.data_version)
+def earnings_shape_figure():
+    df_counts, _ = compute.compute_earnings_shape()
+
+    fig = px.bar(
+        df_counts,
+        x="CareerProfile",
+        y="Count",
+        color="GameType",
+        color_discrete_map=GAME_TYPE_COLORS,
+        barmode="stack",
+        category_orders={"CareerProfile": compute.PROFILE_LABELS},
+        labels={
+            "CareerProfile": "Career Profile",
+            "Count": "Number of Players",
+            "GameType": "Game Type"
+        },
+        title=""
+    )
+
+    fig.update_layout(
+        title=dict(
+            text="Number of Players per Career Profile",
+            font=dict(size=28, color='white'),
+            x=0.5,
+            xanchor='center'
+        ),
+        paper_bgcolor='#0b132b',
+        plot_bgcolor='#0b132b',
+        font=dict(color='white', size=20),
+        height=650,
+        margin=dict(t=100, l=10, r=140, b=10),  # ➕ marge droite plus large pour la légende
+        xaxis=dict(
+            title="Career Profile",
+            title_font=dict(size=26, color='white'),
+            tickfont=dict(size=24, color='white')
+        ),
+        yaxis=dict(
+            title="Number of Players",
+            title_font=dict(size=26, color='white'),
+            tickfont=dict(size=24, color='white')
+        ),
+        legend=dict(
+            orientation="v",  # ➡️ vertical
+            yanchor="top",
+            y=0.95,
+            xanchor="left",
+            x=1.02,  # ➡️ décalé juste à l'intérieur
+            bgcolor='rgba(0,0,0,0)',
+            font=dict(size=22, color="white"),
+            title_font=dict(size=24, color="white")
+        )
+    )
+    return fig
+
+
+# ===============================================================
+# 📊 Slide 7 – Career Archetypes
+# ===============================================================
+@memoize(version=compute.data_version)
+def timeline_figure(player_ids, title):
+    """Cumulative earnings timeline per player, colored by GameType."""
+    filtered, game_types, handles = compute.compute_career_timeline(player_ids)
+    color_map = {
+        player_id: TIMELINE_COLORS.get(game_type, "#ffffff") if game_type is not None else "#ffffff"
+        for player_id, game_type in game_types.items()
+    }
+
+    # Dates as epoch milliseconds: one binary array instead of ISO strings
+    filtered = filtered.assign(EndDate=filtered["EndDate"].to_numpy("datetime64[ms]").astype("int64").astype("float64"))
+
+    fig = px.line(
+        filtered,
+        x="EndDate",
+        y="CumulativePrize",
+        color="PlayerId",
+        line_group="PlayerId",
+        labels={"CumulativePrize": "Cumulative Earnings (USD)", "EndDate": "Date", "PlayerId": "Player"},
+        title=title,
+        color_discrete_map=color_map
+    )
+    # One trace per PlayerId; the handle is only the legend and hover label
+    for trace in fig.data:
+        handle = handles[int(trace.name)]
+        trace.update(
+            name=handle,
+            legendgroup=handle,
+            hovertemplate=trace.hovertemplate.replace(f"Player={trace.name}<", f"Player={handle}<"),
+        )
+
+    fig.update_layout(
+        title=dict(
+            text=title,
+            font=dict(size=28, color='white'),
+            x=0.5,
+            xanchor='center'
+        ),
+        paper_bgcolor='#0b132b',
+        plot_bgcolor='#0b132b',
+        font=dict(color='white', size=20),
+        height=400,
+        margin=dict(t=100, l=10, r=140, b=10),
+        xaxis=dict(
+            type="date",
+            title=None,
+            title_font=dict(size=22, color='white'),
+            tickfont=dict(size=24, color='white')
+        ),
+        yaxis=dict(
+            title="Cumulative Earnings (USD)",
+            title_font=dict(size=24, color='white'),
+            tickfont=dict(size=24, color='white')
+        ),
+        legend=dict(
+            title="Player",
+            orientation="v",
+            yanchor="top",
+            y=0.95,
+            xanchor="left",
+            x=1.02,
+            bgcolor='rgba(0,0,0,0)',
+            font=dict(size=24, color="white"),
+            title_font=dict(size=20, color="white")
+        )
+    )
+
+    # Game annotation at each player's mid-career point
+    for i, point in enumerate(compute.compute_game_annotations(player_ids)):
+        if point is None:
+            continue
+        end_date, cumulative_prize, game_name, game_type = point
+
+        # Couleur principale et fond
+        color = TIMELINE_COLORS.get(game_type, "#ffffff")
+        rgba_bg = hex_to_rgba(color, alpha=1)
+
+        fig.add_annotation(
+            x=end_date,
+            y=cumulative_prize,
+            text=f"<b>{game_name}</b><br><i>{game_type}</i>",
+            showarrow=True,
+            arrowhead=2,
+            arrowsize=1,
+            arrowwidth=1.5,
+            ax=-100,
+            ay=-70 + i * 30,
+            font=dict(color="black", size=20),
+            bgcolor=rgba_bg,
+            bordercolor=color,
+            borderwidth=2
+        )
+    return fig
+
+
+# ===============================================================
+# 📊 Slide 8 – Earnings Over Time
+# ===============================================================
+@memoize(version=compute.data_version)
+def earnings_over_time_figure(year_range):
+    yearly = compute.compute_earnings_over_time(year_range)["yearly"]
+
+    fig = px.bar(
+        yearly,
+        x="Year",
+        y="Earnings",
+        color="GameType",
+        color_discrete_map={**GAME_TYPE_COLORS, "Other": "#888"},
+        barmode="stack",
+        labels={"Earnings": "Earnings (USD)", "GameType": "Game Type"},
+        title=""
+    )
+
+    fig.update_layout(
+        title=dict(
+            text="Tournament Earnings per Year",
+            font=dict(size=28, color='white'),
+            x=0.5,
+            xanchor='center'
+        ),
+        paper_bgcolor='#0b132b',
+        plot_bgcolor='#0b132b',
+        font=dict(color='white', size=20),
+        height=650,
+        margin=dict(t=100, l=10, r=140, b=10),
+        xaxis=dict(
+            title=None,
+            tickfont=dict(size=22, color='white'),
+            dtick=1 if year_range[1] - year_range[0] <= 12 else 2
+        ),
+        yaxis=dict(
+            title="Earnings (USD)",
+            title_font=dict(size=26, color='white'),
+            tickfont=dict(size=24, color='white'),
+            gridcolor='rgba(255,255,255,0.1)'
+        ),
+        legend=dict(
+            orientation="v",
+            yanchor="top",
+            y=0.95,
+            xanchor="left",
+            x=1.02,
+            bgcolor='rgba(0,0,0,0)',
+            font=dict(size=22, color="white"),
+            title_font=dict(size=24, color="white")
+        )
+    )
+    return fig
+
+
+@memoize(version=compute.data_version)
+def window_top_players_figure(year_range):
+    top_players = compute.compute_earnings_over_time(year_range)["top_players"]
+
+    # One bar per PlayerId (handles are not unique); handles are tick and hover labels
+    player_ids = top_players["PlayerId"].astype(str)
+    handles = top_players["CurrentHandle"].astype(str)
+    fig = go.Figure(go.Bar(
+        x=top_players["Earnings"],
+        y=player_ids,
+        orientation="h",
+        marker_color=[GAME_TYPE_COLORS.get(gt, '#888') for gt in top_players["GameType"]],
+        customdata=list(zip(handles, top_players["GameType"].astype(str))),
+        hovertemplate="%{customdata[0]} (%{customdata[1]})<br>$%{x:,.0f}<extra></extra>"
+    ))
+
+    fig.update_layout(
+        title=dict(
+            text=f"Top 10 Earners {year_range[0]}–{year_range[1]}",
+            font=dict(size=28, color='white'),
+            x=0.5,
+            xanchor='center'
+        ),
+        paper_bgcolor='#0b132b',
+        plot_bgcolor='#0b132b',
+        font=dict(color='white', size=20),
+        height=650,
+        margin=dict(t=100, l=10, r=10, b=10),
+        xaxis=dict(
+            title=None,
+            tickfont=dict(size=20, color='white'),
+            gridcolor='rgba(255,255,255,0.1)'
+        ),
+        yaxis=dict(
+            title=None,
+            type="category",
+            tickmode="array",
+            tickvals=list(player_ids),
+            ticktext=list(handles),
+            tickfont=dict(size=22, color='white')
+        )
+    )
+    return fig
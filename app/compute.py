@@ -0,0 +1,635 @@
+# ===============================================================
+# 🧮 Pure computations behind each slide (no Streamlit calls)
+# ===============================================================
+"""
+Data loading and per-slide transformations for the dashboard.
+
+Every ``compute_*`` function takes plain widget values (strings, booleans,
+tuples) and returns plain frames, arrays and numbers. Nothing here touches
+Streamlit, so results can be memoized, benchmarked or reused outside the app.
+"""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pycountry
+import pycountry_convert as pc
+
+import keys
+import schema
+import stats
+from memo import memoize
+
+BASE_DIR = Path(__file__).parent
+
+
+# ===============================================================
+# 📦 Loaders
+# ===============================================================
+# String columns (GameType, GameName, CountryCode, CareerStatus, CurrentHandle)
+# are loaded as categoricals sharing one dictionary per column — see schema.py.
+# That dictionary spans every dataset, so every memoized loader and computation
+# is keyed on the version of all of them (mtime and size per file): rewriting
+# any file serves new frames, with one set of dtypes, everywhere.
+data_version = schema.datasets_version
+
+# Players shown on slide 3 (the leaderboard file may hold more)
+TOP_PLAYERS = 5000
+
+
+@memoize(maxsize=1, version=data_version)
+def load_games_data():
+    df = schema.read_csv("games_metadata_enriched.csv")
+    df['TotalUSDPrize'] = df['TotalUSDPrize'].fillna(0)
+    df['TotalPlayers'] = df['TotalPlayers'].fillna(0)
+    df['TotalTournaments'] = df['TotalTournaments'].fillna(0)
+    return df
+
+
+@memoize(maxsize=1, version=data_version)
+def load_top_players():
+    """Top 5000 of the ranked leaderboard (built by pipeline/leaderboard.py)."""
+    df = schema.read_csv("leaderboard.csv")
+    return df[df["Rank"] <= TOP_PLAYERS].reset_index(drop=True)
+
+
+@memoize(maxsize=1, version=data_version)
+def load_players_profiles():
+    return schema.read_csv("players_profiles_with_id.csv")
+
+
+@memoize(maxsize=1, version=data_version)
+def load_data():
+    """Career-level dataset (one row per player) used by slides 4 to 6."""
+    df = schema.read_csv("scatter_df_export.csv")
+    df["AvgEarningsPerYear"] = df["TotalUSDPrize"] / df["CareerLengthYears"]
+    return df
+
+
+@memoize(maxsize=1, version=data_version)
+def load_tournaments():
+    """Tournament history with cumulative prize (slide 7)."""
+    # USD amounts are computed once at ingestion (pipeline/currency.py)
+    df = schema.read_csv(
+        "tournaments_corrected_with_handles_and_games.csv",
+        dtype={"USDPrize": "float64", "USDPrizePerPlayer": "float64"},
+    )
+    df["EndDate"] = pd.to_datetime(df["EndDate"])
+    df.sort_values(by=["CurrentHandle", "PlayerId", "EndDate"], inplace=True, ignore_index=True)
+    df["CumulativePrize"] = df.groupby("PlayerId")["USDPrizePerPlayer"].cumsum()
+    return df
+
+
+@memoize(maxsize=1, version=data_version)
+def load_game_shares():
+    """
+    Share of every game in each player's career, indexed by PlayerId.
+
+    Tournament count and earnings per (PlayerId, GameId) come from one grouped
+    pass over the tournament history. Within a player, rows are ordered by
+    tournaments played (then earnings), so the first row is the main game —
+    the rule used by the notebook — and is flagged IsMain.
+    """
+    tournaments = load_tournaments()
+    shares = tournaments.groupby(["PlayerId", "GameId"]).agg(
+        Tournaments=("USDPrizePerPlayer", "size"),
+        Earnings=("USDPrizePerPlayer", "sum"),
+    ).reset_index()
+
+    totals = shares.groupby("PlayerId")[["Tournaments", "Earnings"]].transform("sum")
+    shares["TournamentShare"] = shares["Tournaments"] / totals["Tournaments"]
+    shares["EarningsShare"] = shares["Earnings"] / totals["Earnings"]
+    games = load_games_data()
+    game_rows = keys.position_map(games["GameId"], shares["GameId"])
+    shares["GameName"] = keys.take(games, game_rows, "GameName")
+    shares["GameType"] = keys.take(games, game_rows, "GameType")
+
+    shares = shares.sort_values(
+        ["PlayerId", "Tournaments", "Earnings", "GameId"],
+        ascending=[True, False, False, True],
+    )
+    shares["IsMain"] = ~shares["PlayerId"].duplicated()
+    return shares.set_index("PlayerId")
+
+
+@memoize(maxsize=1, version=data_version)
+def load_main_games():
+    """Main game of each player (one row per PlayerId)."""
+    shares = load_game_shares()
+    return shares[shares["IsMain"]].drop(columns="IsMain")
+
+
+# ===============================================================
+# 🔑 Precomputed joins (PlayerId / GameId position maps)
+# ===============================================================
+@memoize(maxsize=1, version=data_version)
+def tournament_game_positions():
+    """Row of each tournament's game in the games table (-1 if unknown)."""
+    return keys.position_map(load_games_data()["GameId"], load_tournaments()["GameId"])
+
+
+@memoize(maxsize=1, version=data_version)
+def tournament_player_positions():
+    """Row of each tournament's player in the career dataset (-1 if unknown)."""
+    return keys.position_map(load_data()["PlayerId"], load_tournaments()["PlayerId"])
+
+
+@memoize(maxsize=1, version=data_version)
+def tournament_player_indices():
+    """Row positions of each player's tournaments (in date order), by PlayerId."""
+    return load_tournaments().groupby("PlayerId").indices
+
+
+# ===============================================================
+# 📊 Slide 1 – Prize Pool Bar Chart (Top 15)
+# ===============================================================
+@memoize(version=data_version)
+def game_type_options():
+    return ["All"] + sorted(load_games_data()['GameType'].dropna().unique())
+
+
+@memoize(version=data_version)
+def compute_prize_bar(selected_type):
+    """Filtered games and the top 15 by prize for one GameType (or "All")."""
+    games_df = load_games_data()
+    if selected_type == "All":
+        filtered_df = games_df.copy()
+    else:
+        filtered_df = games_df[games_df["GameType"] == selected_type].copy()
+
+    # Slice top 15 by prize
+    top15_df = filtered_df.sort_values(by='TotalUSDPrize', ascending=False).head(15).copy()
+    top15_df["PrizeMillions"] = top15_df["TotalUSDPrize"] / 1_000_000
+    top15_df["PrizeText"] = top15_df["PrizeMillions"].apply(lambda x: f"${x:.0f}M")
+    return filtered_df, top15_df
+
+
+@memoize(version=data_version)
+def compute_prize_kpis(selected_type, top15_only):
+    filtered_df, top15_df = compute_prize_bar(selected_type)
+    kpi_df = top15_df if top15_only else filtered_df
+    return {
+        "total_prize": kpi_df['TotalUSDPrize'].sum(),
+        "games": len(kpi_df),
+        "players": int(kpi_df['TotalPlayers'].sum()),
+        "tournaments": int(kpi_df['TotalTournaments'].sum()),
+    }
+
+
+# ===============================================================
+# 📊 Slide 2 – Prize distribution top 5k-1k
+# ===============================================================
+PRIZE_THRESHOLDS = {
+    "Top 1000": [(1_000_000, "$1M", 60), (500_000, "$500K", 80)],
+    "Top 5000": [(1_000_000, "$1M", 60), (500_000, "$500K", 80),
+                 (100_000, "$100K", 100), (200_000, "$200K", 100)],
+}
+
+
+@memoize(version=data_version)
+def compute_prize_distribution(selection):
+    """Ranked earnings, total, median and threshold markers for a player scope."""
+    df_5000_sorted = load_top_players()
+    df_display = df_5000_sorted.head(1000) if selection == "Top 1000" else df_5000_sorted
+
+    # Last ranked player at or above each threshold (prizes are sorted descending)
+    prizes = df_display["TotalUSDPrize"].to_numpy()
+    ranks = df_display["Rank"].to_numpy()
+    thresholds, labels, offsets = zip(*PRIZE_THRESHOLDS[selection])
+    n_above = np.searchsorted(-prizes, -np.asarray(thresholds), side="right")
+    markers = [
+        (int(ranks[n - 1]), int(prizes[n - 1]), label, ax_offset)
+        for n, label, ax_offset in zip(n_above, labels, offsets)
+        if n > 0
+    ]
+
+    return {
+        "df": df_display,
+        "total_prize": df_display["TotalUSDPrize"].sum(),
+        "median": df_display["TotalUSDPrize"].median(),
+        "markers": markers,
+    }
+
+
+# ===============================================================
+# 📊 Slide 3 – Geographic distribution
+# ===============================================================
+CONTINENT_NAMES = {
+    "AF": "Africa",
+    "AS": "Asia",
+    "EU": "Europe",
+    "NA": "North America",
+    "OC": "Oceania",
+    "SA": "South America"
+}
+CONTINENT_ORDER = ["Asia", "Europe", "North America", "South America", "Oceania", "Africa"]
+
+
+def iso3_to_continent_func(iso3):
+    try:
+        iso2 = pc.country_alpha3_to_country_alpha2(iso3)
+        continent_code = pc.country_alpha2_to_continent_code(iso2)
+        return CONTINENT_NAMES.get(continent_code, "Unknown")
+    except:
+        return "Unknown"
+
+
+@memoize(maxsize=1, version=data_version)
+def compute_country_stats():
+    """Per-country player count, total and average prize for every ISO3 country."""
+    players_df = load_players_profiles().copy()
+
+    # ISO2 → ISO3 via pycountry
+    iso2_to_iso3 = {country.alpha_2: country.alpha_3 for country in pycountry.countries}
+    players_df['CountryISO3'] = players_df['CountryCode'].map(iso2_to_iso3)
+
+    # ISO3 → Continent via pycountry_convert, once per distinct country
+    continents = {iso3: iso3_to_continent_func(iso3) for iso3 in players_df["CountryISO3"].dropna().unique()}
+    players_df["Continent"] = players_df["CountryISO3"].map(continents)
+
+    # All ISO3 and Country Names
+    all_iso3 = [country.alpha_3 for country in pycountry.countries]
+    iso3_to_name = {country.alpha_3: country.name for country in pycountry.countries}
+    df_all = pd.DataFrame({
+        "CountryISO3": all_iso3,
+        "CountryName": [iso3_to_name[iso3] for iso3 in all_iso3]
+    })
+
+    # Stats
+    df_stats = players_df.groupby("CountryISO3", observed=True).agg(
+        PlayerCount=("TotalUSDPrize", "count"),
+        TotalPrize=("TotalUSDPrize", "sum"),
+        AvgPrize=("TotalUSDPrize", "mean")
+    ).reset_index()
+
+    df_country = df_all.merge(df_stats, on="CountryISO3", how="left")
+    continent_map = players_df[["CountryISO3", "Continent"]].drop_duplicates(subset="CountryISO3").set_index("CountryISO3")["Continent"]
+    df_country["Continent"] = df_country["CountryISO3"].map(continent_map)
+    df_country[["PlayerCount", "TotalPrize", "AvgPrize"]] = df_country[["PlayerCount", "TotalPrize", "AvgPrize"]].fillna(0)
+
+    # Continents
+    df_continent = df_country.groupby("Continent").agg({
+        "PlayerCount": "sum",
+        "TotalPrize": "sum"
+    }).reset_index()
+    df_continent["Continent"] = pd.Categorical(df_continent["Continent"], categories=CONTINENT_ORDER, ordered=True)
+    df_continent = df_continent.sort_values("Continent")
+
+    return df_country, df_continent
+
+
+@memoize(version=data_version)
+def compute_continent_cards(metric_column):
+    """(label, formatted value) per continent for the selected metric."""
+    _, df_continent = compute_country_stats()
+    values = df_continent[metric_column]
+    if metric_column == "PlayerCount":
+        formatted = values.astype(int).map("{:,}".format)
+    else:
+        formatted = (values / 1_000_000).map("${:,.2f}M".format)
+    return list(zip(df_continent["Continent"], formatted))
+
+
+@memoize(version=data_version)
+def compute_top_countries(metric_column):
+    """Top 10 countries by the selected metric, ascending for a horizontal bar."""
+    df_country, _ = compute_country_stats()
+    return df_country.nlargest(10, metric_column).sort_values(metric_column)
+
+
+# ===============================================================
+# 📊 Slide 4 – Careers Structure
+# ===============================================================
+def compress_y(val, threshold=300, factor=0.4):
+    """Soft Y-axis compression above ``threshold`` tournaments (scalar or array)."""
+    val = np.asarray(val, dtype=float)
+    return np.where(val <= threshold, val, threshold + (val - threshold) * factor)
+
+
+@memoize(maxsize=1, version=data_version)
+def load_career_df():
+    """Career dataset for slide 4, cleaned and pre-sorted for plotting (built once per data version)."""
+    career_df = load_data()
+
+    # Clean and compute key metrics
+    career_df = career_df[
+        (career_df["CareerLengthYears"] > 0.25) &
+        (career_df["TotalTournaments"] > 0) &
+        (~career_df["GameType"].isna())
+    ].copy()
+
+    career_df["TournamentsPerYear"] = career_df["TotalTournaments"] / career_df["CareerLengthYears"]
+    career_df["CompressedTournaments"] = compress_y(career_df["TotalTournaments"].to_numpy())
+
+    # Sort once (stable multi-key sort), so any GameType subset is already in plot order
+    return career_df.sort_values(by=["CareerLengthYears", "CompressedTournaments"]).reset_index(drop=True)
+
+
+def bin_careers(career_df, bins=80):
+    """
+    Players per GameType and (career length, compressed tournaments) cell of a
+    ``bins`` x ``bins`` grid, positioned at the cell centers. Used instead of
+    one point per player for very large datasets.
+    """
+    cells = {}
+    for column in ("CareerLengthYears", "CompressedTournaments"):
+        values = career_df[column].to_numpy()
+        edges = np.linspace(values.min(), values.max(), bins + 1)
+        cell = np.clip(np.searchsorted(edges, values, side="right") - 1, 0, bins - 1)
+        cells[column] = cell
+        cells[f"{column}Center"] = (edges[:-1] + edges[1:]) / 2
+
+    binned = (
+        pd.DataFrame({
+            "GameType": career_df["GameType"].array,
+            "XCell": cells["CareerLengthYears"],
+            "YCell": cells["CompressedTournaments"],
+        })
+        .groupby(["GameType", "XCell", "YCell"], observed=True)
+        .size()
+        .rename("Players")
+        .reset_index()
+    )
+    binned["CareerLengthYears"] = cells["CareerLengthYearsCenter"][binned["XCell"]]
+    binned["CompressedTournaments"] = cells["CompressedTournamentsCenter"][binned["YCell"]]
+    return binned
+
+
+@memoize(maxsize=1, version=data_version)
+def career_type_indices():
+    """Row positions of each GameType in the pre-sorted career dataset."""
+    return load_career_df().groupby("GameType", observed=True).indices
+
+
+@memoize(version=data_version)
+def career_type_options():
+    return ["All"] + sorted(career_type_indices())
+
+
+@memoize(version=data_version)
+def compute_careers_structure(selected_type):
+    """Players of one GameType (in plot order) and their median KPIs."""
+    career_df = load_career_df()
+    if selected_type == "All":
+        filtered_df = career_df
+    else:
+        filtered_df = career_df.take(career_type_indices()[selected_type])
+
+    return {
+        "df": filtered_df,
+        "median_career_length": filtered_df["CareerLengthYears"].median(),
+        "median_tournaments": filtered_df["TotalTournaments"].median(),
+        "median_tournaments_per_year": filtered_df["TournamentsPerYear"].median(),
+    }
+
+
+@memoize(maxsize=1, version=data_version)
+def compute_intensity_summary():
+    """Median tournaments per year by GameType (GameTypes with ≥ 10 players)."""
+    career_df = load_career_df()
+    counts = career_df["GameType"].value_counts()
+    valid_types = counts[counts >= 10].index
+    barplot_df = career_df[career_df["GameType"].isin(valid_types)]
+
+    return barplot_df.groupby("GameType", observed=True).agg(
+        MedianTournamentsPerYear=("TournamentsPerYear", "median"),
+        Count=("PlayerId", "count")
+    ).reset_index().sort_values("MedianTournamentsPerYear", ascending=False)
+
+
+# ===============================================================
+# 📊 Slide 5 – Median Yearly Earnings by Game Type
+# ===============================================================
+@memoize(maxsize=1, version=data_version)
+def compute_yearly_earnings():
+    """
+    Yearly earnings statistics per GameType (GameTypes with ≥ 10 players).
+
+    Median, player count and quartiles all come from one grouping of the
+    dataset, so the cost stays linear in the number of players however many
+    GameTypes there are. Bootstrap confidence bounds of the medians are
+    attached as CILow / CIHigh.
+    """
+    scatter_df = load_data()
+    earnings = scatter_df.groupby("GameType", observed=True)["AvgEarningsPerYear"]
+
+    summary = pd.DataFrame({
+        "AvgEarningsPerYear": earnings.median(),
+        "Count": earnings.size(),
+        "Q1": earnings.quantile(0.25),
+        "Q3": earnings.quantile(0.75),
+    })
+
+    # Filter: Only GameTypes with ≥ 10 players
+    summary = summary[summary["Count"] >= 10]
+    median_by_game = (
+        summary.sort_values("AvgEarningsPerYear", ascending=False)
+        .rename_axis("GameType")
+        .reset_index()
+    )
+
+    # 95% bootstrap CI of each median (cached on the data's hash)
+    in_valid_types = scatter_df["GameType"].isin(median_by_game["GameType"])
+    ci = stats.bootstrap_median_ci(scatter_df[in_valid_types], "GameType", "AvgEarningsPerYear")
+    median_by_game = median_by_game.join(ci[["CILow", "CIHigh"]], on="GameType")
+
+    return {
+        "median_by_game": median_by_game,
+        "global_median": scatter_df.loc[in_valid_types, "AvgEarningsPerYear"].median(),
+    }
+
+
+# ===============================================================
+# 📊 Slide 6 – Earnings Shape
+# ===============================================================
+PROFILE_BINS = [0, 0.30, 0.55, 0.8, 1.01]
+PROFILE_LABELS = ["Steady", "Balanced", "Spiky", "Explosive"]
+
+
+@memoize(maxsize=1, version=data_version)
+def compute_earnings_shape():
+    df = load_data()
+
+    # ---- FILTER: Only main GameTypes (≥10 players) ----
+    valid_gametypes = df["GameType"].value_counts()
+    valid_gametypes = valid_gametypes[valid_gametypes >= 10].index
+    df = df[df["GameType"].isin(valid_gametypes)].copy()
+    df["GameType"] = df["GameType"].cat.remove_unused_categories()
+
+    # ---- CLASSIFICATION: Based on Top10PctEarningsRatio ----
+    df["CareerProfile"] = pd.cut(df["Top10PctEarningsRatio"], bins=PROFILE_BINS, labels=PROFILE_LABELS, include_lowest=True)
+
+    # ---- COUNTS FOR PLOT ----
+    df_counts = (
+        df.groupby(["CareerProfile", "GameType"], observed=False)
+        .size()
+        .reset_index(name="Count")
+    )
+
+    # ---- KPI METRICS ----
+    profile_distribution = df["CareerProfile"].value_counts(normalize=True).reindex(PROFILE_LABELS)
+    profile_pct = (profile_distribution * 100).map("{:.1f}%".format)
+    return df_counts, profile_pct
+
+
+# ===============================================================
+# 📊 Slide 7 – Career Archetypes
+# ===============================================================
+@memoize(version=data_version)
+def compute_career_timeline(player_ids):
+    """Tournament rows of the given players, and their main GameType and handle by PlayerId."""
+    df = load_tournaments()
+    indices = tournament_player_indices()
+    rows = [indices[player_id] for player_id in player_ids if player_id in indices]
+    filtered = df.take(np.sort(np.concatenate(rows))) if rows else df.iloc[:0]
+
+    # Handle (display name only) and main GameType of each player, by PlayerId
+    career = load_data()
+    main_games = load_main_games()
+    handles = keys.take(career, keys.position_map(career["PlayerId"], player_ids), "CurrentHandle")
+    main_types = keys.take(main_games, keys.position_map(main_games.index, player_ids), "GameType")
+    game_types = {
+        player_id: game_type if pd.notna(game_type) else None
+        for player_id, game_type in zip(player_ids, main_types)
+    }
+    handles = {
+        player_id: handle if pd.notna(handle) else str(player_id)
+        for player_id, handle in zip(player_ids, handles)
+    }
+    return filtered, game_types, handles
+
+
+@memoize(version=data_version)
+def compute_game_annotations(player_ids):
+    """Mid-career point (date, cumulative prize, game) for each player."""
+    df = load_tournaments()
+    indices = tournament_player_indices()
+    game_rows = tournament_game_positions()
+    games = load_games_data()
+    points = []
+    for player_id in player_ids:
+        rows = indices.get(player_id)
+        if rows is None:
+            points.append(None)
+            continue
+
+        position = rows[min(int(len(rows) * 0.5), len(rows) - 1)]
+        row = df.iloc[position]
+        game_name = row.get("GameName", "Unknown Game")
+        game_type = games["GameType"].iat[game_rows[position]] if game_rows[position] >= 0 else None
+        game_type = game_type if pd.notna(game_type) else "Unknown Type"
+        points.append((row["EndDate"], row["CumulativePrize"], game_name, game_type))
+    return points
+
+
+# ===============================================================
+# 📊 Slide 8 – Earnings Over Time
+# ===============================================================
+@memoize(maxsize=1, version=data_version)
+def load_earnings_cube():
+    """
+    Dense player × year × game earnings cube (USD, float64).
+
+    Axes follow the career dataset (players), every calendar year of the
+    tournament history, and the games table. Any time-window question —
+    earnings per year, per era, rolling peaks — becomes a slice and a sum
+    over axes instead of a pass over tournament rows. The two marginals
+    used by the slider (player × year and year × game) are stored alongside.
+    """
+    tournaments = load_tournaments()
+    player_rows = tournament_player_positions()
+    game_rows = tournament_game_positions()
+    known = (player_rows >= 0) & (game_rows >= 0) & tournaments["EndDate"].notna().to_numpy()
+
+    years = tournaments["EndDate"].dt.year.to_numpy()[known].astype(np.int64)
+    first_year, last_year = years.min(), years.max()
+    shape = (len(load_data()), last_year - first_year + 1, len(load_games_data()))
+
+    # One bincount over flat cube indices sums every (player, year, game) cell
+    cells = np.ravel_multi_index((player_rows[known], years - first_year, game_rows[known]), shape)
+    prizes = tournaments["USDPrizePerPlayer"].to_numpy(dtype=float)[known]
+    values = np.bincount(cells, weights=prizes, minlength=np.prod(shape)).reshape(shape)
+
+    return {
+        "values": values,
+        "years": np.arange(first_year, last_year + 1),
+        "player_ids": load_data()["PlayerId"].to_numpy(),
+        "game_ids": load_games_data()["GameId"].to_numpy(),
+        "player_year": values.sum(axis=2),
+        "year_game": values.sum(axis=0),
+    }
+
+
+def year_window(cube, year_range):
+    """Slice of the cube's year axis covering ``year_range`` (inclusive)."""
+    first, last = year_range
+    years = cube["years"]
+    return slice(np.searchsorted(years, first), np.searchsorted(years, last, side="right"))
+
+
+# Length of the best run of consecutive years (shorter when the range is)
+PEAK_YEARS = 3
+
+
+def rolling_peak(player_year, width=PEAK_YEARS):
+    """Best ``width``-year earnings of each player (rows) over consecutive years (columns)."""
+    width = min(width, player_year.shape[1])
+    cumulative = np.concatenate([np.zeros((len(player_year), 1)), player_year.cumsum(axis=1)], axis=1)
+    return (cumulative[:, width:] - cumulative[:, :-width]).max(axis=1)
+
+
+@memoize(version=data_version)
+def earnings_year_bounds():
+    years = load_earnings_cube()["years"]
+    return int(years[0]), int(years[-1])
+
+
+@memoize(version=data_version)
+def compute_earnings_over_time(year_range):
+    """Yearly earnings by GameType, top earners and KPIs for a year range."""
+    cube = load_earnings_cube()
+    window = year_window(cube, year_range)
+    years = cube["years"][window]
+
+    # Year × game marginal, folded into GameType columns
+    game_types = load_games_data()["GameType"]
+    year_game = pd.DataFrame(cube["year_game"][window], index=pd.Index(years, name="Year"))
+    yearly = (
+        year_game.T.groupby(game_types.array, observed=True).sum().T
+        .stack().rename("Earnings").rename_axis(["Year", "GameType"]).reset_index()
+    )
+
+    # Player totals and best 3-year run inside the window
+    player_year = cube["player_year"][:, window]
+    career = load_data()
+    peak_years = min(PEAK_YEARS, len(years))
+    players = pd.DataFrame({
+        "PlayerId": career["PlayerId"],
+        "CurrentHandle": career["CurrentHandle"],
+        "GameType": career["GameType"],
+        "Earnings": player_year.sum(axis=1),
+        "PeakRun": rolling_peak(player_year, peak_years),
+    })
+    peak_player = players.loc[players["PeakRun"].idxmax()]
+
+    return {
+        "yearly": yearly,
+        "top_players": players.nlargest(10, "Earnings").sort_values("Earnings"),
+        "total": player_year.sum(),
+        "active_players": int((player_year.sum(axis=1) > 0).sum()),
+        "peak_years": peak_years,
+        # No earnings at all in the range: idxmax picked an arbitrary player
+        "peak_player": peak_player["CurrentHandle"] if peak_player["PeakRun"] > 0 else None,
+        "peak_value": peak_player["PeakRun"],
+    }
+
+
+@memoize(version=data_version)
+def compute_peak_run_kpi(year_range):
+    """(label, formatted value) of the best run of consecutive years in a year range."""
+    data = compute_earnings_over_time(year_range)
+    years = data["peak_years"]
+    label = "Best Year" if years == 1 else f"Best {years}-Year Run"
+    if data["peak_player"] is None:
+        return label, "–"
+    return label, f"{data['peak_player']} (${data['peak_value'] / 1_000_000:,.2f}M)"
@@ -0,0 +1,408 @@
+# ===============================================================
+# 🗂️ Static HTML export of the deck
+# ===============================================================
+"""
+The slides as one self-contained HTML file.
+
+``python deck.py [deck.html]`` runs every slide computation once per
+filter value the app offers (every Game Type, scope, metric, error-bar
+mode and year range) and writes a single HTML file holding the figure
+specs — the same JSON Streamlit sends —, the KPIs, the filters as plain
+``<select>`` menus and plotly.js. Viewing it needs no Python: open it or
+serve it from any static file server. Figures shared by several variants
+and the Plotly templates are stored once.
+
+``python deck.py check [deck.html]`` runs streamlit_app.py headlessly
+(``streamlit.testing``) with the widget values of every variant (a sample
+of the slide 8 year ranges) and reports the figures that differ from the
+deck.
+
+The deck holds the slide titles, KPIs and charts; the commentary, the
+intro and the conclusion stay in the app.
+"""
+import itertools
+import json
+import random
+import sys
+from pathlib import Path
+
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+
+import charts
+import compute
+
+BASE_DIR = Path(__file__).parent
+DECK_FILE = BASE_DIR.parent / "deck" / "index.html"
+
+# Slide 8 year ranges replayed by ``check`` (every other variant is replayed)
+CHECK_YEAR_RANGES = 8
+
+
+# ===============================================================
+# 📊 Slides — same calls and KPI formats as streamlit_app.py
+# ===============================================================
+def control(widget, label, options, labels=None):
+    """A filter of the deck; ``widget`` is the key of the matching app widget."""
+    options = list(options)
+    return {"widget": widget, "label": label, "options": options, "labels": labels or [str(o) for o in options]}
+
+
+def slide_1(selected_type, top15_only):
+    kpis = compute.compute_prize_kpis(selected_type, top15_only)
+    metrics = [
+        ("Total Prize", f"${kpis['total_prize']:,.0f}"),
+        ("Games", f"{kpis['games']}"),
+        ("Players", f"{kpis['players']:,}"),
+        ("Tournaments", f"{kpis['tournaments']:,}"),
+    ]
+    return metrics, [charts.prize_bar_figure(selected_type)]
+
+
+def slide_2(selection):
+    data = compute.compute_prize_distribution(selection)
+    return [("Total Earnings", f"${data['total_prize']:,.0f}")], [charts.prize_distribution_figure(selection)]
+
+
+def slide_3(metric):
+    metric_column = "PlayerCount" if metric == "Player Count" else "TotalPrize"
+    metrics = compute.compute_continent_cards(metric_column)
+    figures = [charts.country_map_figure(metric, metric_column), charts.top_countries_figure(metric, metric_column)]
+    return metrics, figures
+
+
+def slide_4(selected_type):
+    data = compute.compute_careers_structure(selected_type)
+    metrics = [
+        ("Median Career Length", f"{data['median_career_length']:.1f} years"),
+        ("Median Total Tournaments Played", f"{data['median_tournaments']:.1f}"),
+        ("Median Tournaments / Year", f"{data['median_tournaments_per_year']:.1f}"),
+    ]
+    return metrics, [charts.careers_scatter_figure(selected_type), charts.intensity_bar_figure()]
+
+
+def slide_5(error_bars):
+    data = compute.compute_yearly_earnings()
+    median_by_game = data["median_by_game"]
+    top, bottom = median_by_game.iloc[0], median_by_game.iloc[-1]
+    metrics = [
+        ("Global Median Yearly Earnings", f"${int(data['global_median']):,}"),
+        ("Top", f"{top['GameType']} (${int(top['AvgEarningsPerYear']):,})"),
+        ("Bottom", f"{bottom['GameType']} (${int(bottom['AvgEarningsPerYear']):,})"),
+    ]
+    return metrics, [charts.yearly_earnings_figure(error_bars)]
+
+
+def slide_6():
+    _, profile_pct = compute.compute_earnings_shape()
+    return [(profile, profile_pct[profile]) for profile in compute.PROFILE_LABELS], [charts.earnings_shape_figure()]
+
+
+def slide_7():
+    return [], [
+        charts.timeline_figure((56483, 70584), "Heavy Hitters"),
+        charts.timeline_figure((74084, 100425), "Fast Risers"),
+        charts.timeline_figure((1042, 3811), "Steady Climbers"),
+    ]
+
+
+def slide_8(first_year, last_year):
+    if first_year > last_year:
+        return None
+    year_range = (first_year, last_year)
+    data = compute.compute_earnings_over_time(year_range)
+    metrics = [
+        ("Total Earnings", f"${data['total'] / 1_000_000:,.1f}M"),
+        ("Players with Earnings", f"{data['active_players']:,}"),
+        compute.compute_peak_run_kpi(year_range),
+    ]
+    return metrics, [charts.earnings_over_time_figure(year_range), charts.window_top_players_figure(year_range)]
+
+
+def deck_slides():
+    """(tab, title, controls, render, figure widths in %) for every slide with charts."""
+    years = range(compute.earnings_year_bounds()[0], compute.earnings_year_bounds()[1] + 1)
+    return [
+        ("Top Games", "Which games capture the most prize money in esports?",
+         [control("slide_1_game_type", "🎮 Filter by Game Type", compute.game_type_options()),
+          control("slide_1_top15_kpis", "🔍 Show KPIs for Top 15 only", [False, True], ["No", "Yes"])],
+         slide_1, [100]),
+        ("Gains Distribution", "How is prize money distributed among players?",
+         [control("slide_2_scope", "🎯 Select player scope", ["Top 1000", "Top 5000"])],
+         slide_2, [100]),
+        ("Geographic distribution", "Where do top players come from and which regions lead the scene?",
+         [control("slide_3_metric", "Select the metric to display (from top 1000):", ["Player Count", "Total Prize (USD)"])],
+         slide_3, [57, 43]),
+        ("Careers Structure", "How long and intense are esports careers at the top level?",
+         [control("slide_4_game_type", "🎮 Filter by Game Type", compute.career_type_options())],
+         slide_4, [67, 33]),
+        ("Yearly Earnings", "Do some game types offer more stable income than others?",
+         [control("slide_5_error_bars", "📏 Error bars", charts.ERROR_BAR_BOUNDS)],
+         slide_5, [100]),
+        ("Earnings Shape", "Do top players build wealth steadily or through a few spikes?", [], slide_6, [100]),
+        ("Players Archetypes", "What pro esports careers really look like?", [], slide_7, [50, 50, 100]),
+        ("Earnings Over Time", "How have top-level earnings evolved over time?",
+         [control("slide_8_year_range", "📅 From", years), control("slide_8_year_range", "📅 To", years)],
+         slide_8, [67, 33]),
+    ]
+
+
+# ===============================================================
+# 📦 Export
+# ===============================================================
+def variant_key(indices):
+    """Key of a variant: the selected option index of every control ("0,3")."""
+    return ",".join(str(i) for i in indices)
+
+
+class _Figures:
+    """Figure specs stored once each, templates split out and stored once each."""
+
+    def __init__(self):
+        self.specs = []
+        self.templates = []
+        self._index = {}
+        self._template_index = {}
+
+    def add(self, fig):
+        if id(fig) not in self._index:
+            spec = json.loads(pio.to_json(fig, validate=False))
+            template = spec["layout"].pop("template", {})
+            key = json.dumps(template, sort_keys=True)
+            if key not in self._template_index:
+                self._template_index[key] = len(self.templates)
+                self.templates.append(template)
+            spec["template"] = self._template_index[key]
+            # Holding the figure keeps its id from being reused during the export
+            self._index[id(fig)] = (len(self.specs), fig)
+            self.specs.append(spec)
+        return self._index[id(fig)][0]
+
+
+def build_deck():
+    """The deck content: slides with their variants, figure specs and templates."""
+    figures = _Figures()
+    slides = []
+    for tab, title, controls, render, widths in deck_slides():
+        variants = {}
+        for indices in itertools.product(*(range(len(c["options"])) for c in controls)):
+            result = render(*(c["options"][i] for c, i in zip(controls, indices)))
+            if result is None:
+                continue
+            metrics, figs = result
+            variants[variant_key(indices)] = {
+                "metrics": [list(metric) for metric in metrics],
+                "figures": [figures.add(fig) for fig in figs],
+            }
+        slides.append({"tab": tab, "title": title, "controls": controls, "widths": widths, "variants": variants})
+    return {"slides": slides, "figures": figures.specs, "templates": figures.templates}
+
+
+def write_deck(output_file=DECK_FILE):
+    deck = build_deck()
+    data = json.dumps(deck, separators=(",", ":")).replace("</", "<\\/")
+    html = (DECK_TEMPLATE
+            .replace("{{plotly}}", get_plotlyjs())
+            .replace("{{deck}}", data))
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_text(html, encoding="utf-8")
+
+    n_variants = sum(len(slide["variants"]) for slide in deck["slides"])
+    print(f"✅ Deck saved to {output_file} ({len(html.encode()) / 1024 / 1024:.1f} MiB): "
+          f"{len(deck['slides'])} slides, {n_variants} variants, {len(deck['figures'])} figures "
+          f"({len(data.encode()) / 1024 / 1024:.1f} MiB of data)")
+    return deck
+
+
+def read_deck(deck_file=DECK_FILE):
+    html = Path(deck_file).read_text(encoding="utf-8")
+    start = html.index(DATA_OPEN) + len(DATA_OPEN)
+    return json.loads(html[start:html.index("</script>", start)].replace("<\\/", "</"))
+
+
+# ===============================================================
+# 🔍 Check against the app
+# ===============================================================
+def _widget_state(controls, indices):
+    """{widget key: value}; controls sharing a widget (year range) give a tuple."""
+    state = {}
+    for c, i in zip(controls, indices):
+        state.setdefault(c["widget"], []).append(c["options"][i])
+    return {key: values[0] if len(values) == 1 else tuple(values) for key, values in state.items()}
+
+
+def _without_template(spec):
+    """Data and layout of a figure spec, without its template."""
+    layout = {key: value for key, value in spec["layout"].items() if key != "template"}
+    return {"data": spec["data"], "layout": layout}
+
+
+def _app_figures(at, tab):
+    """Figure specs drawn in one tab of the app, in display order."""
+    found = []
+
+    def walk(node):
+        children = getattr(node, "children", None)
+        for child in (children.values() if isinstance(children, dict) else []):
+            if child.type == "plotly_chart":
+                found.append(json.loads(child.proto.spec))
+            walk(child)
+
+    walk(next(t for t in at.tabs if t.label == tab))
+    return found
+
+
+def check_deck(deck_file=DECK_FILE, year_ranges=CHECK_YEAR_RANGES, seed=0):
+    """Replay deck variants in the app; return the (tab, variant) pairs whose figures differ."""
+    from streamlit.testing.v1 import AppTest
+
+    deck = read_deck(deck_file)
+    at = AppTest.from_file(str(BASE_DIR / "streamlit_app.py"), default_timeout=300).run()
+    if at.exception:
+        raise RuntimeError(f"App failed: {at.exception[0].message}")
+
+    mismatches, checked = [], 0
+    for slide in deck["slides"]:
+        keys = list(slide["variants"])
+        if slide["tab"] == "Earnings Over Time":
+            keys = [keys[0], keys[-1]] + random.Random(seed).sample(keys[1:-1], year_ranges - 2)
+        for key in keys:
+            indices = [int(i) for i in key.split(",")] if key else []
+            for widget, value in _widget_state(slide["controls"], indices).items():
+                at.session_state[widget] = value
+            at.run()
+            expected = [_without_template(deck["figures"][index]) for index in slide["variants"][key]["figures"]]
+            checked += 1
+            if [_without_template(spec) for spec in _app_figures(at, slide["tab"])] != expected:
+                mismatches.append((slide["tab"], key))
+                print(f"❌ {slide['tab']} [{key}]: figures differ from the app")
+
+    if not mismatches:
+        print(f"✅ {checked} variants match the app")
+    return mismatches
+
+
+# ===============================================================
+# 🖼️ HTML
+# ===============================================================
+DATA_OPEN = '<script id="deck-data" type="application/json">'
+
+DECK_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Behind the Screens: What Top Esports Careers Really Look Like?</title>
+<style>
+body { font-family: "Source Sans Pro", Arial, sans-serif; margin: 0 2.5%; color: #222; background: #fff; }
+h1 { font-size: 2.5rem; text-align: center; color: #0077b6; }
+h2 { color: #0077b6; }
+nav { display: flex; flex-wrap: wrap; gap: 0.25rem; border-bottom: 1px solid #ddd; }
+nav button { font-size: 1.1rem; padding: 0.6rem 1rem; border: none; background: none; cursor: pointer; }
+nav button.active { color: #0077b6; border-bottom: 3px solid #0077b6; }
+.controls { display: flex; flex-wrap: wrap; gap: 2rem; margin: 1rem 0; font-size: 1.1rem; }
+.controls select { font-size: 1rem; margin-left: 0.5rem; }
+.metrics { display: flex; flex-wrap: wrap; gap: 2rem; margin: 1rem 0; }
+.metric .label { font-size: 1rem; color: #555; }
+.metric .value { font-size: 2rem; font-weight: 600; }
+.figures { display: flex; flex-wrap: wrap; }
+.slide { display: none; }
+.slide.active { display: block; }
+</style>
+<script>{{plotly}}</script>
+</head>
+<body>
+<h1>Behind the Screens:<br>What Top Esports Careers Really Look Like?</h1>
+<nav id="tabs"></nav>
+<main id="slides"></main>
+""" + DATA_OPEN + """{{deck}}</script>
+<script>
+const deck = JSON.parse(document.getElementById("deck-data").textContent);
+
+function el(tag, className, text) {
+  const node = document.createElement(tag);
+  if (className) node.className = className;
+  if (text !== undefined) node.textContent = text;
+  return node;
+}
+
+function figure(index) {
+  const spec = deck.figures[index];
+  const layout = Object.assign({}, spec.layout, {template: deck.templates[spec.template]});
+  return {data: spec.data, layout: layout};
+}
+
+function render(slide, section) {
+  const selects = Array.from(section.querySelectorAll("select"));
+  let indices = selects.map(s => s.selectedIndex);
+  let variant = slide.variants[indices.join(",")];
+  if (!variant && slide.tab === "Earnings Over Time") {
+    // "To" before "From": move "To" up to "From"
+    selects[1].selectedIndex = selects[0].selectedIndex;
+    variant = slide.variants[selects.map(s => s.selectedIndex).join(",")];
+  }
+  const metrics = section.querySelector(".metrics");
+  metrics.replaceChildren(...variant.metrics.map(([label, value]) => {
+    const metric = el("div", "metric");
+    metric.append(el("div", "label", label), el("div", "value", value));
+    return metric;
+  }));
+  section.querySelectorAll(".figure").forEach((div, i) => {
+    const fig = figure(variant.figures[i]);
+    Plotly.react(div, fig.data, fig.layout, {responsive: true});
+  });
+}
+
+deck.slides.forEach((slide, s) => {
+  const section = el("section", "slide");
+  section.append(el("h2", null, slide.title));
+  const controls = el("div", "controls");
+  slide.controls.forEach((control, c) => {
+    const label = el("label", null, control.label);
+    const select = el("select");
+    control.labels.forEach(label => select.append(el("option", null, label)));
+    if (slide.tab === "Earnings Over Time" && c === 1) select.selectedIndex = control.options.length - 1;
+    select.addEventListener("change", () => render(slide, section));
+    label.append(select);
+    controls.append(label);
+  });
+  section.append(controls, el("div", "metrics"));
+  const figures = el("div", "figures");
+  slide.widths.forEach(width => {
+    const div = el("div", "figure");
+    div.style.width = width + "%";
+    figures.append(div);
+  });
+  section.append(figures);
+  document.getElementById("slides").append(section);
+
+  const button = el("button", null, slide.tab);
+  button.addEventListener("click", () => show(s));
+  document.getElementById("tabs").append(button);
+});
+
+const rendered = new Set();
+function show(s) {
+  document.querySelectorAll(".slide").forEach((section, i) => section.classList.toggle("active", i === s));
+  document.querySelectorAll("nav button").forEach((button, i) => button.classList.toggle("active", i === s));
+  // Plot on first display: hidden divs have no size
+  if (!rendered.has(s)) {
+    rendered.add(s);
+    render(deck.slides[s], document.querySelectorAll(".slide")[s]);
+  }
+}
+show(0);
+</script>
+</body>
+</html>
+"""
+
+
+if __name__ == "__main__":
+    # python deck.py [deck.html]          export
+    # python deck.py check [deck.html]    compare with the app
+    args = sys.argv[1:]
+    if args[:1] == ["check"]:
+        sys.exit(1 if check_deck(*args[1:2]) else 0)
+    write_deck(*args[:1])
@@ -0,0 +1,29 @@
+# ===============================================================
+# 🔑 Integer surrogate keys and precomputed joins
+# ===============================================================
+"""
+Join helpers built on the integer PlayerId / GameId keys.
+
+Handles are display names, not keys: several players share one (10 in
+the career dataset, 139 in the top 5000). Every join therefore goes
+through PlayerId or GameId. A join is a position map, an array giving
+each fact row's row number in the dimension table (-1 when the key is
+missing). It is computed once; after that, bringing any dimension column
+onto the facts is an array take, with no hashing or string comparison.
+"""
+import pandas as pd
+
+
+def position_map(dimension_keys, fact_keys):
+    """Row position in the dimension of every fact key (-1 when missing)."""
+    index = pd.Index(dimension_keys)
+    if not index.is_unique:
+        raise ValueError(f"{index.name or 'key'} is not unique in the dimension table")
+    return index.get_indexer(fact_keys)
+
+
+def take(dimension, positions, column):
+    """``dimension[column]`` aligned on ``positions`` (missing where -1)."""
+    values = dimension[column].array
+    return pd.api.extensions.take(values, positions, allow_fill=True)
+
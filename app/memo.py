@@ -0,0 +1,100 @@
+# ===============================================================
+# 🧠 Memoization layer shared by compute.py and charts.py
+# ===============================================================
+"""
+Process-wide memoization for the dashboard computations.
+
+Streamlit re-executes the whole script on every widget interaction, but
+imported modules stay loaded. Results cached here therefore survive
+reruns and are shared by every session: the same widget state always hits
+the same cache entry.
+
+Cached values (frames, arrays, figures) are shared objects — callers must
+treat them as read-only.
+"""
+import functools
+import threading
+from collections import Counter
+
+from cachetools import LRUCache
+
+# Every memoized function, by qualified name (used to clear or inspect caches)
+_registry = {}
+
+
+def _make_key(args, kwargs):
+    """Build a hashable cache key from call arguments (lists become tuples)."""
+    def freeze(value):
+        if isinstance(value, (list, tuple)):
+            return tuple(freeze(v) for v in value)
+        if isinstance(value, dict):
+            return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+        return value
+
+    return freeze(args), freeze(kwargs)
+
+
+def memoize(maxsize=32, version=None):
+    """
+    Decorator caching a pure function's results keyed on its inputs.
+
+    ``version`` is an optional callable returning a token (e.g. a dataset
+    file's mtime and size) that is added to the key, so entries computed
+    from an older version of the data are never served again.
+    """
+    def decorator(func):
+        # hits / misses / evictions, read by telemetry.py
+        stats = Counter()
+        cache = LRUCache(maxsize=maxsize)
+        lock = threading.RLock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            if version is not None:
+                key = (version(),) + key
+            with lock:
+                try:
+                    value = cache[key]
+                    stats["hits"] += 1
+                    return value
+                except KeyError:
+                    stats["misses"] += 1
+            value = func(*args, **kwargs)
+            with lock:
+                size = len(cache) + (key not in cache)
+                cache[key] = value
+                stats["evictions"] += size - len(cache)
+            return value
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        def cache_items():
+            """Copy of the ``(key, value)`` entries, for warmstart.py and memory.py."""
+            with lock:
+                return list(cache.items())
+
+        def cache_fill(items):
+            """Insert ``(key, value)`` entries computed earlier (e.g. loaded from disk)."""
+            with lock:
+                for key, value in items:
+                    cache[key] = value
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_items = cache_items
+        wrapper.cache_fill = cache_fill
+        wrapper.version = version
+        wrapper.stats = stats
+        _registry[f"{func.__module__}.{func.__qualname__}"] = wrapper
+        return wrapper
+
+    return decorator
+
+
+def clear_all():
+    """Empty every memoized function's cache."""
+    for wrapper in _registry.values():
+        wrapper.cache_clear()
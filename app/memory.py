@@ -0,0 +1,215 @@
+# ===============================================================
+# 🧠 Memory profiling (debug mode)
+# ===============================================================
+"""
+Where the dashboard's memory goes, for debugging.
+
+Enabled with ``MEMORY_DEBUG=1``:
+
+- every memoized result (loaded datasets, derived frames, figures, and
+  stats' bootstrap intervals) is
+  measured deeply: frames with ``memory_usage(deep=True)``, arrays with
+  their buffer, figures through their JSON-ready dict, containers
+  recursively;
+- the session state of every connected session is measured the same way;
+- tracemalloc runs from startup. Traced bytes are recorded after every
+  full script run, and while the panel is open each run takes a snapshot
+  diffed with the previous one and with the first one. Allocation sites
+  that keep growing across reruns are leaks.
+
+The panel is hidden: it appears at the bottom of the app with
+``?admin=memory`` while debug mode is on. tracemalloc slows every
+allocation, and a snapshot of the loaded datasets takes seconds, so leave
+debug mode off in production.
+
+Snapshots are process-wide. With several sessions open, a diff mixes
+their reruns.
+"""
+import os
+import sys
+import tracemalloc
+from collections import deque
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+import memo
+import stats
+
+ENABLED = os.environ.get("MEMORY_DEBUG") == "1"
+
+# Allocation sites shown (grouped by the line that allocated)
+TOP_SITES = 15
+
+# Traced bytes gained per full run, last runs
+HISTORY = 20
+
+if ENABLED and not tracemalloc.is_tracing():
+    # One frame per allocation: deeper tracebacks make cold runs several times slower
+    tracemalloc.start()
+
+_last_traced = None
+diffs = deque(maxlen=HISTORY)
+_first_snapshot = None
+_last_snapshot = None
+
+
+# ===============================================================
+# 📏 Deep sizes
+# ===============================================================
+def deep_size(value, seen=None):
+    """
+    Bytes held by ``value`` and everything it references, each object once
+    per ``seen``.
+
+    ``seen`` maps id to object: it keeps the measured objects alive, so the
+    id of a temporary (a figure's dict, a list of results) is not reused by
+    another object while the same ``seen`` is in use.
+    """
+    seen = {} if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen[id(value)] = value
+
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+    if isinstance(value, pd.Index):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        # A view's buffer belongs to its base; an owning array's size includes it
+        if value.base is not None:
+            return sys.getsizeof(value) + deep_size(value.base, seen)
+        size = sys.getsizeof(value)
+        if value.dtype == object:
+            size += sum(deep_size(v, seen) for v in value.flat)
+        return size
+    if isinstance(value, go.Figure):
+        return deep_size(value.to_dict(), seen)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(deep_size(k, seen) + deep_size(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset, deque)):
+        return sys.getsizeof(value) + sum(deep_size(v, seen) for v in value)
+    return sys.getsizeof(value)
+
+
+def _cached_results():
+    """(name, results) of every memoized function, and of stats' bootstrap cache."""
+    for name, wrapper in memo._registry.items():
+        # Copied under the wrapper's lock: another session may be filling it
+        yield name, [value for _, value in wrapper.cache_items()]
+    # Keyed by dataset hash, outside memo
+    with stats._cache_lock:
+        bootstrap_results = list(stats._cache.values())
+    yield "stats.bootstrap_median_ci", bootstrap_results
+
+
+def cache_report():
+    """One row per memoized function: entries and deep bytes of its results."""
+    rows = []
+    seen_total = {}
+    for name, results in _cached_results():
+        if not results:
+            continue
+        rows.append({
+            "Function": name,
+            "Entries": len(results),
+            "MiB": deep_size(results) / 2**20,
+            # Counted once across every cache (results share frames)
+            "Unique MiB": deep_size(results, seen_total) / 2**20,
+        })
+    return pd.DataFrame(rows, columns=["Function", "Entries", "MiB", "Unique MiB"]).sort_values("MiB", ascending=False)
+
+
+def session_report():
+    """One row per connected session: widget values and other session state."""
+    from streamlit import runtime
+
+    # AppTest's runtime has no session manager
+    session_mgr = getattr(runtime.get_instance(), "_session_mgr", None) if runtime.exists() else None
+    if session_mgr is None:
+        return pd.DataFrame(columns=["Session", "Keys", "KiB"])
+    rows = []
+    for info in session_mgr.list_active_sessions():
+        state = info.session.session_state.filtered_state
+        rows.append({"Session": info.session.id[:8], "Keys": len(state), "KiB": deep_size(state) / 1024})
+    return pd.DataFrame(rows, columns=["Session", "Keys", "KiB"])
+
+
+# ===============================================================
+# 🔍 tracemalloc diffs
+# ===============================================================
+def after_run():
+    """Record the traced bytes gained by the full script run that just ended."""
+    global _last_traced
+    if not ENABLED:
+        return
+    current, _ = tracemalloc.get_traced_memory()
+    if _last_traced is not None:
+        diffs.append(current - _last_traced)
+    _last_traced = current
+
+
+def take_snapshot():
+    """Snapshot without tracemalloc's own allocations; the first one is the baseline."""
+    global _first_snapshot, _last_snapshot
+    snapshot = tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ])
+    previous = _last_snapshot
+    if _first_snapshot is None:
+        _first_snapshot = snapshot
+    _last_snapshot = snapshot
+    return previous
+
+
+def growth_report(since):
+    """Allocation sites grown from ``since`` to the last snapshot, largest growth first."""
+    if since is None or since is _last_snapshot:
+        return pd.DataFrame(columns=["Site", "Growth KiB", "Blocks"])
+    stats = _last_snapshot.compare_to(since, "lineno")[:TOP_SITES]
+    return pd.DataFrame([
+        {"Site": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+         "Growth KiB": stat.size_diff / 1024,
+         "Blocks": stat.count_diff}
+        for stat in stats if stat.size_diff > 0
+    ], columns=["Site", "Growth KiB", "Blocks"])
+
+
+# ===============================================================
+# 🛠️ Admin panel
+# ===============================================================
+def admin_panel():
+    """Memory tables, drawn when debug mode is on and the URL has ?admin=memory."""
+    import streamlit as st
+
+    if not ENABLED or st.query_params.get("admin") != "memory":
+        return
+    with st.expander("🛠️ Memory (admin)", expanded=True):
+        previous = take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Traced now", f"{current / 2**20:,.1f} MiB")
+        col2.metric("Traced peak", f"{peak / 2**20:,.1f} MiB")
+        col3.metric("Growth over the last run", f"{diffs[-1] / 1024:,.0f} KiB" if diffs else "–")
+
+        st.markdown("**Memoized results** (datasets, derived frames, figures)")
+        caches = cache_report()
+        st.dataframe(caches, hide_index=True, use_container_width=True)
+        st.caption(f"Unique total: {caches['Unique MiB'].sum():,.1f} MiB")
+
+        st.markdown("**Sessions**")
+        st.dataframe(session_report(), hide_index=True, use_container_width=True)
+
+        st.markdown("**Growth since the previous snapshot** (tracemalloc, by line)")
+        st.dataframe(growth_report(previous), hide_index=True, use_container_width=True)
+
+        st.markdown("**Growth since the first snapshot**")
+        st.dataframe(growth_report(_first_snapshot), hide_index=True, use_container_width=True)
+
+        st.markdown("**Growth per run**")
+        st.dataframe(pd.DataFrame(
+            {"Run": range(-len(diffs), 0), "Growth KiB": [growth / 1024 for growth in diffs]}
+        ), hide_index=True, use_container_width=True)
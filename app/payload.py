@@ -0,0 +1,93 @@
+# ===============================================================
+# 📦 Figure payload sizes and budget
+# ===============================================================
+"""
+Bytes of figure JSON sent to the browser, per slide.
+
+``plotly_chart(fig, slide, chart)`` replaces ``st.plotly_chart``: it draws
+the figure and records the size of its JSON spec (the same
+``plotly.io.to_json`` call Streamlit makes) under the slide and chart
+names. When the figures of one slide add up to more than the budget, a
+warning is logged. The budget is in KiB, set with the ``FIGURE_BUDGET_KB``
+environment variable (default 256).
+
+``python payload.py`` prints the payload of every figure in its default
+state.
+"""
+import logging
+import os
+import weakref
+
+import plotly.io as pio
+import streamlit as st
+
+import telemetry
+
+BUDGET_BYTES = int(float(os.environ.get("FIGURE_BUDGET_KB", 256)) * 1024)
+
+logger = logging.getLogger(__name__)
+
+# Last payload drawn in each chart slot (any session), {slide: {chart: bytes}}
+payloads = {}
+
+# Figures are memoized, so a figure's size is measured once per object
+_sizes = {}
+
+
+def figure_bytes(fig):
+    """Size in bytes of the JSON spec Streamlit sends for ``fig``."""
+    cached = _sizes.get(id(fig))
+    if cached is not None and cached[0]() is fig:
+        return cached[1]
+    size = len(pio.to_json(fig, validate=False))
+    _sizes[id(fig)] = (weakref.ref(fig, lambda _, key=id(fig): _sizes.pop(key, None)), size)
+    return size
+
+
+def figure_name(fig):
+    return fig.layout.title.text or f"figure {id(fig)}"
+
+
+def record(slide, chart, fig):
+    """Store the payload of ``fig`` in its slot; warn when the slide is over budget."""
+    slide_payloads = payloads.setdefault(slide, {})
+    slide_payloads[chart] = figure_bytes(fig)
+    telemetry.figure_bytes_sent.inc(slide_payloads[chart], slide=slide)
+    total = sum(slide_payloads.values())
+    if total > BUDGET_BYTES:
+        logger.warning(
+            "%s: %.0f KiB of figure JSON (budget %.0f KiB): %s",
+            slide, total / 1024, BUDGET_BYTES / 1024,
+            ", ".join(f"{name} {size / 1024:.0f} KiB" for name, size in slide_payloads.items()),
+        )
+    return total
+
+
+def plotly_chart(fig, slide, chart, **kwargs):
+    """``st.plotly_chart`` with payload bookkeeping."""
+    record(slide, chart, fig)
+    return st.plotly_chart(fig, **kwargs)
+
+
+if __name__ == "__main__":
+    import charts
+    import compute
+
+    first_year, last_year = compute.earnings_year_bounds()
+    default_figures = {
+        "slide 1": [charts.prize_bar_figure("All")],
+        "slide 2": [charts.prize_distribution_figure("Top 1000"), charts.prize_distribution_figure("Top 5000")],
+        "slide 3": [charts.country_map_figure("Player Count", "PlayerCount"),
+                    charts.top_countries_figure("Player Count", "PlayerCount")],
+        "slide 4": [charts.careers_scatter_figure("All"), charts.intensity_bar_figure()],
+        "slide 5": [charts.yearly_earnings_figure()],
+        "slide 6": [charts.earnings_shape_figure()],
+        "slide 7": [charts.timeline_figure((56483, 70584), "Heavy Hitters"),
+                    charts.timeline_figure((74084, 100425), "Fast Risers"),
+                    charts.timeline_figure((1042, 3811), "Steady Climbers")],
+        "slide 8": [charts.earnings_over_time_figure((first_year, last_year)),
+                    charts.window_top_players_figure((first_year, last_year))],
+    }
+    for slide, figures in default_figures.items():
+        for fig in figures:
+            print(f"{slide:8s} {figure_bytes(fig) / 1024:8.1f} KiB  {figure_name(fig)}")
@@ -0,0 +1,106 @@
+# ===============================================================
+# 🗂️ Shared categorical schema for the dashboard datasets
+# ===============================================================
+"""
+Loading helpers that store repeated string columns as pandas categoricals.
+
+Every categorical column uses one global category dictionary, built from
+all datasets in the app folder. The same string therefore has the same
+integer code in every frame, so filters, groupbys and joins on these
+columns compare codes instead of Python strings.
+
+Values are normalized once when the dictionary is built: whitespace is
+stripped, and country codes are upper-cased.
+"""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import telemetry
+from memo import memoize
+
+BASE_DIR = Path(__file__).parent
+
+CATEGORY_COLUMNS = ("GameType", "GameName", "CountryCode", "CareerStatus", "CurrentHandle")
+
+# Every dataset that contributes values to the shared dictionary
+DATASETS = (
+    "games_metadata_enriched.csv",
+    "leaderboard.csv",
+    "players_profiles_with_id.csv",
+    "scatter_df_export.csv",
+    "tournaments_corrected_with_handles_and_games.csv",
+)
+
+
+def dataset_version(filename):
+    """Cheap version token of a data file: changes whenever the file is rewritten."""
+    stat = (BASE_DIR / filename).stat()
+    return filename, stat.st_mtime_ns, stat.st_size
+
+
+def datasets_version():
+    return tuple(dataset_version(name) for name in DATASETS if (BASE_DIR / name).exists())
+
+
+def normalize(column, values):
+    """Canonical form of category labels (an Index of strings)."""
+    values = values.astype(str).str.strip()
+    if column == "CountryCode":
+        values = values.str.upper()
+    return values
+
+
+@memoize(maxsize=1, version=datasets_version)
+def category_dtypes():
+    """
+    One CategoricalDtype per column, covering the values of every dataset.
+
+    Keyed on ``datasets_version`` like every memoized loader and computation
+    (``compute.data_version``): after a rewrite, all frames are read again
+    with the new dictionary, and none keeps the old one.
+    """
+    labels = {column: set() for column in CATEGORY_COLUMNS}
+    for name in DATASETS:
+        path = BASE_DIR / name
+        if not path.exists():
+            continue
+        header = pd.read_csv(path, nrows=0).columns
+        columns = [column for column in CATEGORY_COLUMNS if column in header]
+        if not columns:
+            continue
+        df = pd.read_csv(path, usecols=columns, dtype="category")
+        for column in columns:
+            labels[column].update(normalize(column, df[column].cat.categories))
+    return {column: pd.CategoricalDtype(sorted(values)) for column, values in labels.items()}
+
+
+def to_shared(series, column):
+    """Re-code a series onto the shared dictionary of ``column``."""
+    dtype = category_dtypes()[column]
+    local = series.astype("category")
+    local_to_shared = dtype.categories.get_indexer(normalize(column, local.cat.categories))
+    codes = local.cat.codes.to_numpy()
+    shared_codes = np.where(codes >= 0, local_to_shared[codes], -1)
+    return pd.Series(
+        pd.Categorical.from_codes(shared_codes, dtype=dtype),
+        index=series.index,
+        name=series.name,
+    )
+
+
+def apply_schema(df):
+    """Convert every known categorical column of ``df`` in place."""
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns:
+            df[column] = to_shared(df[column], column)
+    return df
+
+
+def read_csv(filename, **kwargs):
+    """pd.read_csv from the app folder with the shared categorical dtypes applied."""
+    dtype = {column: "category" for column in CATEGORY_COLUMNS}
+    dtype.update(kwargs.pop("dtype", {}))
+    with telemetry.dataset_load_seconds.time(dataset=filename):
+        return apply_schema(pd.read_csv(BASE_DIR / filename, dtype=dtype, **kwargs))
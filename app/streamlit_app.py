@@ -1,16 +1,29 @@
 # ===============================================================
 # 🧠 Imports & Config
 # ===============================================================
-import pandas as pd
-import numpy as np
-import plotly.express as px
+import time
+
 import streamlit as st
-import plotly.graph_objects as go
-import pycountry
-import pycountry_convert as pc
 from pathlib import Path
+
+import assets
+import charts
+import compute
+import memory
+import payload
+import telemetry
+import warmstart
 BASE_DIR = Path(__file__).parent
 
+# Prometheus metrics of this process on http://127.0.0.1:9464/metrics (see telemetry.py)
+telemetry.start_server()
+# Caches of the previous process, when code and data are unchanged (see warmstart.py)
+warmstart.load()
+run_started = time.perf_counter()
+
+# Opt-in (?filters=client): GameType filters of slides 1 and 4 run in the browser
+CLIENT_FILTERS = st.query_params.get("filters") == "client"
+
 
 
 
@@ -99,148 +112,39 @@ section.main {
 """, unsafe_allow_html=True)
 
 
-# ===============================================================
-# 📦 Load Data
-# ===============================================================
-def load_games_data():
-    df = pd.read_csv(BASE_DIR / "games_metadata_enriched.csv")
-    df['TotalUSDPrize'] = df['TotalUSDPrize'].fillna(0)
-    df['TotalPlayers'] = df['TotalPlayers'].fillna(0)
-    df['TotalTournaments'] = df['TotalTournaments'].fillna(0)
-    return df
-
-games_df = load_games_data()
-
 # ===============================================================
 # 📊 Slide 1 – Prize Pool Bar Chart (Top 15)
 # ===============================================================
 
+@st.fragment
+@telemetry.timed_tab("Top Games")
 def slide_1_prize_bar():
     st.markdown("<h2 style='color:#0077b6;'>Which games capture the most prize money in esports?</h2>", unsafe_allow_html=True)
 
 
 
-    # Dropdown filter
-    game_types = ["All"] + sorted(games_df['GameType'].dropna().unique())
-    selected_type = st.selectbox("🎮 Filter by Game Type", game_types)
-
-    
-
-    # Filtered dataset
-    if selected_type == "All":
-        filtered_df = games_df.copy()
+    # Dropdown filter (in the chart itself in client-filter mode)
+    fig_bar = charts.prize_bar_client_figure() if CLIENT_FILTERS else None
+    if fig_bar is None:
+        selected_type = st.selectbox("🎮 Filter by Game Type", compute.game_type_options(), key="slide_1_game_type")
+        fig_bar = charts.prize_bar_figure(selected_type)
+        kpi_scope = ""
     else:
-        filtered_df = games_df[games_df["GameType"] == selected_type].copy()
-
-    # Slice top 15 by prize
-    top15_df = filtered_df.sort_values(by='TotalUSDPrize', ascending=False).head(15).copy()
-    top15_df["PrizeMillions"] = top15_df["TotalUSDPrize"] / 1_000_000
-    top15_df["PrizeText"] = top15_df["PrizeMillions"].apply(lambda x: f"${x:.0f}M")
+        # The chart menu filters in the browser only: KPIs stay on every game type
+        selected_type = "All"
+        kpi_scope = " (All game types)"
+        st.caption("🎮 Game Type filter: use the menu on the chart (KPIs cover all game types)")
 
     # KPI scope
     st.markdown("""""", unsafe_allow_html=True)
     col7, col8 = st.columns([0.05, 9.95])
     with col7:
-        show_top15_kpis = st.checkbox("", value=False)
+        show_top15_kpis = st.checkbox("", value=False, key="slide_1_top15_kpis")
     with col8:
         st.markdown(" <span style='font-size:20px;'>🔍 Show KPIs for Top 15 only</span>", unsafe_allow_html=True)
 
-    kpi_df = top15_df if show_top15_kpis else filtered_df
-
-
-    # Color palette
-    custom_colors = {
-        'MOBA': '#5f78ff',
-        'Battle Royale': '#ff6361',
-        'FPS': '#43d9a5',
-        'Sports': '#b266ff',
-        'RTS': '#ffa600',
-        'Card Game': '#00c2ff',
-        'Auto Battler': '#ffc658',
-        'Fighting': '#e377c2',      # couleur cohérente avec Plotly pastel
-        'Strategy': '#bcbd22',      # jaune olive doux
-        'Racing': '#17becf'         # bleu clair
-    }
-
-    # Create bar chart
-    fig_bar = px.bar(
-        top15_df,
-        x="PrizeMillions",
-        y="GameName",
-        color="GameType",
-        color_discrete_map=custom_colors,
-        orientation="h",
-        text="PrizeText",
-        title="Top 15 Esports Games by Total Prize Pool",
-        labels={"PrizeMillions": "Prize Pool (Million USD)", "GameName": "Game"}
-    )
+    kpis = compute.compute_prize_kpis(selected_type, show_top15_kpis)
 
-    # Build mapping BEFORE looping over traces
-    customdata_map = {
-        row["GameName"]: [row["GameType"], row["TotalPlayers"], row["TotalTournaments"]]
-        for _, row in top15_df.iterrows()
-    }
-
-    # Inject correct customdata per trace
-    for trace in fig_bar.data:
-        trace_customdata = [customdata_map[game] for game in trace.y]
-        trace.update(
-            customdata=trace_customdata,
-            hovertemplate=(
-                "<b>Game Type:</b> %{customdata[0]}<br>" +
-                "<b>Game:</b> %{y}<br>" +
-                "<b>Prize Pool:</b> $%{x:.1f}M<br>" +
-                "<b>Total Players:</b> %{customdata[1]}<br>" +
-                "<b>Total Tournaments:</b> %{customdata[2]}<extra></extra>"
-            )
-        )
-
-    fig_bar.update_layout(
-        xaxis_title="Total Prize Pool (in Millions USD)",
-        yaxis_title="",
-        yaxis=dict(
-            autorange="reversed",
-            color="white",
-            tickfont=dict(color="white", size=24)
-        ),
-        xaxis=dict(
-            color="white",
-            tickfont=dict(color="white", size=24),
-            showgrid=True,  # ✅ Active les lignes verticales
-            gridcolor='rgba(255, 255, 255, 0.1)',  # ✅ Couleur blanche très transparente
-            gridwidth=1
-        ),
-        plot_bgcolor='#0d1b2a',
-        paper_bgcolor='#0d1b2a',
-        font=dict(color='white', size=18),
-        height=700,
-        title=dict(x=0.3, font=dict(color="white", size=26)),
-        showlegend=True,
-        legend=dict(
-            title="Game Type",
-            title_font=dict(size=1.4 * 16, color='white'),
-            font=dict(size=1.3 * 16, color='white')
-        )
-)
-
-    fig_bar.update_layout(
-        title=dict(
-            text=f"Top 15 Esports Games by Total Prize Pool",
-            font=dict(size=32, color="white"),
-            x=0.5,
-            y=0.97,  # 👈 contrôle vertical
-            xanchor='center',
-            yanchor='top'
-        ),
-        xaxis=dict(title_font=dict(color="white", size=26), tickfont=dict(color="white", size=24)),
-        yaxis=dict(title_font=dict(size=22), tickfont=dict(color="white", size=20))
-    )
-    fig_bar.update_traces(
-        textfont=dict(
-            family="Arial Bold",  # ou "Helvetica Bold", etc.
-            size=20
-        )
-    )
     # Add a dummy column to shift content to the right
     buffer, col1, col2, col3, col4 = st.columns([0.5, 1.3, 0.7, 1, 1])
 
@@ -249,10 +153,10 @@ def slide_1_prize_bar():
         st.empty() 
 
     # KPIs
-    col1.metric("Total Prize", f"${kpi_df['TotalUSDPrize'].sum():,.0f}")
-    col2.metric("Games", len(kpi_df))
-    col3.metric("Players", f"{int(kpi_df['TotalPlayers'].sum()):,}")
-    col4.metric("Tournaments", f"{int(kpi_df['TotalTournaments'].sum()):,}")
+    col1.metric(f"Total Prize{kpi_scope}", f"${kpis['total_prize']:,.0f}")
+    col2.metric(f"Games{kpi_scope}", kpis["games"])
+    col3.metric(f"Players{kpi_scope}", f"{kpis['players']:,}")
+    col4.metric(f"Tournaments{kpi_scope}", f"{kpis['tournaments']:,}")
 
 
     # Slide layout (text left, chart right)
@@ -273,7 +177,7 @@ Despite the variety of games played competitively, **only a handful concentrate
         """)
 
     with col2:
-        st.plotly_chart(fig_bar, use_container_width=True)
+        payload.plotly_chart(fig_bar, "slide 1", "bar", use_container_width=True)
 
 
 
@@ -282,6 +186,8 @@ Despite the variety of games played competitively, **only a handful concentrate
 # 📊 Slide 2 – Prize distribution top 5k-1k
 # ===============================================================
 
+@st.fragment
+@telemetry.timed_tab("Gains Distribution")
 def slide_2_prize_distribution():
     """
     Slide 2 – Displays the prize distribution among the top 1000 or 5000 esports players.
@@ -289,132 +195,22 @@ def slide_2_prize_distribution():
     """
     st.markdown("<h2 style='color:#0077b6;'>How is prize money distributed among players?</h2>", unsafe_allow_html=True)
 
-    # Load data
-    df_5000 = pd.read_csv(BASE_DIR / "top_5000_players.csv")
-    df_5000_sorted = df_5000.sort_values(by="TotalUSDPrize", ascending=False).reset_index(drop=True)
-    df_5000_sorted["Rank"] = df_5000_sorted.index + 1
-
     # Toggle for subset
-    selection = st.radio("🎯 Select player scope", ["Top 1000", "Top 5000"], horizontal=True)
+    selection = st.radio("🎯 Select player scope", ["Top 1000", "Top 5000"], horizontal=True, key="slide_2_scope")
 
-    if selection == "Top 1000":
-        df_display = df_5000_sorted.head(1000)
-        title = "Top 1000 Players – Earnings Distribution"
-        line_color = 'deepskyblue'
-    else:
-        df_display = df_5000_sorted
-        title = "Top 5000 Players – Earnings Distribution"
-        line_color = 'deepskyblue'
+    data = compute.compute_prize_distribution(selection)
+    fig = charts.prize_distribution_figure(selection)
 
     # Total earnings KPI
-    if selection == "Top 1000":
-        total_prize = df_display["TotalUSDPrize"].sum()
-        st.markdown(
-            f"<div style='color:black; font-size:1.4rem; margin-top:-1rem; padding-bottom:0.5rem;'>Total Earnings: <strong>${total_prize:,.0f}</strong></div>",
-            unsafe_allow_html=True
-        )
-    else:
-        total_prize = df_display["TotalUSDPrize"].sum()
-        st.markdown(
-            f"<div style='color:black; font-size:1.4rem; margin-top:-1rem; padding-bottom:0.5rem;'>Total Earnings: <strong>${total_prize:,.0f}</strong></div>",
-            unsafe_allow_html=True
-        )
-
-
-    # Chart
-    fig = px.area(
-        df_display,
-        x="Rank",
-        y="TotalUSDPrize",
-        template="plotly_dark",
-    )
-
-    fig.update_traces(
-        line=dict(color=line_color, width=1),
-        mode="lines+markers",  # 👈 ajoute les points visibles
-        marker=dict(size=5),  # 👈 style des points
-        hovertemplate="<b>Rank:</b> %{x}<br>" +
-                "<b>Player:</b> %{customdata[0]}<br>" +
-                "<b>Total Earnings:</b> $%{y:,.0f}<extra></extra>",
-        customdata=df_display[["CurrentHandle"]]
-    )
-
-    fig.update_layout(
-        title=dict(
-            text=title,
-            font=dict(size=30, color="white"),
-            x=0.5,
-            y=0.97,  # 👈 contrôle vertical
-            xanchor='center',
-            yanchor='top'
-        ),
-        xaxis_title="Player Rank",
-        yaxis_title="Total Prize (USD)",
-        xaxis=dict(
-            tickfont=dict(size=26, color='white'),
-            title_font=dict(size=24, color='white'),
-        ),
-        yaxis=dict(
-            tickfont=dict(size=26, color='white'),
-            title_font=dict(size=24, color='white')
-        ),
-        plot_bgcolor='#0d1b2a',
-        paper_bgcolor='#0d1b2a',
-        font=dict(color='white', size=14),
-        height=700,
-    )
-
-    # Ligne médiane
-    median_val = df_display["TotalUSDPrize"].median()
-    fig.add_hline(
-        y=median_val,
-        line_dash="dot",
-        line_color="red",
-        annotation=dict(
-            text=f"Median ≈ ${median_val/1000:.0f}K",
-            font=dict(color="red", size=33, weight="bold"),
-            x=0.95,
-            xanchor="right",
-            yanchor="bottom",
-            showarrow=False,
-            bgcolor="rgba(0,0,0,0.4)",
-        )
+    st.markdown(
+        f"<div style='color:black; font-size:1.4rem; margin-top:-1rem; padding-bottom:0.5rem;'>Total Earnings: <strong>${data['total_prize']:,.0f}</strong></div>",
+        unsafe_allow_html=True
     )
-    # Annotation
-    def add_prize_annotation(fig, df, threshold, label=None, color="white", ax_offset=60, ay_offset=-120):
-        row = df[df["TotalUSDPrize"] >= threshold].tail(1)
-        if not row.empty:
-            rank = int(row["Rank"].values[0])
-            prize = int(row["TotalUSDPrize"].values[0])
-            fig.add_annotation(
-                x=rank,
-                y=prize,
-                text=f"{label}",
-                showarrow=True,
-                arrowhead=2,
-                arrowsize=1,
-                arrowwidth=3,
-                ax=ax_offset,
-                ay=ay_offset,
-                font=dict(color=color, size=30),
-                bgcolor="rgba(0,0,0,0.6)",
-                bordercolor=None,
-                borderwidth=1
-            )
-    add_prize_annotation(fig, df_display, threshold=1_000_000, label="$1M", color="deepskyblue")
-    add_prize_annotation(fig, df_display, threshold=500_000, label="$500K", color="deepskyblue", ax_offset=80)
-
-    if selection == "Top 5000":
-        add_prize_annotation(fig, df_display, threshold=100_000, label="$100K", color="deepskyblue", ax_offset=100)
-        add_prize_annotation(fig, df_display, threshold=200_000, label="$200K", color="deepskyblue", ax_offset=100)
-
-
-
 
     # ➡️ Display side-by-side: map left, bar right
     col1, col2 = st.columns([2,1])
     with col1:
-        st.plotly_chart(fig, use_container_width=True)
+        payload.plotly_chart(fig, "slide 2", "distribution", use_container_width=True)
     with col2:
         st.markdown("<br>", unsafe_allow_html=True)  # ⬅️ ajoute 2 sauts de ligne
         st.markdown(
@@ -433,144 +229,22 @@ def slide_2_prize_distribution():
 # 📊 Slide 3 – Geographic distribution
 # ===============================================================
 
+@st.fragment
+@telemetry.timed_tab("Geographic distribution")
 def slide_3_geographic_distribution():
     st.markdown("<h2 style='color:#0077b6;'>Where do top players come from and which regions lead the scene?</h2>", unsafe_allow_html=True)
 
-    # 📅 Load player data
-    players_df = pd.read_csv(BASE_DIR / "players_profiles_with_id.csv")
-    players_df['CountryCode'] = players_df['CountryCode'].fillna('').str.upper()
-
-    # ISO2 → ISO3 via pycountry
-    iso2_to_iso3 = {country.alpha_2: country.alpha_3 for country in pycountry.countries}
-    players_df['CountryISO3'] = players_df['CountryCode'].map(iso2_to_iso3)
-
-    # ISO3 → Continent via pycountry_convert
-    def iso3_to_continent_func(iso3):
-        try:
-            iso2 = pc.country_alpha3_to_country_alpha2(iso3)
-            continent_code = pc.country_alpha2_to_continent_code(iso2)
-            return {
-                "AF": "Africa",
-                "AS": "Asia",
-                "EU": "Europe",
-                "NA": "North America",
-                "OC": "Oceania",
-                "SA": "South America"
-            }.get(continent_code, "Unknown")
-        except:
-            return "Unknown"
-
-    players_df["Continent"] = players_df["CountryISO3"].apply(iso3_to_continent_func)
-
-    # All ISO3 and Country Names
-    all_iso3 = [country.alpha_3 for country in pycountry.countries]
-    iso3_to_name = {country.alpha_3: country.name for country in pycountry.countries}
-    df_all = pd.DataFrame({
-        "CountryISO3": all_iso3,
-        "CountryName": [iso3_to_name[iso3] for iso3 in all_iso3]
-    })
-
-    # Stats
-    df_stats = players_df.groupby("CountryISO3").agg(
-        PlayerCount=("TotalUSDPrize", "count"),
-        TotalPrize=("TotalUSDPrize", "sum"),
-        AvgPrize=("TotalUSDPrize", "mean")
-    ).reset_index()
-
-    df_country = df_all.merge(df_stats, on="CountryISO3", how="left")
-    continent_map = players_df[["CountryISO3", "Continent"]].drop_duplicates(subset="CountryISO3").set_index("CountryISO3")["Continent"]
-    df_country["Continent"] = df_country["CountryISO3"].map(continent_map)
-    df_country[["PlayerCount", "TotalPrize", "AvgPrize"]] = df_country[["PlayerCount", "TotalPrize", "AvgPrize"]].fillna(0)
-
     # 🔄 Toggle
-    metric = st.radio("Select the metric to display (from top 1000):", ["Player Count", "Total Prize (USD)"])
+    metric = st.radio("Select the metric to display (from top 1000):", ["Player Count", "Total Prize (USD)"], key="slide_3_metric")
     metric_column = "PlayerCount" if metric == "Player Count" else "TotalPrize"
-    title_map = {
-        "PlayerCount": "Number of Top 1000 Players per Country",
-        "TotalPrize": "Total Prize Money by Country (USD)"
-    }
-
-    # Hover
-    df_country['HoverText'] = [
-        f"{row['CountryName']}<br>Players: {int(row['PlayerCount'])}"
-        f"<br>Total earnings: ${row['TotalPrize']:,.0f}"
-        f"<br>Average per player: ${row['AvgPrize']:,.0f}"
-        for _, row in df_country.iterrows()
-    ]
-
-    # Color scale
-    custom_colorscale = [
-        [0.0, "#ffffff"],
-        [0.00001, "#bfe0eb"],
-        [0.1, "#6fb5d1"],
-        [0.3, "#4a8cbf"],
-        [0.5, "#7a5eb6"],
-        [0.7, "#c55fa0"],
-        [0.9, "#f27c5b"],
-        [1.0, "#f4c542"]
-    ]
-
-    # Map
-    fig_map = go.Figure(data=go.Choropleth(
-        locations=df_country['CountryISO3'],
-        z=df_country[metric_column],
-        locationmode='ISO-3',
-        colorscale=custom_colorscale,
-        colorbar_title=title_map[metric_column],
-        zmin=0,
-        zmax=df_country[metric_column].max(),
-        text=df_country['HoverText'],
-        hoverinfo='text'
-    ))
-
-    fig_map.update_layout(
-        title_text=title_map[metric_column],
-        geo=dict(
-            showframe=False,
-            showcoastlines=False,
-            projection_type='equirectangular',
-            bgcolor='#0b132b',
-            center=dict(lat=20, lon=0),
-            projection_scale=1.1,
-        ),
-        margin=dict(l=30, r=50, t=60, b=50),  # ⬅️ réduit les marges autour de la figure
-
-        legend=dict(font=dict(size=25)),
-        paper_bgcolor='#0b132b',
-        plot_bgcolor='#0b132b',
-        height=600,
-        font=dict(color='white'),
-        title=dict(
-            text=f"Top 10 Countries by {metric}",
-            font=dict(size=30, color="white"),
-            x=0.5,
-            y=0.97,  # 👈 contrôle vertical
-            xanchor='center',
-            yanchor='top'
-        ),
-
-    )
 
-
-    fig_map.data[0].colorbar.title = None
-    fig_map.data[0].colorbar.tickfont = dict(color='white', size=13)
+    cards = compute.compute_continent_cards(metric_column)
+    fig_map = charts.country_map_figure(metric, metric_column)
+    fig_bar = charts.top_countries_figure(metric, metric_column)
 
     # Continents
-    df_continent = df_country.groupby("Continent").agg({
-        "PlayerCount": "sum",
-        "TotalPrize": "sum"
-    }).reset_index()
-
-    continent_order = ["Asia", "Europe", "North America", "South America", "Oceania", "Africa"]
-    df_continent["Continent"] = pd.Categorical(df_continent["Continent"], categories=continent_order, ordered=True)
-    df_continent = df_continent.sort_values("Continent")
-
-    cols = st.columns(min(len(df_continent), 6))
-    for i, (index, row) in enumerate(df_continent.iterrows()):
-        value = row[metric_column]
-        label = row["Continent"]
-        formatted = f"{int(value):,}" if metric_column == "PlayerCount" else f"${value / 1_000_000:,.2f}M"
-        
+    cols = st.columns(min(len(cards), 6))
+    for i, (label, formatted) in enumerate(cards):
         cols[i].markdown(f"""
             <div style="text-align: center; padding: 5px 0;">
                 <div style="font-size: 1.1rem; color: #222;">{label}</div>
@@ -578,129 +252,41 @@ def slide_3_geographic_distribution():
             </div>
         """, unsafe_allow_html=True)
 
-    fig_map.update_traces(
-    colorbar=dict(
-        tickfont=dict(size=23, color="white"),
-        )   
-    )   
-
-    # Top 10 bar chart
-    top10 = df_country.nlargest(10, metric_column).sort_values(metric_column)
-    top10['HoverText'] = [
-        f"{row['CountryName']}<br>Players: {int(row['PlayerCount'])}"
-        f"<br>Total earnings: ${row['TotalPrize']:,.0f}"
-        f"<br>Average per player: ${row['AvgPrize']:,.0f}"
-        for _, row in top10.iterrows()
-    ]
-
-    bar_text = (
-        top10["PlayerCount"].astype(int).astype(str) + " "
-        if metric_column == "PlayerCount"
-        else top10["TotalPrize"].apply(lambda x: f"${x/1e6:.1f}M ")
-    )
-
-    fig_bar = go.Figure()
-    fig_bar.add_trace(go.Bar(
-        x=top10[metric_column],
-        y=top10["CountryName"],
-        orientation="h",
-        text=bar_text,
-        textposition='inside',
-        textfont=dict(size=20),
-        marker=dict(
-            color=top10[metric_column],
-            colorscale=custom_colorscale,
-            cmin=0,
-            cmax=df_country[metric_column].max(),
-            line=dict(width=0)
-        ),
-        hovertemplate="%{customdata}<extra></extra>",
-        customdata=top10["HoverText"]
-    ))
-
-    fig_bar.update_layout(
-        title=dict(
-            text=f"Top 10 Countries by {metric}",
-            font=dict(size=30, color="white"),
-            x=0.5,
-            y=0.97,  # 👈 contrôle vertical
-            xanchor='center',
-            yanchor='top'
-        ),
-        paper_bgcolor="#0b132b",
-        plot_bgcolor="#0b132b",
-        font=dict(color="white", size=14),
-        xaxis=dict(
-            title=dict(text=metric, font=dict(size=26, color='white')),
-            tickfont=dict(size=24, color='white'),
-            showgrid=True,  # ✅ Active les lignes verticales
-            gridcolor='rgba(255, 255, 255, 0.2)',  # ✅ Couleur blanche très transparente
-            gridwidth=3
-        ),
-        yaxis=dict(
-            title=None,
-            tickfont=dict(size=23, color='white'),
-            automargin=True
-        ),
-        margin=dict(l=220),
-        height=600
-    )
-    fig_bar.update_coloraxes(colorbar_title=None, showscale=False)
-
     st.markdown("<div style='margin-bottom: 30px;'></div>", unsafe_allow_html=True)
 
     # ➔ Final display
     col1, col2 = st.columns([1.7,1.3])
     with col1:
-        st.plotly_chart(fig_map, use_container_width=True)
+        payload.plotly_chart(fig_map, "slide 3", "map", use_container_width=True)
     with col2:
-        st.plotly_chart(fig_bar, use_container_width=True)
+        payload.plotly_chart(fig_bar, "slide 3", "bar", use_container_width=True)
 
 
 # ===============================================================
 # 📊 Slide 4 – Careers Structure
 # ===============================================================
 
+@st.fragment
+@telemetry.timed_tab("Careers Structure")
 def slide_4_careers_structure():
     st.markdown("<h2 style='color:#0077b6;'>How long and intense are esports careers at the top level?</h2>", unsafe_allow_html=True)
 
     # ---------------------------------------------
-    # Load and preprocess data
-    # --------------------------------------------
-
-    # Load tournament data
-    career_df = pd.read_csv(BASE_DIR / "scatter_df_export.csv")
-
-    career_df["GameType"] = career_df["GameType"].astype(str).str.strip()
-
-    # Clean and compute key metrics
-    career_df = career_df[
-        (career_df["CareerLengthYears"] > 0.25) &
-        (career_df["TotalTournaments"] > 0) &
-        (~career_df["GameType"].isna())
-    ].copy()
-
-    career_df["TournamentsPerYear"] = career_df["TotalTournaments"] / career_df["CareerLengthYears"]
-
-    # Compression function for soft Y-axis scaling
-    def compress_y(val, threshold=300, factor=0.4):
-        return val if val <= threshold else threshold + (val - threshold) * factor
-
-    career_df["CompressedTournaments"] = career_df["TotalTournaments"].apply(compress_y)
-
-# ---------------------------------------------
-# UI – GameType filter
-# ---------------------------------------------
-
-    gametypes = ["All"] + sorted(career_df["GameType"].unique())
-    selected_type = st.selectbox("🎮 Filter by Game Type", gametypes)
-
-    if selected_type == "All":
-        filtered_df = career_df.copy().reset_index(drop=True)
+    # UI – GameType filter
+    # ---------------------------------------------
+    fig = charts.careers_scatter_client_figure() if CLIENT_FILTERS else None
+    if fig is None:
+        selected_type = st.selectbox("🎮 Filter by Game Type", compute.career_type_options(), key="slide_4_game_type")
+        fig = charts.careers_scatter_figure(selected_type)
+        kpi_scope = ""
     else:
-        filtered_df = career_df[career_df["GameType"] == selected_type].reset_index(drop=True)
-
+        # The chart menu filters in the browser only: KPIs stay on every game type
+        selected_type = "All"
+        kpi_scope = " (All game types)"
+        st.caption("🎮 Game Type filter: use the menu on the chart (KPIs cover all game types)")
 
+    data = compute.compute_careers_structure(selected_type)
+    fig_bar = charts.intensity_bar_figure()
 
     # ---------------------------------------------
     # KPIs – Median duration and tournaments
@@ -709,194 +295,11 @@ def slide_4_careers_structure():
 
     col1, col2, col3 = st.columns([1,1,2])
     with col1:
-        st.metric("Median Career Length", f"{filtered_df['CareerLengthYears'].median():.1f} years")
+        st.metric(f"Median Career Length{kpi_scope}", f"{data['median_career_length']:.1f} years")
     with col2:
-        st.metric("Median Total Tournaments Played", f"{filtered_df['TotalTournaments'].median():.1f}")
+        st.metric(f"Median Total Tournaments Played{kpi_scope}", f"{data['median_tournaments']:.1f}")
     with col3:
-        st.metric("Median Tournaments / Year", f"{filtered_df['TournamentsPerYear'].median():.1f}")
-
-
-    # ---------------------------------------------
-    # Scatter Plot with compressed Y axis
-    # ---------------------------------------------
-
-    custom_colors = {
-        'MOBA': '#5f78ff',
-        'Battle Royale': '#ff6361',
-        'FPS': '#43d9a5',
-        'Sports': '#b266ff',
-        'RTS': '#ffa600',
-        'Card Game': '#00c2ff',
-        'Auto Battler': '#ffc658',
-        'Fighting': '#e377c2', 
-    }
-
-    tick_values_raw = [50, 100, 200, 300, 400, 500, 600, 700]
-    tick_values_compressed = [compress_y(val) for val in tick_values_raw]
-    tick_labels = ["50", "100", "200", "300", "400", "500", "600", "700"]
-
-    filtered_df = filtered_df.reset_index(drop=True)
-
-    if selected_type == "All":
-        filtered_df = career_df.copy().reset_index(drop=True)
-    else:
-        filtered_df = career_df[career_df["GameType"] == selected_type].reset_index(drop=True)
-
-
-# Tri défensif
-    filtered_df = filtered_df.sort_values(by=["CareerLengthYears", "CompressedTournaments"]).reset_index(drop=True)
-
-    fig = px.scatter(
-        filtered_df,
-        x="CareerLengthYears",
-        y="CompressedTournaments",
-        color="GameType",
-        color_discrete_map=custom_colors,
-        labels={
-            "CareerLengthYears": "Career Length (years)",
-            "CompressedTournaments": "Total Tournaments Played",
-        },
-        hover_data={
-            "CurrentHandle": True,
-            "GameName": True,
-            "GameType": True,
-            "CareerLengthYears": ':.1f',
-            "TotalTournaments": True,
-            "CompressedTournaments": False
-        },
-        opacity=1,
-    )
-
-    fig.update_traces(marker=dict(size=8, opacity=0.9))
-
-
-
-    fig.update_layout(
-        title_font=dict(size=30, color='white'),
-        paper_bgcolor='#0b132b',
-        plot_bgcolor='#0b132b',
-        font=dict(color='white', size=14),
-        title=dict(
-            text="Career Structure",
-            font=dict(size=30, color="white"),
-            x=0.5,
-            y=0.97,  # 👈 contrôle vertical
-            xanchor='center',
-            yanchor='top'
-    ),
-        height=650,
-        legend=dict(
-        title="Game Type",
-        title_font=dict(size=20, color='white'),
-        font=dict(size=20, color='white')),
-        xaxis=dict(
-            title=dict(font=dict(size=22, color='white')),
-            tickfont=dict(size=24, color='white'),
-            showgrid=True,
-            gridcolor='rgba(255,255,255,0.1)'
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridcolor='rgba(255,255,255,0.1)',
-            tickfont=dict(size=24, color='white'),
-            tickvals=tick_values_compressed,
-            ticktext=tick_labels,
-            title=(dict(text="Total Tournaments Played",font=dict(size=22, color='white')))
-        )
-    )
-    # Median
-    median_career_length = filtered_df["CareerLengthYears"].median()
-
-    # Line
-    fig.add_vline(
-        x=median_career_length,
-        line=dict(color='rgba(255,0,0,0.5)', dash='dash', width=2),
-        annotation_text=f"Median ≈ {median_career_length:.1f} yrs",
-        annotation_position="top",
-        annotation_font=dict(color='red', size=24),
-        annotation_xshift=-100,
-        annotation_y=0.95
-    )
-
-
-    # ---------------------------------------------
-    # Bar Plot 
-    # ---------------------------------------------
-
-    # Filter for gametypes with at least 20 players
-    counts = career_df["GameType"].value_counts()
-    valid_types = counts[counts >= 10].index
-    barplot_df = career_df[career_df["GameType"].isin(valid_types)]
-
-    # Recalculate medians for the updated plot
-    summary_df = barplot_df.groupby("GameType").agg(
-        MedianTournamentsPerYear=("TournamentsPerYear", "median"),
-        Count=("PlayerId", "count")
-    ).reset_index().sort_values("MedianTournamentsPerYear", ascending=False)
-
-    # Define custom colors consistent with previous visualizations
-    custom_colors = {
-        'MOBA': '#5f78ff',
-        'Battle Royale': '#ff6361',
-        'FPS': '#43d9a5',
-        'Sports': '#b266ff',
-        'RTS': '#ffa600',
-        'Card Game': '#00c2ff',
-        'Auto Battler': '#ffc658',
-        'Fighting': '#e377c2', 
-    }
-
-    # Create single-bar chart for intensity (Tournaments/Year)
-    fig_bar = go.Figure()
-
-    fig_bar.add_trace(go.Bar(
-        x=summary_df["GameType"],
-        y=summary_df["MedianTournamentsPerYear"],
-        marker_color=[custom_colors.get(gt, '#888') for gt in summary_df["GameType"]],
-        name="Median Tournaments / Year"
-    ))
-
-
-
-
-    # Apply layout styling
-    fig_bar.update_layout(
-    title=dict(
-        text="Tournaments per Year (median)",
-        font=dict(size=30, color="white"),
-        x=0.5,
-        y=0.97,  # 👈 contrôle vertical
-        xanchor='center',
-        yanchor='top'
-    ),
-        paper_bgcolor='#0b132b',
-        plot_bgcolor='#0b132b',
-        font=dict(color='white', size=14),
-        height=650,
-        legend=dict(
-            title="Metric",
-            title_font=dict(size=8, color='white'),
-            font=dict(size=20, color='white'),
-            x=0.75,
-            y=0.95,
-            bgcolor='rgba(0,0,0,0)'
-        ),
-        xaxis=dict(
-            #title=dict(text="Game Type", font=dict(size=22, color='white')),
-            title=None,
-            tickfont=dict(size=22, color='white'),
-            showgrid=True,
-            gridcolor='rgba(255,255,255,0.1)'
-        ),
-        yaxis=dict(
-            #title=dict(text="Median Tournaments per Year", font=dict(size=22, color='white')),
-            title=None,
-            tickfont=dict(size=24, color='white'),
-            showgrid=True,
-            gridcolor='rgba(255,255,255,0.1)'
-        ),
-        margin=dict(l=40, r=40, t=60, b=40)
-    )
+        st.metric(f"Median Tournaments / Year{kpi_scope}", f"{data['median_tournaments_per_year']:.1f}")
 
     # ➡️ Display side-by-side: text + map left, bar right
     col1, col2, col3 = st.columns([2, 1, 1])
@@ -916,125 +319,24 @@ def slide_4_careers_structure():
         st.info("**Important note**: Over 70% of these top players are still active, meaning **many careers are far from over**.")
 
     with col1:
-        st.plotly_chart(fig, use_container_width=True)
+        payload.plotly_chart(fig, "slide 4", "scatter", use_container_width=True)
 
     with col2:
-        st.plotly_chart(fig_bar, use_container_width=True)
-
-# ---------------------------------------------
-# Load Data (use st.cache_data to avoid recomputation)
-# ---------------------------------------------
-def load_data():
-    df = pd.read_csv(BASE_DIR / "scatter_df_export.csv")
-    df["AvgEarningsPerYear"] = df["TotalUSDPrize"] / df["CareerLengthYears"]
-    return df
-
-scatter_df = load_data()
+        payload.plotly_chart(fig_bar, "slide 4", "intensity", use_container_width=True)
 
 # ---------------------------------------------
 # Slide 5 – Median Yearly Earnings by Game Type
 # ---------------------------------------------
+@st.fragment
+@telemetry.timed_tab("Yearly Earnings")
 def slide_5__yearly_earnings():
     st.markdown("<h2 style='color:#0077b6;'>Do some game types offer more stable income than others?</h2>", unsafe_allow_html=True)
     st.markdown("""
                     """)
-    # Custom color palette
-    custom_colors = {
-        'MOBA': '#5f78ff',
-        'Battle Royale': '#ff6361',
-        'FPS': '#43d9a5',
-        'Sports': '#b266ff',
-        'RTS': '#ffa600',
-        'Card Game': '#00c2ff',
-        'Auto Battler': '#ffc658',
-        'Fighting': '#e377c2',
-        'Strategy': '#bcbd22',
-        'Racing': '#17becf'
-    }
-
-
-    # Filter: Only GameTypes with ≥ 10 players
-    game_counts = scatter_df["GameType"].value_counts()
-    valid_gametypes = game_counts[game_counts >= 10].index
-    filtered_df = scatter_df[scatter_df["GameType"].isin(valid_gametypes)]
-
-    # Compute median earnings per year by GameType
-    median_by_game = (
-        filtered_df.groupby("GameType")["AvgEarningsPerYear"]
-        .median()
-        .sort_values(ascending=False)
-        .reset_index()
-    )
-
-    # Plot the bar chart
-    fig = px.bar(
-        median_by_game,
-        x="GameType",
-        y="AvgEarningsPerYear",
-        color="GameType",
-        color_discrete_map=custom_colors,
-        labels={
-            "GameType": "Game Type",
-            "AvgEarningsPerYear": "Median Earnings per Year (USD)"
-        },
-        title="Median Yearly Earnings"
-    )
-
-    # Add number of players as annotations at the bottom of each bar
-    for i, row in median_by_game.iterrows():
-        gametype = row["GameType"]
-        count = filtered_df[filtered_df["GameType"] == gametype].shape[0]
-        fig.add_annotation(
-            x=gametype,
-            y=2000,  # offset above the zero line
-            text=f"{count} players",
-            showarrow=False,
-            font=dict(color="black", size=24),
-            yanchor="bottom"
-        )
-
-    # Global median line (dashed)
-    global_median = filtered_df["AvgEarningsPerYear"].median()
-    fig.add_hline(
-        y=global_median,
-        line_dash="dash",
-        line_color="red",
-        annotation_text="Global Median",
-        annotation_position="top right",
-        annotation_font_color="red",
-        annotation_font_size=27,
-        annotation_xshift=-580,
-        annotation_yshift=5  # 👈 Taille du texte ici
-
-    )
-
-    # Style settings
-    fig.update_layout(
-        title=dict(
-            text="Yearly Earnings by Game Type",
-            font=dict(size=34, color='white'),
-            x=0.5,
-            xanchor='center'
-        ),
-        paper_bgcolor='#0b132b',
-        plot_bgcolor='#0b132b',
-        font=dict(color='white', size=14),
-        height=650,
-        xaxis=dict(
-            title=None,
-            tickfont=dict(size=24, color='white'),
-            showgrid=False
-        ),
-        yaxis=dict(
-            title_font=dict(size=26, color='white'),
-            tickfont=dict(size=24, color='white'),
-            showgrid=True,
-            gridcolor='rgba(255,255,255,0.3)'
-        ),
-        showlegend=False
-    )
-
 
+    data = compute.compute_yearly_earnings()
+    median_by_game = data["median_by_game"]
+    global_median = data["global_median"]
 
     # KPIs with custom formatting
     col1, col2, col3 = st.columns(3)
@@ -1097,12 +399,29 @@ def slide_5__yearly_earnings():
         )
 
     with col2:
-        st.plotly_chart(fig, use_container_width=True)
+        error_bars = st.radio("📏 Error bars", list(charts.ERROR_BAR_BOUNDS), horizontal=True, key="slide_5_error_bars")
+        payload.plotly_chart(charts.yearly_earnings_figure(error_bars), "slide 5", "yearly", use_container_width=True)
         st.markdown("<p style='font-size:24px; color:gray;'>Only game types with ≥10 players included.</p>", unsafe_allow_html=True)
 
 # ===============================================================
 # 📊 Slide 6 – Earnings Shape
 # ===============================================================
+PROFILE_DESCRIPTIONS = {
+    "Steady": "Earnings spread consistently across tournaments",
+    "Balanced": "A few peaks, but overall consistent",
+    "Spiky": "Heavily reliant on major wins",
+    "Explosive": "Almost everything came from a handful of events"
+}
+
+PROFILE_COLORS = {
+    "Steady": "#00b4d8",
+    "Balanced": "#0091c2",
+    "Spiky": "#f95d6a",
+    "Explosive": "#d62728"
+}
+
+
+@telemetry.timed_tab("Earnings Shape")
 def slide_6_earnings_shape():
 
     # TITLE + SUBTITLE
@@ -1113,69 +432,19 @@ def slide_6_earnings_shape():
         </p>
     """, unsafe_allow_html=True)
 
-
-    # ---- DATA IMPORT ----
-    df = pd.read_csv(BASE_DIR / "scatter_df_export.csv")  # <-- adapte le chemin si besoin
-
-    # ---- FILTER: Only main GameTypes (≥50 players) ----
-    valid_gametypes = df["GameType"].value_counts()
-    valid_gametypes = valid_gametypes[valid_gametypes >= 10].index
-    df = df[df["GameType"].isin(valid_gametypes)]
-
-    # ---- CLASSIFICATION: Based on Top10PctEarningsRatio ----
-    bins = [0, 0.30, 0.55, 0.8, 1.01]
-    labels = ["Steady", "Balanced", "Spiky", "Explosive"]
-    df["CareerProfile"] = pd.cut(df["Top10PctEarningsRatio"], bins=bins, labels=labels, include_lowest=True)
-
-    # ---- COUNTS FOR PLOT ----
-    df_counts = (
-        df.groupby(["CareerProfile", "GameType"])
-        .size()
-        .reset_index(name="Count")
-    )
-
-    # ---- KPI METRICS ----
-    total_players = len(df)
-    profile_distribution = df["CareerProfile"].value_counts(normalize=True).reindex(labels)
-
-    # ---- CUSTOM COLORS ----
-    custom_colors = {
-        'MOBA': '#5f78ff',
-        'Battle Royale': '#ff6361',
-        'FPS': '#43d9a5',
-        'Sports': '#b266ff',
-        'RTS': '#ffa600',
-        'Card Game': '#00c2ff',
-        'Auto Battler': '#ffc658',
-        'Fighting': '#e377c2', 
-    }
-
+    _, profile_pct = compute.compute_earnings_shape()
+    fig = charts.earnings_shape_figure()
 
     kpi_cols = st.columns(4)
 
-    descriptions = {
-        "Steady": "Earnings spread consistently across tournaments",
-        "Balanced": "A few peaks, but overall consistent",
-        "Spiky": "Heavily reliant on major wins",
-        "Explosive": "Almost everything came from a handful of events"
-    }
-
-    colors = {
-        "Steady": "#00b4d8",
-        "Balanced": "#0091c2",
-        "Spiky": "#f95d6a",
-        "Explosive": "#d62728"
-    }
-
-    for i, profile in enumerate(["Steady", "Balanced", "Spiky", "Explosive"]):
-        pct = profile_distribution[profile]
+    for i, profile in enumerate(compute.PROFILE_LABELS):
         with kpi_cols[i]:
             st.markdown(
                 f"""
                 <div style='text-align: center; line-height: 1.3;'>
                     <p style='font-size:32px; font-weight:bold; color:black; margin-bottom:6px;'>{profile}</p>
-                    <p style='font-size:44px; font-weight: bold; color:{colors[profile]}; margin: 0;'>{pct*100:.1f}%</p>
-                    <p style='font-size:24px; color:black; margin-top:6px;'>{descriptions[profile]}</p>
+                    <p style='font-size:44px; font-weight: bold; color:{PROFILE_COLORS[profile]}; margin: 0;'>{profile_pct[profile]}</p>
+                    <p style='font-size:24px; color:black; margin-top:6px;'>{PROFILE_DESCRIPTIONS[profile]}</p>
                 </div>
                 """,
                 unsafe_allow_html=True
@@ -1215,166 +484,14 @@ def slide_6_earnings_shape():
         )
 
     with col2:
-        fig = px.bar(
-            df_counts,
-            x="CareerProfile",
-            y="Count",
-            color="GameType",
-            color_discrete_map=custom_colors,
-            barmode="stack",
-            category_orders={"CareerProfile": labels},
-            labels={
-                "CareerProfile": "Career Profile",
-                "Count": "Number of Players",
-                "GameType": "Game Type"
-            },
-            title=""
-        )
-
-        fig.update_layout(
-            title=dict(
-                text="Number of Players per Career Profile",
-                font=dict(size=28, color='white'),
-                x=0.5,
-                xanchor='center'
-            ),
-            paper_bgcolor='#0b132b',
-            plot_bgcolor='#0b132b',
-            font=dict(color='white', size=20),
-            height=650,
-            margin=dict(t=100, l=10, r=140, b=10),  # ➕ marge droite plus large pour la légende
-            xaxis=dict(
-                title="Career Profile",
-                title_font=dict(size=26, color='white'),
-                tickfont=dict(size=24, color='white')
-            ),
-            yaxis=dict(
-                title="Number of Players",
-                title_font=dict(size=26, color='white'),
-                tickfont=dict(size=24, color='white')
-            ),
-            legend=dict(
-                orientation="v",  # ➡️ vertical
-                yanchor="top",
-                y=0.95,
-                xanchor="left",
-                x=1.02,  # ➡️ décalé juste à l'intérieur
-                bgcolor='rgba(0,0,0,0)',
-                font=dict(size=22, color="white"),
-                title_font=dict(size=24, color="white")
-            )
-        )
-
-
-        st.plotly_chart(fig, use_container_width=True)
+        payload.plotly_chart(fig, "slide 6", "shape", use_container_width=True)
 
 
 # ===============================================================
 # 📊 Slide 7 – Career Archetypes
 # ===============================================================
 
-import pandas as pd
-import plotly.express as px
-
-# Chargement des données tournois
-df = pd.read_csv(BASE_DIR / "tournaments_corrected_with_handles_and_games.csv")
-df["EndDate"] = pd.to_datetime(df["EndDate"])
-df.sort_values(by=["CurrentHandle", "EndDate"], inplace=True)
-df["CumulativePrize"] = df.groupby("CurrentHandle")["USDPrizePerPlayer"].cumsum()
-
-# Chargement du fichier avec GameType
-game_type_df = pd.read_csv(BASE_DIR / "scatter_df_export.csv")[["CurrentHandle", "GameId", "GameType"]].drop_duplicates()
-
-# Merge GameType sur le dataframe principal
-df = df.merge(game_type_df, on=["CurrentHandle", "GameId"], how="left")
-
-# Palette personnalisée par GameType
-game_type_colors = {
-    "MOBA": "#ff6b6b",
-    "RTS": "#f7b801",
-    "FPS": "#6a4c93",
-    "Battle Royale": "#1982c4",
-    "Fighting": "#8ac926",
-    "Card/Board": "#ff924c",
-    "Sports": "#1f7a8c",
-    "Racing": "#c32bad",
-    "Other": "#cccccc"
-}
-
-# Fonction timeline par joueur, avec couleurs par GameType
-def create_timeline_chart(player_list, title):
-    filtered = df[df["CurrentHandle"].isin(player_list)].copy()
-    filtered.sort_values(by=["CurrentHandle", "EndDate"], inplace=True)
-    filtered["CumulativePrize"] = filtered.groupby("CurrentHandle")["USDPrizePerPlayer"].cumsum()
-
-    # Récupération des couleurs via GameType (si connu)
-    color_map = {}
-    for player in player_list:
-        game_type = filtered[filtered["CurrentHandle"] == player]["GameType"].dropna().unique()
-        color = game_type_colors.get(game_type[0], "#ffffff") if len(game_type) > 0 else "#ffffff"
-        color_map[player] = color
-
-    fig = px.line(
-        filtered,
-        x="EndDate",
-        y="CumulativePrize",
-        color="CurrentHandle",
-        line_group="CurrentHandle",
-        labels={"CumulativePrize": "Cumulative Earnings (USD)", "EndDate": "Date"},
-        title=title,
-        color_discrete_map=color_map
-    )
-
-    fig.update_layout(
-        title=dict(
-            text=title,
-            font=dict(size=28, color='white'),
-            x=0.5,
-            xanchor='center'
-        ),
-        paper_bgcolor='#0b132b',
-        plot_bgcolor='#0b132b',
-        font=dict(color='white', size=20),
-        height=400,
-        margin=dict(t=100, l=10, r=140, b=10),
-        xaxis=dict(
-            title=None,
-            title_font=dict(size=22, color='white'),
-            tickfont=dict(size=24, color='white')
-        ),
-        yaxis=dict(
-            title="Cumulative Earnings (USD)",
-            title_font=dict(size=24, color='white'),
-            tickfont=dict(size=24, color='white')
-        ),
-        legend=dict(
-            title="Player",
-            orientation="v",
-            yanchor="top",
-            y=0.95,
-            xanchor="left",
-            x=1.02,
-            bgcolor='rgba(0,0,0,0)',
-            font=dict(size=24, color="white"),
-            title_font=dict(size=20, color="white")
-        )
-    )
-    return fig
-
-#Colors
-
-import matplotlib.colors as mcolors
-
-def hex_to_rgba(hex_color, alpha=0.8):
-    """Convert a hex color to an rgba string accepted by Plotly."""
-    rgb = mcolors.to_rgb(hex_color)
-    return f"rgba({int(rgb[0]*255)}, {int(rgb[1]*255)}, {int(rgb[2]*255)}, {alpha})"
-
-
-
-
-
-
+@telemetry.timed_tab("Players Archetypes")
 def slide_7__career_archetypes():
     st.markdown("<h2 style='color:#0077b6;'>What pro esports careers really look like?</h2>", unsafe_allow_html=True)
     st.markdown("""
@@ -1400,66 +517,55 @@ def slide_7__career_archetypes():
     )
 
     with col2:
-        players_outliers = ["Bugha", "Collapse"]
-        fig_outliers = create_timeline_chart(players_outliers, "Heavy Hitters")
-        add_game_annotations(fig_outliers, df, players_outliers)
-        st.plotly_chart(fig_outliers, use_container_width=True)
+        fig_outliers = charts.timeline_figure((56483, 70584), "Heavy Hitters")  # Bugha, Collapse
+        payload.plotly_chart(fig_outliers, "slide 7", "heavy hitters", use_container_width=True)
         
 
     with col3:
-        players_sprinter = ["Atif Butt","sitetampo"]
-        fig_sprinter = create_timeline_chart(players_sprinter, "Fast Risers")
-        add_game_annotations(fig_sprinter, df, players_sprinter)
-        st.plotly_chart(fig_sprinter, use_container_width=True)
+        fig_sprinter = charts.timeline_figure((74084, 100425), "Fast Risers")  # Atif Butt, sitetampo
+        payload.plotly_chart(fig_sprinter, "slide 7", "fast risers", use_container_width=True)
 
     # Ligne 2
-    players_marathon = ["Lyn", "ShoWTimE"]
-    fig_marathon = create_timeline_chart(players_marathon, "Steady Climbers")
-    add_game_annotations(fig_marathon, df, players_marathon)
-    st.plotly_chart(fig_marathon, use_container_width=True)
-
-
-def add_game_annotations(fig, df, player_list):
-    for i, player in enumerate(player_list):
-        player_df = df[df["CurrentHandle"] == player]
-        if player_df.empty:
-            continue
-
-        point_index = int(len(player_df) * 0.5)
-        point_index = min(point_index, len(player_df) - 1)
-        row = player_df.iloc[point_index]
-
-        game_name = row.get("GameName", "Unknown Game")
-        #handle = row.get("CurrentHandle")
-        game_type = str(row["GameType"]).strip() if pd.notna(row["GameType"]) else "Unknown Type"
-
-        # Couleur principale et fond
-        color = game_type_colors.get(game_type, "#ffffff")
-        rgba_bg = hex_to_rgba(color, alpha=1)
-
-        text = f"<b>{game_name}</b><br><i>{game_type}</i>"
-
-        fig.add_annotation(
-            x=row["EndDate"],
-            y=row["CumulativePrize"],
-            text=text,
-            showarrow=True,
-            arrowhead=2,
-            arrowsize=1,
-            arrowwidth=1.5,
-            ax=-100,
-            ay=-70 + i * 30,
-            font=dict(color="black", size=20),
-            bgcolor=rgba_bg,
-            bordercolor=color,
-            borderwidth=2
-        )
+    fig_marathon = charts.timeline_figure((1042, 3811), "Steady Climbers")  # Lyn, ShoWTimE
+    payload.plotly_chart(fig_marathon, "slide 7", "steady climbers", use_container_width=True)
+
+# ===============================================================
+# 📊 Slide 8 – Earnings Over Time
+# ===============================================================
+
+@st.fragment
+@telemetry.timed_tab("Earnings Over Time")
+def slide_8_earnings_over_time():
+    st.markdown("<h2 style='color:#0077b6;'>How have top-level earnings evolved over time?</h2>", unsafe_allow_html=True)
+
+    # Year range – every window is a slice of the precomputed earnings cube
+    first_year, last_year = compute.earnings_year_bounds()
+    year_range = st.slider("📅 Year range", first_year, last_year, (first_year, last_year), key="slide_8_year_range")
+
+    data = compute.compute_earnings_over_time(year_range)
+    fig = charts.earnings_over_time_figure(year_range)
+    fig_top = charts.window_top_players_figure(year_range)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Earnings", f"${data['total'] / 1_000_000:,.1f}M")
+    with col2:
+        st.metric("Players with Earnings", f"{data['active_players']:,}")
+    with col3:
+        st.metric(*compute.compute_peak_run_kpi(year_range))
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        payload.plotly_chart(fig, "slide 8", "yearly", use_container_width=True)
+    with col2:
+        payload.plotly_chart(fig_top, "slide 8", "top players", use_container_width=True)
 
 # ===============================================================
 # Conclusion
 # ===============================================================
 
-def slide_8__conclusion():
+@telemetry.timed_tab("Conclusion")
+def slide_9__conclusion():
     st.markdown("<br>", unsafe_allow_html=True)
     st.markdown("<h2 style='color:#0077b6;'>So... what does it take to build a standout career in esports?</h2>", unsafe_allow_html=True)
     st.markdown("<br><br>", unsafe_allow_html=True)
@@ -1482,7 +588,7 @@ def slide_8__conclusion():
         )
 
     with col2:
-        st.image(BASE_DIR / "intro5.jpg", use_container_width=True, caption="Team Vitality – CS2 Major Champions – Austin (June 22, 2025)")
+        assets.image("intro5.jpg", "41vw", lazy=True, caption="Team Vitality – CS2 Major Champions – Austin (June 22, 2025)")
 
     # ➤ Retour en pleine largeur
 
@@ -1511,6 +617,9 @@ def slide_8__conclusion():
 # ===============================================================
 # 🧭 Slide Navigation — Horizontal Tabs
 # ===============================================================
+# Every tab is rendered on each script run. Slides with widgets are
+# st.fragment: a widget change reruns only its own slide, not the whole deck.
+# Widget values live in st.session_state under the widget keys (slide_<n>_*).
 tabs = st.tabs([
     "Intro",
     # "Context",  # temporaire
@@ -1521,11 +630,12 @@ tabs = st.tabs([
     "Yearly Earnings",
     "Earnings Shape",
     "Players Archetypes",
+    "Earnings Over Time",
     "Conclusion"
 ])
 
 
-with tabs[0]:
+with tabs[0], telemetry.tab_render_seconds.time(tab="Intro"):
     st.markdown("<h1 style='font-size:2.5rem; text-align:center; margin-top:1rem; color:#0077b6;'>Behind the Screens:<br>What Top Esports Careers Really Look Like?</h1>", unsafe_allow_html=True)
     st.markdown("<hr style='margin-top:10px; margin-bottom:2rem;'>", unsafe_allow_html=True)
 
@@ -1558,7 +668,7 @@ with tabs[0]:
 
     # Créer un conteneur vide pour afficher les images
     with col2:
-        st.image(BASE_DIR / "intro1.jpg", use_container_width=True, caption="PUBG Global Invitational – Berlin (2018)")
+        assets.image("intro1.jpg", "65vw", caption="PUBG Global Invitational – Berlin (2018)")
 
 
 
@@ -1569,7 +679,7 @@ with tabs[0]:
 
 
 # with tabs[1]:  # Game Types (TEMP)
-  #  st.image("game_examples.png", use_container_width=True)
+  #  assets.image("game_examples.png", "95vw", lazy=True)
 
 with tabs[1]:  # Top Games
     slide_1_prize_bar()
@@ -1592,8 +702,19 @@ with tabs[6]:  # Earnings Shape
 with tabs[7]:  # Players
     slide_7__career_archetypes()
 
-with tabs[8]:  # Conclusion
-    slide_8__conclusion()
+with tabs[8]:  # Earnings Over Time
+    slide_8_earnings_over_time()
+
+with tabs[9]:  # Conclusion
+    slide_9__conclusion()
+
+telemetry.script_run_seconds.observe(time.perf_counter() - run_started)
+# Entries computed by this run to the warm-start store, in a background thread
+warmstart.save_in_background()
+
+# Debug mode only (MEMORY_DEBUG=1): tracemalloc diff, panel with ?admin=memory
+memory.after_run()
+memory.admin_panel()
 
     
 
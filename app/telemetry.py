@@ -0,0 +1,209 @@
+# ===============================================================
+# 📡 Runtime metrics in Prometheus text format
+# ===============================================================
+"""
+Counters and histograms of the dashboard process, for capacity planning.
+
+- ``dashboard_script_run_seconds``: full script runs,
+- ``dashboard_tab_render_seconds{tab}``: each slide, in full runs and in
+  fragment reruns,
+- ``dashboard_dataset_load_seconds{dataset}``: CSV loads (schema.read_csv),
+- ``dashboard_cache_{hits,misses,evictions}_total{function}``: memo.py,
+- ``dashboard_figure_payload_bytes{slide,chart}``: last figure drawn in
+  each chart slot, and ``dashboard_figure_bytes_sent_total{slide}``,
+- ``dashboard_active_sessions`` and ``process_resident_memory_bytes``.
+
+``start_server()`` serves them at ``http://127.0.0.1:<METRICS_PORT>/metrics``
+(default 9464, ``METRICS_PORT=0`` to disable) from a background thread,
+once per process. The metrics cover every session of the process.
+"""
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import psutil
+
+import memo
+
+METRICS_PORT = int(os.environ.get("METRICS_PORT", 9464))
+
+# Seconds; the slowest cold runs take a few seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+logger = logging.getLogger(__name__)
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for value in labels.values())
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(labels, escaped)) + "}"
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# ===============================================================
+# 📏 Metric types
+# ===============================================================
+class Counter:
+    def __init__(self, name, help):
+        self.name, self.help = name, help
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.items())
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            lines += [f"{self.name}{_labels(dict(key))} {_number(value)}" for key, value in self._values.items()]
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, help, buckets=BUCKETS):
+        self.name, self.help = name, help
+        self.buckets = buckets
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(labels.items())
+        with self._lock:
+            # [cumulative bucket counts, sum, count]
+            series = self._series.setdefault(key, [[0] * len(self.buckets), 0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (counts, total, count) in self._series.items():
+                labels = dict(key)
+                for bound, n in zip(self.buckets, counts):
+                    lines.append(f"{self.name}_bucket{_labels({**labels, 'le': bound})} {n}")
+                lines.append(f"{self.name}_bucket{_labels({**labels, 'le': '+Inf'})} {count}")
+                lines.append(f"{self.name}_sum{_labels(labels)} {_number(total)}")
+                lines.append(f"{self.name}_count{_labels(labels)} {count}")
+        return lines
+
+
+def _gauge(name, help, samples):
+    """Lines of a gauge from ``[(labels, value)]`` read at scrape time."""
+    return [f"# HELP {name} {help}", f"# TYPE {name} gauge"] + [
+        f"{name}{_labels(labels)} {_number(value)}" for labels, value in samples
+    ]
+
+
+script_run_seconds = Histogram("dashboard_script_run_seconds", "Duration of full runs of streamlit_app.py")
+tab_render_seconds = Histogram("dashboard_tab_render_seconds", "Duration of one tab's slide, full run or fragment rerun")
+dataset_load_seconds = Histogram("dashboard_dataset_load_seconds", "Duration of a dataset CSV load")
+figure_bytes_sent = Counter("dashboard_figure_bytes_sent_total", "Bytes of figure JSON sent to browsers")
+
+
+def timed_tab(tab):
+    """Decorator recording a slide function's duration under ``tab``."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with tab_render_seconds.time(tab=tab):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ===============================================================
+# 📤 Exposition
+# ===============================================================
+def _active_sessions():
+    from streamlit import runtime
+
+    # AppTest's runtime has no session manager
+    session_mgr = getattr(runtime.get_instance(), "_session_mgr", None) if runtime.exists() else None
+    if session_mgr is None:
+        return 0
+    return session_mgr.num_active_sessions()
+
+
+def render():
+    """Every metric in Prometheus text format."""
+    import payload
+
+    lines = []
+    for metric in (script_run_seconds, tab_render_seconds, dataset_load_seconds, figure_bytes_sent):
+        lines += metric.render()
+
+    caches = sorted(memo._registry.items())
+    for stat in ("hits", "misses", "evictions"):
+        name = f"dashboard_cache_{stat}_total"
+        lines += [f"# HELP {name} Memoized calls: {stat}", f"# TYPE {name} counter"]
+        lines += [f"{name}{_labels({'function': function})} {wrapper.stats[stat]}" for function, wrapper in caches]
+    lines += _gauge("dashboard_cache_entries", "Entries held by each memoized function",
+                    [({"function": function}, len(wrapper.cache)) for function, wrapper in caches])
+
+    lines += _gauge("dashboard_figure_payload_bytes", "Figure JSON of the last figure drawn in each chart slot", [
+        ({"slide": slide, "chart": chart}, size)
+        for slide, charts in list(payload.payloads.items())
+        for chart, size in list(charts.items())
+    ])
+    lines += _gauge("dashboard_active_sessions", "Browser sessions connected to this process", [({}, _active_sessions())])
+    lines += _gauge("process_resident_memory_bytes", "Resident set size of this process",
+                    [({}, psutil.Process().memory_info().rss)])
+    return "\n".join(lines) + "\n"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        body = render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_server(port=METRICS_PORT):
+    """Serve /metrics from a daemon thread, once per process (not at all if ``port`` is 0)."""
+    global _server
+    with _server_lock:
+        if _server is not None or not port:
+            return
+        try:
+            _server = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        except OSError as error:
+            # e.g. a second app process on the same machine
+            logger.warning("Metrics endpoint not started on port %s: %s", port, error)
+            _server = False
+            return
+        _server.daemon_threads = True
+        threading.Thread(target=_server.serve_forever, daemon=True).start()
@@ -0,0 +1,90 @@
+# ===============================================================
+# ✅ Key validation pass
+# ===============================================================
+"""
+Consistency checks on the PlayerId / GameId keys shared by the datasets.
+
+``validate_keys()`` returns the number of offending rows for every check
+(0 everywhere means the joins are exact). Key uniqueness is checked first:
+a join check whose dimension key is not unique cannot run and reports
+``None``, so the report always comes out. Run ``python validate.py`` from
+the app folder to print the report.
+"""
+import pandas as pd
+
+import compute
+import keys
+
+
+def _mismatches(facts, column, dimension, positions):
+    """Rows whose ``column`` differs from the dimension row they point to."""
+    found = positions >= 0
+    expected = keys.take(dimension, positions[found], column)
+    actual = facts[column].array[found]
+    return int((pd.Series(actual) != pd.Series(expected)).sum())
+
+
+def _join_checks(report, dimension_keys, fact_keys, checks):
+    """
+    Run ``checks`` (check name: function of the position map) over the join
+    of ``fact_keys`` onto ``dimension_keys``. Without a unique dimension key
+    there is no join: the checks are reported as ``None`` (not run).
+    """
+    try:
+        positions = keys.position_map(dimension_keys, fact_keys)
+    except ValueError:
+        report.update(dict.fromkeys(checks))
+        return
+    for check, count in checks.items():
+        report[check] = int(count(positions))
+
+
+def validate_keys():
+    career = compute.load_data()
+    profiles = compute.load_players_profiles()
+    top_players = compute.load_top_players()
+    games = compute.load_games_data()
+
+    report = {
+        "career: duplicate PlayerId": int(career["PlayerId"].duplicated().sum()),
+        "profiles: duplicate PlayerId": int(profiles["PlayerId"].duplicated().sum()),
+        "top 5000: duplicate PlayerId": int(top_players["PlayerId"].duplicated().sum()),
+        "games: duplicate GameId": int(games["GameId"].duplicated().sum()),
+        # Not an error, but the reason handles are never used as join keys
+        "career: players sharing a handle": int(career["CurrentHandle"].duplicated(keep=False).sum()),
+    }
+
+    _join_checks(report, profiles["PlayerId"], career["PlayerId"], {
+        "career: PlayerId missing from profiles": lambda rows: (rows < 0).sum(),
+        "career: handle differs from profile": lambda rows: _mismatches(career, "CurrentHandle", profiles, rows),
+    })
+    _join_checks(report, top_players["PlayerId"], career["PlayerId"], {
+        "career: PlayerId missing from top 5000": lambda rows: (rows < 0).sum(),
+    })
+    _join_checks(report, games["GameId"], career["GameId"], {
+        "career: GameId missing from games": lambda rows: (rows < 0).sum(),
+        "career: GameName differs from games": lambda rows: _mismatches(career, "GameName", games, rows),
+    })
+
+    try:
+        tournaments = compute.load_tournaments()
+    except FileNotFoundError:
+        return report
+
+    _join_checks(report, career["PlayerId"], tournaments["PlayerId"], {
+        "tournaments: PlayerId missing from career": lambda rows: (rows < 0).sum(),
+        "tournaments: handle differs from career": lambda rows: _mismatches(tournaments, "CurrentHandle", career, rows),
+    })
+    _join_checks(report, games["GameId"], tournaments["GameId"], {
+        "tournaments: GameId missing from games": lambda rows: (rows < 0).sum(),
+        "tournaments: GameName differs from games": lambda rows: _mismatches(tournaments, "GameName", games, rows),
+    })
+    return report
+
+
+if __name__ == "__main__":
+    for check, count in validate_keys().items():
+        if count is None:
+            print(f"⛔ {check}: not run (join key not unique)")
+        else:
+            print(f"{'✅' if count == 0 else '⚠️'} {check}: {count}")
@@ -0,0 +1,177 @@
+# ===============================================================
+# 🔥 Warm start: memoized results persisted across restarts
+# ===============================================================
+"""
+On-disk copy of the memo.py caches, so a restarted app starts warm.
+
+Each memoized function's entries (loaded and derived frames, aggregates,
+figures) are pickled to ``<WARM_CACHE_DIR>/<module.function>.pkl``
+under a header with two versions:
+
+- the code version: a hash of every ``app/*.py`` file and of the Python,
+  pandas, numpy and plotly versions,
+- the data version: a hash of the contents of every dataset in
+  ``schema.DATASETS``.
+
+``load()`` runs once per process, before the first computation. Files
+whose versions differ from the current ones are stale and deleted. The
+others fill the caches, so the first sessions after a restart get cached
+results. Dataset contents are hashed rather than their mtimes, so a
+redeploy that only rewrites the files keeps the store. The mtime tokens in
+the keys of versioned functions are updated to the current ones.
+
+``save_in_background()`` runs after every full script run. It rewrites,
+in a background thread, the files of the functions that computed new
+entries since the last save. Everything is saved once more at exit.
+Nothing is saved if the datasets were rewritten while the process was
+running (``schema.datasets_version()``, mtimes and sizes, differs from the
+one at load), since its caches may then mix both versions.
+
+The store is a cache: delete the folder at any time. ``WARM_CACHE_DIR``
+moves it (default ``.cache/warmstart`` at the repository root), an empty
+value turns persistence off. Only load stores written by this app (pickle).
+"""
+import atexit
+import hashlib
+import logging
+import os
+import pickle
+import platform
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly
+
+import memo
+import schema
+
+BASE_DIR = Path(__file__).parent
+
+STORE_DIR = os.environ.get("WARM_CACHE_DIR", str(BASE_DIR.parent / ".cache" / "warmstart"))
+
+logger = logging.getLogger(__name__)
+
+
+# ===============================================================
+# 🏷️ Versions
+# ===============================================================
+def code_version():
+    """Hash of the app's source files and of the libraries that build the cached objects."""
+    digest = hashlib.sha1()
+    for path in sorted(BASE_DIR.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    for version in (platform.python_version(), pd.__version__, np.__version__, plotly.__version__):
+        digest.update(version.encode())
+    return digest.hexdigest()
+
+
+def data_version():
+    """Hash of the contents of every dataset the computations read."""
+    digest = hashlib.sha1()
+    for name in schema.DATASETS:
+        path = schema.BASE_DIR / name
+        if path.exists():
+            digest.update(name.encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+# ===============================================================
+# 💾 Store
+# ===============================================================
+_lock = threading.Lock()
+_save_lock = threading.Lock()
+_loaded = False
+_header = None
+# schema.datasets_version() at load: a stat per dataset, cheap to check on every save
+_datasets = None
+# Misses of each function when its file was last written or read
+_saved_misses = {}
+_saving = None
+
+
+def load():
+    """Fill the memo caches from the store, once per process; delete stale files."""
+    global _loaded, _header, _datasets
+    with _lock:
+        if _loaded or not STORE_DIR:
+            return
+        _loaded = True
+        start = time.perf_counter()
+        _datasets = schema.datasets_version()
+        _header = {"code": code_version(), "data": data_version()}
+        atexit.register(save)
+
+        loaded = 0
+        for path in sorted(Path(STORE_DIR).glob("*.pkl")):
+            name = path.stem
+            try:
+                with open(path, "rb") as f:
+                    if pickle.load(f) != _header:
+                        path.unlink()
+                        continue
+                    wrapper = memo._registry.get(name)
+                    if wrapper is None:
+                        # Function of another entry point (api.py), or removed
+                        continue
+                    entries = pickle.load(f)
+            except Exception as error:
+                logger.warning("Warm cache file %s dropped: %s", path.name, error)
+                path.unlink(missing_ok=True)
+                continue
+            if wrapper.version is not None:
+                # Same data contents: give the entries the current mtime token
+                version = wrapper.version()
+                entries = [((version,) + key[1:], value) for key, value in entries]
+            wrapper.cache_fill(entries)
+            _saved_misses[name] = wrapper.stats["misses"]
+            loaded += len(entries)
+        logger.info("Warm cache: %d entries loaded in %.2f s", loaded, time.perf_counter() - start)
+
+
+def save():
+    """Write the file of every function with entries computed since its last save."""
+    if _header is None:
+        return
+    with _save_lock:
+        if schema.datasets_version() != _datasets:
+            logger.info("Warm cache not saved: datasets changed since startup")
+            return
+        store = Path(STORE_DIR)
+        store.mkdir(parents=True, exist_ok=True)
+        for name, wrapper in list(memo._registry.items()):
+            misses = wrapper.stats["misses"]
+            if misses == _saved_misses.get(name, 0):
+                continue
+            entries = wrapper.cache_items()
+            path = store / f"{name}.pkl"
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                with open(tmp, "wb") as f:
+                    pickle.dump(_header, f, pickle.HIGHEST_PROTOCOL)
+                    pickle.dump(entries, f, pickle.HIGHEST_PROTOCOL)
+                # Atomic: a process starting now reads the old file or the new one
+                os.replace(tmp, path)
+            except Exception as error:
+                logger.warning("Warm cache of %s not saved: %s", name, error)
+                tmp.unlink(missing_ok=True)
+                continue
+            _saved_misses[name] = misses
+
+
+def save_in_background():
+    """``save()`` in a daemon thread, unless one is already running or nothing is new."""
+    global _saving
+    if _header is None:
+        return
+    if all(wrapper.stats["misses"] == _saved_misses.get(name, 0) for name, wrapper in list(memo._registry.items())):
+        return
+    with _lock:
+        if _saving is not None and _saving.is_alive():
+            return
+        _saving = threading.Thread(target=save, daemon=True)
+        _saving.start()
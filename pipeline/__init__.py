@@ -0,0 +1,16 @@
+# ===============================================================
+# 🏗️ Ingestion stage
+# ===============================================================
+"""
+Turns the raw API exports in ``data_and_notebooks/`` into the datasets read
+by the dashboard in ``app/``. Derived values (USD amounts, handles, game
+names) are computed here once, so the app and the notebooks never repeat
+them over raw rows.
+
+Run a step from the repository root, e.g. ``python -m pipeline.tournaments``.
+"""
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT_DIR / "data_and_notebooks"
+APP_DIR = ROOT_DIR / "app"
@@ -0,0 +1,123 @@
+# ===============================================================
+# 🌐 EsportsEarnings API client
+# ===============================================================
+"""
+Thin client for the EsportsEarnings API used by the collectors.
+
+The key comes from the ``API_KEY`` environment variable or the repository's
+``.env`` file. ``ESPORTS_API_URL`` points the client at another server
+(e.g. a local stand-in) without touching the collectors.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+import urllib3
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+from pipeline import ROOT_DIR
+
+BASE_URL = os.environ.get("ESPORTS_API_URL", "http://api.esportsearnings.com/v0")
+PAGE_SIZE = 100
+
+# The API's certificate does not verify (the notebooks disabled the warning too)
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
+class TransientAPIError(Exception):
+    """Rate limiting or server-side failure: worth retrying."""
+
+
+class RateLimiter:
+    """Spaces calls at least ``1 / per_second`` apart, shared by every thread."""
+
+    def __init__(self, per_second):
+        self.interval = 1.0 / per_second
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        time.sleep(slot - now)
+
+
+def api_key():
+    if "API_KEY" in os.environ:
+        return os.environ["API_KEY"]
+    env_file = ROOT_DIR / ".env"
+    if env_file.exists():
+        for line in env_file.read_text().splitlines():
+            name, _, value = line.partition("=")
+            if name.strip() == "API_KEY":
+                return value.strip().strip("'\"")
+    raise RuntimeError("API_KEY is not set (environment or .env)")
+
+
+@retry(
+    retry=retry_if_exception_type((TransientAPIError, requests.ConnectionError, requests.Timeout)),
+    wait=wait_exponential(multiplier=1, max=30),
+    stop=stop_after_attempt(5),
+    reraise=True,
+)
+def lookup(session, endpoint, **params):
+    """
+    GET one API endpoint and return its JSON payload.
+
+    The API answers "no data" with a plain string instead of a list; that
+    case is returned as an empty list. 429 and 5xx responses are retried
+    with exponential backoff.
+    """
+    response = session.get(
+        f"{BASE_URL}/{endpoint}",
+        params={"apikey": api_key(), **params},
+        verify=False,
+        timeout=30,
+    )
+    if response.status_code == 429 or response.status_code >= 500:
+        raise TransientAPIError(f"{endpoint} {params}: HTTP {response.status_code}")
+    response.raise_for_status()
+    data = response.json()
+    return [] if isinstance(data, str) else data
+
+
+def paged(session, endpoint, **params):
+    """Yield successive pages of an offset-paged endpoint until a short page."""
+    offset = 0
+    while True:
+        page = lookup(session, endpoint, offset=offset, **params)
+        if page:
+            yield page
+        if len(page) < PAGE_SIZE:
+            return
+        offset += PAGE_SIZE
+
+
+def lookup_many(endpoint, params_list, workers=4, per_second=1.0):
+    """
+    ``lookup`` for every params dict of ``params_list``, run concurrently.
+
+    Each worker thread has its own session; all of them share one rate
+    limit. Yields ``(params, payload)`` in completion order, with the
+    exception as payload when a request failed after its retries.
+    """
+    limiter = RateLimiter(per_second)
+    local = threading.local()
+
+    def fetch(params):
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        limiter.wait()
+        return lookup(local.session, endpoint, **params)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(fetch, params): params for params in params_list}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except Exception as e:
+                yield futures[future], e
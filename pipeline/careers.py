@@ -0,0 +1,111 @@
+# ===============================================================
+# 📅 Career span and status per player
+# ===============================================================
+"""
+Career features derived from the tournament history, one row per player.
+
+``career_features`` replaces the notebook's groupby / merge / ``apply``
+chain: tournaments are sorted once by PlayerId, and the first date, last
+date and tournament count of every player are reduced over its segment.
+Everything else (length, years, status) is a NumPy expression over those
+three arrays.
+
+The three aggregates are mergeable (min, max, count), so
+``update_career_features`` folds new tournaments into an existing table by
+recomputing only the rows of the players that appear in them.
+"""
+import numpy as np
+import pandas as pd
+
+DAYS_PER_YEAR = 365.25
+FEATURE_COLUMNS = [
+    "FirstTournament", "LastTournament", "CareerLengthYears", "CareerStatus",
+    "FirstTournamentYear", "LastTournamentYear", "TotalTournaments",
+]
+
+
+def _aggregate(tournaments):
+    """First day, last day and tournament count per PlayerId (rows without a date are ignored)."""
+    end_dates = pd.to_datetime(tournaments["EndDate"], errors="coerce").to_numpy("datetime64[D]")
+    dated = ~np.isnat(end_dates)
+    player_ids = tournaments["PlayerId"].to_numpy()[dated]
+    days = end_dates[dated].astype(np.int64)
+    if not len(days):
+        # No segment to reduce over: reduceat would fail
+        return pd.DataFrame(
+            {"FirstDay": days, "LastDay": days, "TotalTournaments": np.zeros(0, dtype=np.int64)},
+            index=pd.Index(player_ids, name="PlayerId"),
+        )
+
+    # One stable sort by player; each player is then a contiguous segment
+    order = np.argsort(player_ids, kind="stable")
+    player_ids, days = player_ids[order], days[order]
+    starts = np.flatnonzero(np.r_[True, player_ids[1:] != player_ids[:-1]])
+    ends = np.r_[starts[1:], len(player_ids)]
+
+    return pd.DataFrame(
+        {
+            "FirstDay": np.minimum.reduceat(days, starts),
+            "LastDay": np.maximum.reduceat(days, starts),
+            "TotalTournaments": ends - starts,
+        },
+        index=pd.Index(player_ids[starts], name="PlayerId"),
+    )
+
+
+def _derive(aggregates, cutoff):
+    """Career features from the per-player aggregates."""
+    first = aggregates["FirstDay"].to_numpy().astype("datetime64[D]")
+    last = aggregates["LastDay"].to_numpy().astype("datetime64[D]")
+    cutoff = np.datetime64(pd.Timestamp(cutoff), "D")
+
+    return pd.DataFrame(
+        {
+            "FirstTournament": first.astype("datetime64[ns]"),
+            "LastTournament": last.astype("datetime64[ns]"),
+            "CareerLengthYears": (last - first).astype(np.int64) / DAYS_PER_YEAR,
+            "CareerStatus": np.where(last >= cutoff, "Ongoing", "Inactive"),
+            "FirstTournamentYear": first.astype("datetime64[Y]").astype(np.int64) + 1970,
+            "LastTournamentYear": last.astype("datetime64[Y]").astype(np.int64) + 1970,
+            "TotalTournaments": aggregates["TotalTournaments"].to_numpy(),
+        },
+        index=aggregates.index,
+    )
+
+
+def career_features(tournaments, cutoff="2024-01-01"):
+    """
+    Career span, length in years, status, first / last year and tournament
+    count of every player in ``tournaments`` (columns PlayerId, EndDate).
+
+    A player is "Ongoing" when their last tournament is on or after
+    ``cutoff``, "Inactive" otherwise. Returns a frame indexed by PlayerId.
+    """
+    return _derive(_aggregate(tournaments), cutoff)
+
+
+def update_career_features(features, new_tournaments, cutoff="2024-01-01"):
+    """
+    ``features`` with ``new_tournaments`` folded in.
+
+    Only the players present in ``new_tournaments`` are recomputed; new
+    players are appended. ``new_tournaments`` must not repeat rows already
+    counted in ``features``.
+    """
+    new = _aggregate(new_tournaments)
+    known = new.index.isin(features.index)
+
+    returning = new[known]
+    previous = features.loc[returning.index]
+    merged = pd.DataFrame(
+        {
+            "FirstDay": np.minimum(returning["FirstDay"], previous["FirstTournament"].to_numpy("datetime64[D]").astype(np.int64)),
+            "LastDay": np.maximum(returning["LastDay"], previous["LastTournament"].to_numpy("datetime64[D]").astype(np.int64)),
+            "TotalTournaments": returning["TotalTournaments"] + previous["TotalTournaments"].to_numpy(),
+        },
+        index=returning.index,
+    )
+
+    updated = features.copy()
+    updated.loc[merged.index, FEATURE_COLUMNS] = _derive(merged, cutoff)
+    return pd.concat([updated, _derive(new[~known], cutoff)])
@@ -0,0 +1,115 @@
+# ===============================================================
+# 📥 Streaming tournament collector
+# ===============================================================
+"""
+Collects every player's tournament history straight to Parquet.
+
+Each API page is written as one row group of the player's own file as soon
+as it arrives, so memory stays bounded by a single page however many
+players are crawled. A player's file is written under a hidden temporary
+name and renamed once complete: a crash loses at most the player in
+progress, and a restart skips every player already on disk.
+
+The output directory is a Parquet dataset readable as is
+(``pd.read_parquet(directory)``) — no consolidation step.
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import requests
+
+from pipeline import DATA_DIR, api
+from pipeline.leaderboard import top_players
+
+# Players crawled by default: the top 1000 of the leaderboard
+TOP_PLAYERS = 1000
+TOURNAMENTS_DIR = DATA_DIR / "players_tournaments"
+
+# Fixed schema, so every player file belongs to the same dataset
+TOURNAMENT_SCHEMA = pa.schema([
+    ("RankText", pa.string()),
+    ("Prize", pa.float64()),
+    ("ExchangeRate", pa.float64()),
+    ("CurrencyCode", pa.string()),
+    ("TournamentName", pa.string()),
+    ("EndDate", pa.string()),
+    ("GameId", pa.int64()),
+    ("Note", pa.string()),
+    ("TeamPlayers", pa.int64()),
+    ("PlayerId", pa.int64()),
+])
+
+
+def player_file(out_dir, player_id):
+    return Path(out_dir) / f"player-{player_id}.parquet"
+
+
+def _page_table(page, player_id):
+    """One API page as an Arrow table in TOURNAMENT_SCHEMA."""
+    columns = []
+    for field in TOURNAMENT_SCHEMA:
+        if field.name == "PlayerId":
+            values = [player_id] * len(page)
+        else:
+            values = [row.get(field.name) for row in page]
+        columns.append(pa.array(values).cast(field.type))
+    return pa.Table.from_arrays(columns, schema=TOURNAMENT_SCHEMA)
+
+
+def collect_player(session, player_id, out_dir):
+    """Stream one player's pages into their Parquet file; return the row count."""
+    path = player_file(out_dir, player_id)
+    partial = path.with_name(f".{path.name}.partial")  # hidden: ignored by dataset readers
+
+    rows = 0
+    with pq.ParquetWriter(partial, TOURNAMENT_SCHEMA) as writer:
+        for page in api.paged(session, "LookupPlayerTournaments", playerid=player_id):
+            writer.write_table(_page_table(page, player_id))
+            rows += len(page)
+    os.replace(partial, path)
+    return rows
+
+
+def collect(player_ids, out_dir=TOURNAMENTS_DIR, delay=1.0):
+    """
+    Collect the tournaments of every player not already on disk.
+
+    Returns ``{"collected": n, "skipped": n, "rows": n, "failed": [ids]}``.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    summary = {"collected": 0, "skipped": 0, "rows": 0, "failed": []}
+
+    with requests.Session() as session:
+        for player_id in player_ids:
+            if player_file(out_dir, player_id).exists():
+                summary["skipped"] += 1
+                continue
+            try:
+                summary["rows"] += collect_player(session, player_id, out_dir)
+                summary["collected"] += 1
+            except Exception as e:
+                print(f"❌ Error for player {player_id}: {e}")
+                summary["failed"].append(player_id)
+            time.sleep(delay)  # Respectful delay
+    return summary
+
+
+def read_tournaments(out_dir=TOURNAMENTS_DIR):
+    """The collected tournaments as one DataFrame (reads the dataset in place)."""
+    return pd.read_parquet(out_dir, engine="pyarrow")
+
+
+if __name__ == "__main__":
+    # python -m pipeline.collector [players.csv] [out_dir]
+    players = pd.read_csv(sys.argv[1]) if len(sys.argv) > 1 else top_players(TOP_PLAYERS)
+    out_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else TOURNAMENTS_DIR
+    player_ids = players["PlayerId"].tolist()
+    summary = collect(player_ids, out_dir)
+    print(f"✅ {summary['collected']} players collected ({summary['rows']:,} tournaments), "
+          f"{summary['skipped']} already on disk, {len(summary['failed'])} failed")
@@ -0,0 +1,54 @@
+# ===============================================================
+# 💱 Currency normalization
+# ===============================================================
+"""
+USD conversion of raw tournament rows, done once at ingestion.
+
+The API reports each prize in its original currency with the exchange rate
+of the tournament date. ``normalize_currency`` stores the USD prize and the
+per-player split as float64 columns and replaces the repeated currency code
+strings with a small integer id into a currency dimension table.
+"""
+import numpy as np
+import pandas as pd
+
+
+def normalize_currency(raw):
+    """
+    Return ``(tournaments, currencies)``.
+
+    ``tournaments`` is ``raw`` with USDPrize (Prize × ExchangeRate),
+    USDPrizePerPlayer (USDPrize / TeamPlayers) and CurrencyId in place of
+    CurrencyCode. ``currencies`` has one row per currency code.
+    """
+    tournaments = raw.copy(deep=False)
+    prize = tournaments["Prize"].to_numpy(dtype=np.float64)
+    rate = tournaments["ExchangeRate"].to_numpy(dtype=np.float64)
+
+    # Solo results have no team size; never split by less than one player
+    team_players = tournaments["TeamPlayers"].to_numpy(dtype=np.float64)
+    team_players = np.where(np.isnan(team_players) | (team_players < 1), 1.0, team_players)
+
+    tournaments["USDPrize"] = prize * rate
+    tournaments["USDPrizePerPlayer"] = tournaments["USDPrize"] / team_players
+
+    # Clean the distinct codes only, then map every row through its code
+    raw_codes = tournaments.pop("CurrencyCode").astype("category")
+    clean = raw_codes.cat.categories.str.strip().str.upper()
+    currency_codes = pd.Index(sorted(set(clean)))
+    row_codes = raw_codes.cat.codes.to_numpy()
+    currency_ids = currency_codes.get_indexer(clean)[row_codes]
+    tournaments["CurrencyId"] = np.where(row_codes >= 0, currency_ids, -1).astype(np.int16)
+
+    currencies = pd.DataFrame({
+        "CurrencyId": np.arange(len(currency_codes), dtype=np.int16),
+        "CurrencyCode": currency_codes,
+    })
+    summary = tournaments.groupby("CurrencyId").agg(
+        Tournaments=("USDPrize", "size"),
+        USDPrize=("USDPrize", "sum"),
+        MinRate=("ExchangeRate", "min"),
+        MaxRate=("ExchangeRate", "max"),
+    )
+    currencies = currencies.join(summary, on="CurrencyId")
+    return tournaments, currencies
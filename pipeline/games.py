@@ -0,0 +1,104 @@
+# ===============================================================
+# 🎮 Game registry
+# ===============================================================
+"""
+Game metadata for every GameId seen in the tournaments.
+
+- ``games_cache.csv`` keeps the API record of every game ever fetched.
+  Games are never fetched twice; unknown ids are fetched concurrently
+  (one session per worker, one shared rate limit) and appended to the
+  cache as they arrive.
+- ``game_types.csv`` is the GameType of every game, keyed by GameId. Each
+  row carries the mapping version that added or last changed it; the
+  table's version is the highest of them. It replaces the hand-written
+  ``game_type_mapping`` dict of the collector notebook.
+
+``enrich_games`` is called by the tournaments build, so a new game shows
+up in ``app/games_metadata_enriched.csv`` as soon as one of its
+tournaments is ingested. A game with no row in the type table is left out
+of that file (and reported) until one is added.
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from pipeline import APP_DIR, DATA_DIR, api
+
+CACHE_FILE = DATA_DIR / "games_cache.csv"
+TYPES_FILE = Path(__file__).parent / "game_types.csv"
+GAMES_FILE = APP_DIR / "games_metadata_enriched.csv"
+
+METADATA_COLUMNS = ["GameName", "TotalUSDPrize", "TotalTournaments", "TotalPlayers", "GameId"]
+
+
+def load_cache(cache_file=CACHE_FILE):
+    if not Path(cache_file).exists():
+        return pd.DataFrame(columns=METADATA_COLUMNS)
+    return pd.read_csv(cache_file)
+
+
+def load_types(types_file=TYPES_FILE):
+    """``(version, types)``: the mapping version and its GameId -> GameType series."""
+    table = pd.read_csv(types_file)
+    types = table.set_index("GameId")["GameType"]
+    return int(table["Version"].max()), types
+
+
+def fetch_games(game_ids, cache_file=CACHE_FILE, workers=4, per_second=1.0):
+    """
+    Fetch ``game_ids`` from the API and append each record to the cache.
+
+    Returns ``{"fetched": [ids], "not_found": [ids], "failed": [ids]}``.
+    """
+    summary = {"fetched": [], "not_found": [], "failed": []}
+    if not game_ids:
+        return summary
+
+    cache_file = Path(cache_file)
+    params_list = [{"gameid": game_id} for game_id in game_ids]
+
+    for params, record in api.lookup_many("LookupGameById", params_list, workers, per_second):
+        game_id = params["gameid"]
+        if isinstance(record, Exception):
+            print(f"❌ Error for GameId {game_id}: {record}")
+            summary["failed"].append(game_id)
+            continue
+        if not record:
+            summary["not_found"].append(game_id)
+            continue
+        row = pd.DataFrame([{**record, "GameId": game_id}]).reindex(columns=METADATA_COLUMNS)
+        row.to_csv(cache_file, mode="a", header=not cache_file.exists(), index=False)
+        summary["fetched"].append(game_id)
+    return summary
+
+
+def enrich_games(game_ids, cache_file=CACHE_FILE, types_file=TYPES_FILE, output_file=GAMES_FILE):
+    """
+    Make sure every id of ``game_ids`` is in the cache, then write the
+    typed games table for the app. Returns that table.
+    """
+    known = set(load_cache(cache_file)["GameId"])
+    unknown = sorted({int(game_id) for game_id in pd.Series(game_ids).dropna()} - known)
+    if unknown:
+        summary = fetch_games(unknown, cache_file)
+        print(f"✅ {len(summary['fetched'])} new games cached, "
+              f"{len(summary['not_found'])} not found, {len(summary['failed'])} failed")
+
+    games = load_cache(cache_file).drop_duplicates("GameId")
+    version, types = load_types(types_file)
+    games["GameType"] = games["GameId"].map(types)
+
+    untyped = games[games["GameType"].isna()]
+    for game_id, name in zip(untyped["GameId"], untyped["GameName"]):
+        print(f"⚠️ No GameType for GameId {game_id} ({name}): add it to {Path(types_file).name}")
+
+    games = games.dropna(subset=["GameType"])
+    games.to_csv(output_file, index=False)
+    print(f"✅ {len(games)} games saved to {output_file} (type mapping v{version})")
+    return games
+
+
+if __name__ == "__main__":
+    # python -m pipeline.games [GameId ...]
+    enrich_games([int(game_id) for game_id in sys.argv[1:]])
@@ -0,0 +1,59 @@
+# ===============================================================
+# 🖼️ Image variants for the dashboard
+# ===============================================================
+"""
+Resized, recompressed copies of the app images in ``app/static/``.
+
+Every source image gets one WebP and one JPEG file per target width
+(never upscaled), named ``<stem>-<width>.<ext>``. The app shows them
+through ``app/assets.py``: the browser picks the format and the smallest
+width covering the slot the image is displayed in. The originals stay as
+the sources of this step.
+
+AVIF is not generated: Streamlit's static file server sends it as
+``text/plain``.
+
+Run ``python -m pipeline.images`` after adding or replacing an image.
+"""
+from PIL import Image
+
+from pipeline import APP_DIR
+
+SOURCE_IMAGES = ("intro1.jpg", "intro5.jpg", "game_examples.png")
+STATIC_DIR = APP_DIR / "static"
+
+WIDTHS = (640, 960, 1280, 1920)
+FORMATS = {
+    "webp": dict(format="WEBP", quality=75, method=6),
+    "jpg": dict(format="JPEG", quality=80, optimize=True, progressive=True),
+}
+
+
+def build_variants(name, source_dir=APP_DIR, output_dir=STATIC_DIR):
+    """Write every variant of one image; return ``{file name: bytes}``."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    sizes = {}
+    with Image.open(source_dir / name) as image:
+        image = image.convert("RGB")
+        for width in WIDTHS:
+            if width > image.width:
+                continue
+            height = round(image.height * width / image.width)
+            resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+            for extension, options in FORMATS.items():
+                path = output_dir / f"{(source_dir / name).stem}-{width}.{extension}"
+                resized.save(path, **options)
+                sizes[path.name] = path.stat().st_size
+    return sizes
+
+
+def build_images():
+    for name in SOURCE_IMAGES:
+        original = (APP_DIR / name).stat().st_size
+        sizes = build_variants(name)
+        print(f"✅ {name} ({original / 1024:,.0f} KiB): "
+              + ", ".join(f"{file} {size / 1024:,.0f} KiB" for file, size in sizes.items()))
+
+
+if __name__ == "__main__":
+    build_images()
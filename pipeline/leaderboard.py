@@ -0,0 +1,64 @@
+# ===============================================================
+# 🥇 Highest-earning players leaderboard
+# ===============================================================
+"""
+One ranked table of the top N players, fetched from
+``LookupHighestEarningPlayers``.
+
+The N / 100 pages are independent offsets, so they are requested
+concurrently under one rate limit and put back in offset order. Rank is
+the row's position in that order. Every top-k view (the collector's top
+1000, the dashboard's top 5000) is a ``Rank <= k`` filter of this table,
+never a second crawl.
+"""
+import sys
+
+import pandas as pd
+
+from pipeline import APP_DIR, api
+
+LEADERBOARD_FILE = APP_DIR / "leaderboard.csv"
+MAX_PLAYERS = 50_000
+
+PLAYER_COLUMNS = ["PlayerId", "NameFirst", "NameLast", "CurrentHandle", "CountryCode", "TotalUSDPrize"]
+
+
+def fetch_leaderboard(n, workers=4, per_second=1.0):
+    """The top ``n`` players (at most MAX_PLAYERS) with their Rank."""
+    if not 0 < n <= MAX_PLAYERS:
+        raise ValueError(f"n must be between 1 and {MAX_PLAYERS:,}")
+
+    offsets = range(0, n, api.PAGE_SIZE)
+    pages = {}
+    for params, page in api.lookup_many(
+        "LookupHighestEarningPlayers", [{"offset": offset} for offset in offsets], workers, per_second
+    ):
+        if isinstance(page, Exception):
+            raise RuntimeError(f"Leaderboard page at offset {params['offset']} failed") from page
+        pages[params["offset"]] = page
+
+    rows = [row for offset in offsets for row in pages[offset]]
+    players = pd.DataFrame(rows).reindex(columns=PLAYER_COLUMNS)
+    # The ranking can shift while pages are read: keep each player's best rank,
+    # then cut, so a duplicate does not push out the last of the n players
+    players = players.drop_duplicates("PlayerId", ignore_index=True).head(n)
+    players.insert(0, "Rank", players.index + 1)
+    return players
+
+
+def top_players(k, leaderboard_file=LEADERBOARD_FILE):
+    """The top ``k`` rows of the saved leaderboard."""
+    players = pd.read_csv(leaderboard_file)
+    return players[players["Rank"] <= k]
+
+
+def build_leaderboard(n=5000, output_file=LEADERBOARD_FILE):
+    players = fetch_leaderboard(n)
+    players.to_csv(output_file, index=False)
+    print(f"✅ Top {len(players):,} players saved to {output_file}")
+    return players
+
+
+if __name__ == "__main__":
+    # python -m pipeline.leaderboard [N]
+    build_leaderboard(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,242 @@
+# ===============================================================
+# 🧪 Local stand-in for the EsportsEarnings API
+# ===============================================================
+"""
+Serves the four endpoints used by the collectors from recorded fixtures
+or synthetic data, so ingestion can run, be tested and be benchmarked
+offline:
+
+- ``LookupHighestEarningPlayers`` (offset paging),
+- ``LookupPlayerById``,
+- ``LookupPlayerTournaments`` (offset paging),
+- ``LookupGameById``.
+
+Latency, injected errors (HTTP 503) and a rate limit (HTTP 429 above
+``rate_limit`` requests per second) are configurable. Injected errors come
+from a seeded generator, so a single-threaded run fails on the same
+requests every time. ``GET /_stats`` returns the request counters.
+
+Point the client at it with ``ESPORTS_API_URL``::
+
+    python -m pipeline.standin --port 8800 --latency 0.2 --error-rate 0.1
+    ESPORTS_API_URL=http://127.0.0.1:8800/v0 python -m pipeline.collector
+"""
+import argparse
+import contextlib
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+from pipeline import APP_DIR, DATA_DIR
+from pipeline.api import PAGE_SIZE
+from pipeline.games import CACHE_FILE
+from pipeline.leaderboard import LEADERBOARD_FILE, PLAYER_COLUMNS
+
+TOURNAMENTS_FIXTURE = DATA_DIR / "players_tournaments_extended.csv"
+PROFILES_FIXTURE = APP_DIR / "players_profiles_with_id.csv"
+
+# What the API answers instead of an empty list
+NO_DATA = "No data"
+
+
+def _records(df):
+    """JSON-ready rows (missing values as null)."""
+    return df.astype(object).where(df.notna(), None).to_dict("records")
+
+
+def _by_id(df, key):
+    """``{key value: [rows without the key]}``, rows in file order."""
+    grouped = {}
+    for value, record in zip(df[key].tolist(), _records(df.drop(columns=key))):
+        grouped.setdefault(int(value), []).append(record)
+    return grouped
+
+
+def build_fixtures(players, profiles, tournaments, games):
+    """The lookup tables served by the stand-in, from four frames keyed by PlayerId / GameId."""
+    return {
+        "players": _records(players[PLAYER_COLUMNS]),
+        "profiles": {player_id: rows[0] for player_id, rows in _by_id(profiles, "PlayerId").items()},
+        "tournaments": _by_id(tournaments, "PlayerId"),
+        "games": {game_id: rows[0] for game_id, rows in _by_id(games, "GameId").items()},
+    }
+
+
+def recorded_fixtures(tournaments_file=TOURNAMENTS_FIXTURE):
+    """Fixtures from the files already in the repository."""
+    return build_fixtures(
+        players=pd.read_csv(LEADERBOARD_FILE),
+        profiles=pd.read_csv(PROFILES_FIXTURE),
+        # The API sends prizes as text ("240.0000"): served exactly as recorded
+        tournaments=pd.read_csv(tournaments_file, dtype={"Prize": str}),
+        games=pd.read_csv(CACHE_FILE),
+    )
+
+
+def synthetic_fixtures(n_players=5000, n_games=50, tournaments_per_player=40, seed=0):
+    """Random but reproducible fixtures of any size."""
+    rng = np.random.default_rng(seed)
+    player_ids = np.arange(1, n_players + 1)
+    prizes = np.sort(rng.pareto(1.2, n_players) * 10_000)[::-1].round(2)
+    players = pd.DataFrame({
+        "PlayerId": player_ids,
+        "NameFirst": "First",
+        "NameLast": "Last",
+        "CurrentHandle": [f"Player{player_id}" for player_id in player_ids],
+        "CountryCode": rng.choice(["us", "kr", "cn", "fr", "se", "br"], n_players),
+        "TotalUSDPrize": prizes,
+    })
+    counts = rng.poisson(tournaments_per_player, n_players)
+    profiles = players.assign(
+        WorldRanking=player_ids,
+        CountryRanking=players.groupby("CountryCode").cumcount() + 1,
+        TotalTournaments=counts,
+    )
+
+    n_rows = int(counts.sum())
+    tournaments = pd.DataFrame({
+        "RankText": rng.choice(["1st", "2nd", "3rd", "5th - 8th"], n_rows),
+        "Prize": rng.gamma(1.0, 2_000, n_rows).round(4),
+        "ExchangeRate": 1.0,
+        "CurrencyCode": "USD",
+        "TournamentName": [f"Tournament {i}" for i in range(n_rows)],
+        "EndDate": (np.datetime64("2000-01-01") + rng.integers(0, 9000, n_rows)).astype(str),
+        "GameId": rng.integers(1, n_games + 1, n_rows),
+        "Note": None,
+        "TeamPlayers": rng.integers(1, 6, n_rows),
+        "PlayerId": np.repeat(player_ids, counts),
+    })
+    games = pd.DataFrame({
+        "GameName": [f"Game {game_id}" for game_id in range(1, n_games + 1)],
+        "TotalUSDPrize": rng.gamma(1.0, 1e6, n_games).round(2),
+        "TotalTournaments": rng.integers(1, 2_000, n_games),
+        "TotalPlayers": rng.integers(1, 10_000, n_games),
+        "GameId": np.arange(1, n_games + 1),
+    })
+    return build_fixtures(players, profiles, tournaments, games)
+
+
+class StandInServer(ThreadingHTTPServer):
+    """HTTP server answering like the API, with configurable failure modes."""
+
+    daemon_threads = True
+
+    def __init__(self, fixtures, port=8800, latency=0.0, error_rate=0.0, rate_limit=None, seed=0):
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.fixtures = fixtures
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.stats = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = rate_limit or 0.0
+        self._refilled = time.monotonic()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/v0"
+
+    def counters(self):
+        with self._lock:
+            return dict(self.stats)
+
+    def admit(self, endpoint):
+        """HTTP status forced on this request (429, 503), or None to serve it."""
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats[endpoint] += 1
+            if self.rate_limit:
+                # Token bucket: ``rate_limit`` requests per second, bursts of as many
+                now = time.monotonic()
+                self._tokens = min(self.rate_limit, self._tokens + (now - self._refilled) * self.rate_limit)
+                self._refilled = now
+                if self._tokens < 1:
+                    self.stats["throttled"] += 1
+                    return 429
+                self._tokens -= 1
+            if self._random.random() < self.error_rate:
+                self.stats["errors"] += 1
+                return 503
+        return None
+
+    def answer(self, endpoint, params):
+        """The JSON payload of one endpoint, or None for an unknown endpoint."""
+        offset = int(params.get("offset", 0))
+        if endpoint == "LookupHighestEarningPlayers":
+            return self.fixtures["players"][offset:offset + PAGE_SIZE] or NO_DATA
+        if endpoint == "LookupPlayerById":
+            return self.fixtures["profiles"].get(int(params["playerid"]), NO_DATA)
+        if endpoint == "LookupPlayerTournaments":
+            rows = self.fixtures["tournaments"].get(int(params["playerid"]), [])
+            return rows[offset:offset + PAGE_SIZE] or NO_DATA
+        if endpoint == "LookupGameById":
+            return self.fixtures["games"].get(int(params["gameid"]), NO_DATA)
+        return None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/_stats":
+            return self._send(200, self.server.counters())
+
+        endpoint = url.path.rsplit("/", 1)[-1]
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+        status = self.server.admit(endpoint)
+        if status:
+            return self._send(status)
+        time.sleep(self.server.latency)
+        payload = self.server.answer(endpoint, params)
+        if payload is None:
+            return self._send(404, f"Unknown endpoint {endpoint}")
+        self._send(200, payload)
+
+
+@contextlib.contextmanager
+def serve(fixtures=None, **config):
+    """Run a stand-in in a background thread for the duration of a ``with`` block."""
+    server = StandInServer(fixtures or recorded_fixtures(), **config)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for the EsportsEarnings API")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every answer")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered 503")
+    parser.add_argument("--rate-limit", type=float, default=None, help="requests per second before 429")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--synthetic", type=int, metavar="N", help="serve N synthetic players instead of the fixtures")
+    args = parser.parse_args()
+
+    fixtures = synthetic_fixtures(args.synthetic, seed=args.seed) if args.synthetic else recorded_fixtures()
+    server = StandInServer(
+        fixtures, args.port, args.latency, args.error_rate, args.rate_limit, args.seed
+    )
+    print(f"✅ Stand-in API on {server.url}")
+    server.serve_forever()
@@ -0,0 +1,56 @@
+# ===============================================================
+# 🏆 Tournament history for the dashboard
+# ===============================================================
+"""
+Builds ``app/tournaments_corrected_with_handles_and_games.csv`` from the
+raw tournaments of the collector (its Parquet dataset directory, or a
+merged CSV export):
+
+- USD prize and per-player split, normalized once (see currency.py),
+- CurrentHandle and GameName attached by PlayerId / GameId (GameIds not
+  yet in the game registry are fetched and typed first, see games.py),
+- a currency dimension table written next to it.
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from pipeline import APP_DIR
+from pipeline.collector import TOURNAMENTS_DIR
+from pipeline.currency import normalize_currency
+from pipeline.games import GAMES_FILE, enrich_games
+
+RAW_TOURNAMENTS = TOURNAMENTS_DIR
+TOURNAMENTS_FILE = "tournaments_corrected_with_handles_and_games.csv"
+CURRENCIES_FILE = "currencies.csv"
+
+
+def read_raw_tournaments(raw_path):
+    raw_path = Path(raw_path)
+    if raw_path.is_dir():
+        return pd.read_parquet(raw_path, engine="pyarrow")
+    return pd.read_csv(raw_path)
+
+
+def build_tournaments(raw_path=RAW_TOURNAMENTS, output_dir=APP_DIR):
+    raw = read_raw_tournaments(raw_path)
+    tournaments, currencies = normalize_currency(raw)
+
+    profiles = pd.read_csv(APP_DIR / "players_profiles_with_id.csv", usecols=["PlayerId", "CurrentHandle"])
+    output_dir = Path(output_dir)
+    games = enrich_games(tournaments["GameId"], output_file=output_dir / GAMES_FILE.name)[["GameId", "GameName"]]
+    tournaments = (
+        tournaments
+        .merge(profiles, on="PlayerId", how="left")
+        .merge(games, on="GameId", how="left")
+    )
+
+    tournaments.to_csv(output_dir / TOURNAMENTS_FILE, index=False)
+    currencies.to_csv(output_dir / CURRENCIES_FILE, index=False)
+    print(f"✅ {len(tournaments):,} tournaments and {len(currencies)} currencies saved to {output_dir}")
+    return tournaments, currencies
+
+
+if __name__ == "__main__":
+    build_tournaments(*sys.argv[1:])
@@ -0,0 +1,96 @@
+"""
+Rerun cost of every widget state, with the slide computations uncached.
+
+For each widget state (the ones of test_figures.py), the script is rerun
+with every memoized function cleared except the dataset loaders
+(``load_*``). That is the work a rerun does the first time a state is
+seen. Best of ``--repeat`` runs per state, summed over all states.
+
+Each app folder runs in its own process, so two versions of the app can
+be compared side by side:
+
+    git worktree add /tmp/before <revision>
+    python tests/bench_reruns.py /tmp/before/app app
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).parent
+
+
+def _states(at):
+    """(name, setter) for the default state and every selectbox, radio and checkbox state."""
+    yield "default", lambda: None
+    for kind in ("selectbox", "radio"):
+        for i in range(len(getattr(at, kind))):
+            for option in getattr(at, kind)[i].options:
+                yield f"{kind}{i}={option}", lambda kind=kind, i=i, option=option: getattr(at, kind)[i].set_value(option)
+    for i in range(len(at.checkbox)):
+        yield f"checkbox{i}", lambda i=i: at.checkbox[i].check()
+
+
+def measure(app_dir, repeat):
+    """Best rerun time (seconds) of each widget state of the app in ``app_dir``."""
+    from streamlit.testing.v1 import AppTest
+
+    sys.path.insert(0, str(app_dir))
+    import memo
+
+    at = AppTest.from_file(str(app_dir / "streamlit_app.py"), default_timeout=300)
+    at.run()
+    # Registered on import, during the first run
+    computed = [wrapper for name, wrapper in memo._registry.items() if not name.rsplit(".", 1)[-1].startswith("load_")]
+    times = {}
+    for name, _ in list(_states(at)):
+        best = float("inf")
+        for _ in range(repeat):
+            at = AppTest.from_file(str(app_dir / "streamlit_app.py"), default_timeout=300)
+            at.run()
+            setter = dict(_states(at))[name]
+            setter()
+            for wrapper in computed:
+                wrapper.cache_clear()
+            start = time.perf_counter()
+            at.run()
+            best = min(best, time.perf_counter() - start)
+        times[name] = best
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uncached rerun time of every widget state")
+    parser.add_argument("apps", nargs="*", default=[str(TESTS_DIR.parent / "app")], help="app folders to compare")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per state (best is kept)")
+    parser.add_argument("--measure", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(Path(args.measure).resolve(), args.repeat)))
+        return
+
+    env = {**os.environ, "METRICS_PORT": "0", "WARM_CACHE_DIR": ""}
+    results = []
+    for app in args.apps:
+        output = subprocess.run(
+            [sys.executable, __file__, "--measure", str(Path(app).resolve()), "--repeat", str(args.repeat)],
+            capture_output=True, text=True, check=True, env=env, cwd=app,
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    states = list(dict.fromkeys(name for times in results for name in times))
+    width = max(len(name) for name in states)
+    print(f"{'state':{width}s} " + " ".join(f"{Path(app).resolve().parent.name[:12]:>12s}" for app in args.apps))
+    for name in states:
+        print(f"{name:{width}s} " + " ".join(
+            f"{times[name] * 1000:9.1f} ms" if name in times else f"{'–':>12s}" for times in results
+        ))
+    print(f"{'total':{width}s} " + " ".join(f"{sum(times.values()) * 1000:9.1f} ms" for times in results))
+
+
+if __name__ == "__main__":
+    main()
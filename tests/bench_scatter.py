@@ -0,0 +1,82 @@
+"""
+Build and payload cost of the slide 4 scatter, one point per player or binned.
+
+Players are resampled (with replacement) from the career dataset to each
+size, and charts.careers_scatter() is built with ``binned=False`` and
+``binned=True``. For each view: markers sent, median build time, median
+``fig.to_json()`` time, JSON payload, and the median time of the figure
+validation st.plotly_chart runs on every rerun. No browser is involved.
+
+These numbers back charts.SCATTERGL_MIN_POINTS and BINNED_MIN_POINTS:
+
+    python tests/bench_scatter.py
+    python tests/bench_scatter.py --sizes 1000 20000 --repeat 3
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).parent.parent / "app"
+
+
+def _median_time(function, repeat):
+    """Median wall time (seconds) of ``function()`` over ``repeat`` runs, and its last result."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def measure(sizes, repeat, seed=0):
+    """One row per (size, view): markers, build / to_json / validate seconds, payload bytes."""
+    sys.path.insert(0, str(APP_DIR))
+    import plotly.tools
+
+    import charts
+    import compute
+
+    career_df = compute.load_career_df()
+    median_career_length = career_df["CareerLengthYears"].median()
+    for size in sizes:
+        sample = career_df.sample(size, replace=True, random_state=seed)
+        # Same order as compute.load_career_df()
+        sample = sample.sort_values(by=["CareerLengthYears", "CompressedTournaments"]).reset_index(drop=True)
+        for view, binned in (("points", False), ("binned", True)):
+            build, fig = _median_time(lambda: charts.careers_scatter(sample, median_career_length, binned=binned), repeat)
+            to_json, payload = _median_time(fig.to_json, repeat)
+            validate, _ = _median_time(
+                lambda: plotly.tools.return_figure_from_figure_or_data(fig, validate_figure=True), repeat
+            )
+            yield {
+                "players": size,
+                "view": view,
+                "markers": sum(len(trace.x) for trace in fig.data),
+                "build": build,
+                "to_json": to_json,
+                "validate": validate,
+                "payload": len(payload.encode()),
+            }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Slide 4 scatter cost by number of players")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 5_000, 50_000], help="players per sample")
+    parser.add_argument("--repeat", type=int, default=7, help="runs per measure (median is kept)")
+    parser.add_argument("--seed", type=int, default=0, help="resampling seed")
+    args = parser.parse_args()
+
+    print(f"{'players':>8s}  {'view':6s}  {'markers':>7s}  {'build':>7s}  {'to_json':>7s}  {'validate':>8s}  {'payload':>9s}")
+    for row in measure(args.sizes, args.repeat, args.seed):
+        print(
+            f"{row['players']:8,d}  {row['view']:6s}  {row['markers']:7,d}  "
+            f"{row['build'] * 1000:4.0f} ms  {row['to_json'] * 1000:4.0f} ms  {row['validate'] * 1000:5.0f} ms  "
+            f"{row['payload'] / 1024:5.0f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""App modules are imported top-level (``import compute``), as in app/."""
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+APP_DIR = ROOT / "app"
+
+sys.path[:0] = [str(APP_DIR), str(ROOT)]
+
+# No metrics endpoint and no warm-start store during tests
+os.environ.setdefault("METRICS_PORT", "0")
+os.environ.setdefault("WARM_CACHE_DIR", "")
+
+RAW_TOURNAMENTS = ROOT / "data_and_notebooks" / "players_tournaments_extended.csv"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def tournaments_dataset(tmp_path_factory):
+    """The tournament history is built, not committed: build it from the raw export if missing."""
+    from pipeline.tournaments import TOURNAMENTS_FILE, build_tournaments
+
+    path = APP_DIR / TOURNAMENTS_FILE
+    if not path.exists():
+        # Built aside: the pipeline also rewrites the games table next to its output
+        output_dir = tmp_path_factory.mktemp("pipeline")
+        build_tournaments(RAW_TOURNAMENTS, output_dir)
+        shutil.copy(output_dir / TOURNAMENTS_FILE, path)
+    return path
+
+
+@pytest.fixture
+def datasets(tmp_path, monkeypatch):
+    """A copy of the datasets the app reads, in place of app/ (for tests that rewrite them)."""
+    import memo
+    import schema
+
+    for name in schema.DATASETS:
+        if (schema.BASE_DIR / name).exists():
+            shutil.copy(schema.BASE_DIR / name, tmp_path / name)
+    monkeypatch.setattr(schema, "BASE_DIR", tmp_path)
+    memo.clear_all()
+    yield tmp_path
+    memo.clear_all()
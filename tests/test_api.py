@@ -0,0 +1,54 @@
+"""JSON API: status codes, conditional requests, gzip ETags and HEAD."""
+import gzip
+import json
+
+from tornado.testing import AsyncHTTPTestCase
+
+import api
+
+
+class EndpointTest(AsyncHTTPTestCase):
+    def get_app(self):
+        return api.make_app()
+
+    def fetch(self, path, **kwargs):
+        # The test client asks for gzip unless told otherwise
+        return super().fetch(path, decompress_response=False, **kwargs)
+
+    def test_ok(self):
+        response = self.fetch("/v1/games/top?game_type=All")
+        assert response.code == 200
+        assert response.headers["Content-Type"] == "application/json"
+        assert json.loads(response.body)["game_type"] == "All"
+
+    def test_unknown_parameter_value(self):
+        assert self.fetch("/v1/games/top?game_type=Chess960").code == 400
+
+    def test_not_modified(self):
+        etag = self.fetch("/v1/countries").headers["ETag"]
+        response = self.fetch("/v1/countries", headers={"If-None-Match": etag})
+        assert response.code == 304
+        assert response.body == b""
+
+    def test_gzip_has_its_own_etag(self):
+        plain = self.fetch("/v1/countries")
+        zipped = self.fetch("/v1/countries", headers={"Accept-Encoding": "gzip"})
+        assert zipped.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(zipped.body) == plain.body
+        assert zipped.headers["ETag"] == plain.headers["ETag"][:-1] + '-gzip"'
+        # An ETag only matches the encoding it was issued for
+        response = self.fetch(
+            "/v1/countries", headers={"Accept-Encoding": "gzip", "If-None-Match": zipped.headers["ETag"]}
+        )
+        assert response.code == 304
+        assert self.fetch("/v1/countries", headers={"If-None-Match": zipped.headers["ETag"]}).code == 200
+
+    def test_head(self):
+        get = self.fetch("/v1/countries")
+        head = self.fetch("/v1/countries", method="HEAD")
+        assert head.code == 200
+        assert head.body == b""
+        assert head.headers["ETag"] == get.headers["ETag"]
+        assert head.headers["Content-Type"] == "application/json"
+        assert self.fetch("/v1/countries", method="HEAD", headers={"If-None-Match": get.headers["ETag"]}).code == 304
+        assert self.fetch("/v1/games/top?game_type=Chess960", method="HEAD").code == 400
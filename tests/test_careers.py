@@ -0,0 +1,37 @@
+"""Career features: empty input, and incremental folds equal to a full rebuild."""
+import numpy as np
+import pandas as pd
+import pandas.testing as tm
+import pytest
+
+from pipeline.careers import FEATURE_COLUMNS, career_features, update_career_features
+
+
+@pytest.fixture
+def tournaments():
+    rng = np.random.default_rng(0)
+    dates = pd.Timestamp("2015-01-01") + pd.to_timedelta(rng.integers(0, 3650, 500), unit="D")
+    end_dates = pd.Series(dates.strftime("%Y-%m-%d"), dtype=object)
+    end_dates[rng.random(500) < 0.05] = None
+    return pd.DataFrame({"PlayerId": rng.integers(1, 60, 500), "EndDate": end_dates})
+
+
+def test_empty_tournaments(tournaments):
+    features = career_features(tournaments.iloc[:0])
+    assert features.empty
+    assert list(features.columns) == FEATURE_COLUMNS
+    assert features.index.name == "PlayerId"
+
+
+def test_empty_batch(tournaments):
+    features = career_features(tournaments)
+    tm.assert_frame_equal(update_career_features(features, tournaments.iloc[:0]), features)
+
+
+@pytest.mark.parametrize("splits", [(250,), (100, 300, 450), (1, 499)])
+def test_incremental_equals_full_rebuild(tournaments, splits):
+    bounds = (0, *splits, len(tournaments))
+    features = career_features(tournaments.iloc[:splits[0]])
+    for start, stop in zip(bounds[1:], bounds[2:]):
+        features = update_career_features(features, tournaments.iloc[start:stop])
+    tm.assert_frame_equal(features.sort_index(), career_features(tournaments))
@@ -0,0 +1,163 @@
+"""
+Every slide's output, compared byte for byte with a recorded snapshot.
+
+The app runs headlessly (Streamlit's AppTest) in its default state, in
+every option of every selectbox and radio, and with each checkbox ticked.
+The JSON spec of every Plotly chart (keys sorted, since key order means
+nothing to Plotly), every metric and every markdown block is hashed; the
+hashes must equal the ones in ``snapshots/figures.json``.
+
+The snapshot is tied to the datasets it was recorded on. The tournament
+history is not committed: conftest.py builds it from the raw export when
+it is missing. After an intended output change, record a new snapshot:
+
+    python tests/test_figures.py --update
+
+A refactoring must not change any output. ``--compare`` renders two app
+folders (e.g. a worktree of the revision before the change, and app/) on
+the same datasets and lists the states whose output differs:
+
+    git worktree add /tmp/before <revision>
+    python tests/test_figures.py --compare /tmp/before/app app
+"""
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).parent
+APP_DIR = TESTS_DIR.parent / "app"
+SNAPSHOT = TESTS_DIR / "snapshots" / "figures.json"
+
+DATASETS = (
+    "games_metadata_enriched.csv",
+    "leaderboard.csv",
+    "players_profiles_with_id.csv",
+    "scatter_df_export.csv",
+    "tournaments_corrected_with_handles_and_games.csv",
+)
+
+
+def data_version(app_dir=APP_DIR):
+    """Hash of the datasets' contents (line endings of the last line ignored)."""
+    digest = hashlib.sha1()
+    for name in DATASETS:
+        if (app_dir / name).exists():
+            digest.update(name.encode())
+            digest.update((app_dir / name).read_bytes().rstrip(b"\n"))
+    return digest.hexdigest()
+
+
+def _hashes(at):
+    hashes = []
+
+    def walk(node):
+        children = getattr(node, "children", None)
+        if not isinstance(children, dict):
+            return
+        for child in children.values():
+            if child.type == "plotly_chart":
+                content = json.dumps(json.loads(child.proto.spec), sort_keys=True)
+            elif child.type == "markdown":
+                content = child.value
+            elif child.type == "metric":
+                content = f"{child.label}\n{child.value}"
+            else:
+                content = None
+            if content is not None:
+                hashes.append(f"{child.type}:{hashlib.sha1(content.encode()).hexdigest()}")
+            walk(child)
+
+    walk(at._tree)
+    return hashes
+
+
+def render_states(app_dir=APP_DIR):
+    """Output hashes of the app in every widget state, by state name."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(app_dir / "streamlit_app.py"), default_timeout=300)
+    at.run()
+    assert not at.exception, at.exception
+    states = {"default": _hashes(at)}
+
+    for kind in ("selectbox", "radio"):
+        for i in range(len(getattr(at, kind))):
+            options = getattr(at, kind)[i].options
+            for option in options:
+                getattr(at, kind)[i].set_value(option)
+                at.run()
+                assert not at.exception, at.exception
+                states[f"{kind}{i}={option}"] = _hashes(at)
+            getattr(at, kind)[i].set_value(options[0])
+            at.run()
+
+    for i in range(len(at.checkbox)):
+        at.checkbox[i].check()
+        at.run()
+        assert not at.exception, at.exception
+        states[f"checkbox{i}"] = _hashes(at)
+        at.checkbox[i].uncheck()
+        at.run()
+    return states
+
+
+def test_figures_match_snapshot():
+    missing = [name for name in DATASETS if not (APP_DIR / name).exists()]
+    assert not missing, f"datasets not built: {', '.join(missing)}"
+    snapshot = json.loads(SNAPSHOT.read_text())
+    assert snapshot["data"] == data_version(), (
+        "app/ datasets differ from the ones the snapshot was recorded on: "
+        "rebuild them with the pipeline, or record a new snapshot with --update"
+    )
+
+    states = render_states()
+    assert sorted(states) == sorted(snapshot["states"])
+    for state, hashes in snapshot["states"].items():
+        assert states[state] == hashes, f"output changed in state {state!r}"
+
+
+def compare(*app_dirs):
+    """Render every app folder in its own process, on the datasets of app/, and diff the outputs."""
+    renders = []
+    for app_dir in app_dirs:
+        app_dir = Path(app_dir).resolve()
+        for name in DATASETS:
+            if not (app_dir / name).exists() and (APP_DIR / name).exists():
+                # The built tournament history is not in a checkout
+                shutil.copy(APP_DIR / name, app_dir / name)
+        assert data_version(app_dir) == data_version(), f"{app_dir} has other datasets than {APP_DIR}"
+        output = subprocess.run(
+            [sys.executable, __file__, "--render", str(app_dir)],
+            capture_output=True, text=True, check=True, cwd=app_dir.parent,
+        ).stdout
+        renders.append(json.loads(output.strip().splitlines()[-1]))
+
+    first, *others = renders
+    changed = sorted(state for other in others for state in set(first) | set(other) if first.get(state) != other.get(state))
+    for state in changed:
+        print(f"❌ output changed in state {state!r}")
+    if changed:
+        sys.exit(1)
+    print(f"✅ identical: {len(first)} states, {sum(map(len, first.values()))} outputs")
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("METRICS_PORT", "0")
+    os.environ.setdefault("WARM_CACHE_DIR", "")
+    if sys.argv[1:2] == ["--update"]:
+        sys.path.insert(0, str(APP_DIR))
+        states = render_states()
+        SNAPSHOT.parent.mkdir(exist_ok=True)
+        SNAPSHOT.write_text(json.dumps({"data": data_version(), "states": states}, indent=1, sort_keys=True) + "\n")
+        print(f"✅ {len(states)} states, {sum(map(len, states.values()))} outputs saved to {SNAPSHOT}")
+    elif sys.argv[1:2] == ["--render"]:
+        sys.path.insert(0, sys.argv[2])
+        print(json.dumps(render_states(Path(sys.argv[2]))))
+    elif sys.argv[1:2] == ["--compare"] and len(sys.argv) > 3:
+        compare(*sys.argv[2:])
+    else:
+        sys.exit(__doc__)
@@ -0,0 +1,15 @@
+"""Slide 8 best-run KPI over short and empty year ranges."""
+import compute
+
+
+def test_label_follows_the_window():
+    first, last = compute.earnings_year_bounds()
+    assert compute.compute_peak_run_kpi((first, last))[0] == "Best 3-Year Run"
+    assert compute.compute_peak_run_kpi((2010, 2011))[0] == "Best 2-Year Run"
+    assert compute.compute_peak_run_kpi((2015, 2015))[0] == "Best Year"
+
+
+def test_no_earnings_in_range():
+    first, _ = compute.earnings_year_bounds()
+    assert compute.compute_earnings_over_time((first, first))["total"] == 0
+    assert compute.compute_peak_run_kpi((first, first)) == ("Best Year", "–")
@@ -0,0 +1,50 @@
+"""Deep sizes of the memoized results (memory debug panel)."""
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+import memo
+import memory
+import stats
+
+
+@pytest.fixture
+def figure_caches():
+    @memo.memoize()
+    def first_figure(n):
+        return go.Figure(go.Bar(x=list(range(n)), y=[i * 2.5 for i in range(n)]))
+
+    @memo.memoize()
+    def second_figure(n):
+        return go.Figure(go.Scatter(x=list(range(n)), y=[i * 0.5 for i in range(n)]))
+
+    names = [f"{__name__}.figure_caches.<locals>.{f.__name__}" for f in (first_figure, second_figure)]
+    for n in (100, 200):
+        first_figure(n)
+        second_figure(n)
+    yield names
+    for name in names:
+        del memo._registry[name]
+
+
+def test_unique_size_after_another_function(figure_caches):
+    report = memory.cache_report().set_index("Function").loc[figure_caches]
+    # Figures are measured through temporary dicts: their ids must not be taken for already counted objects
+    assert (report["Unique MiB"] > 0).all()
+    assert (report["Unique MiB"] <= report["MiB"]).all()
+
+
+def test_shared_objects_counted_once():
+    rows = [list(range(1000))]
+    alone = memory.deep_size(rows)
+    assert memory.deep_size([rows, rows]) < 2 * alone
+
+
+def test_bootstrap_cache_reported():
+    values = pd.DataFrame({"GameType": ["FPS"] * 20, "AvgEarningsPerYear": [float(i) for i in range(20)]})
+    stats._cache.clear()
+    stats.bootstrap_median_ci(values, "GameType", "AvgEarningsPerYear", n_resamples=50)
+    report = memory.cache_report().set_index("Function")
+    stats._cache.clear()
+    assert report.loc["stats.bootstrap_median_ci", "Entries"] == 1
+    assert report.loc["stats.bootstrap_median_ci", "MiB"] > 0
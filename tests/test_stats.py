@@ -0,0 +1,49 @@
+"""Bootstrap intervals: empty input, and the same draws on every path."""
+import numpy as np
+import pandas as pd
+import pytest
+
+import stats
+
+
+@pytest.fixture
+def earnings():
+    rng = np.random.default_rng(1)
+    return pd.DataFrame({
+        "GameType": np.repeat(["FPS", "MOBA", "RTS"], [40, 25, 1]),
+        "AvgEarningsPerYear": rng.lognormal(8, 1, 66),
+    })
+
+
+@pytest.fixture(autouse=True)
+def no_cache():
+    stats._cache.clear()
+    yield
+    stats._cache.clear()
+
+
+def test_no_groups():
+    empty = pd.DataFrame({"GameType": pd.Series([], dtype=object), "AvgEarningsPerYear": pd.Series([], dtype=float)})
+    result = stats.bootstrap_median_ci(empty, "GameType", "AvgEarningsPerYear")
+    assert result.empty
+    assert list(result.columns) == ["Median", "CILow", "CIHigh"]
+    assert result.index.name == "GameType"
+
+
+def test_same_interval_serial_and_pool(earnings, monkeypatch):
+    serial = stats.bootstrap_median_ci(earnings, "GameType", "AvgEarningsPerYear", n_resamples=600, workers=1)
+    monkeypatch.setattr(stats, "PARALLEL_CELLS", 0)
+    for workers in (2, 3):
+        stats._cache.clear()
+        pooled = stats.bootstrap_median_ci(earnings, "GameType", "AvgEarningsPerYear", n_resamples=600, workers=workers)
+        pd.testing.assert_frame_equal(pooled, serial)
+
+
+def test_categories_out_of_label_order():
+    values = pd.DataFrame({
+        "GameType": pd.Categorical(["a"] * 5 + ["b"] * 5, categories=["b", "a"]),
+        "AvgEarningsPerYear": [1.0] * 5 + [100.0] * 5,
+    })
+    result = stats.bootstrap_median_ci(values, "GameType", "AvgEarningsPerYear", n_resamples=50)
+    assert result.loc["a"].tolist() == [1.0, 1.0, 1.0]
+    assert result.loc["b"].tolist() == [100.0, 100.0, 100.0]
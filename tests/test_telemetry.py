@@ -0,0 +1,11 @@
+"""Prometheus metrics when the runtime has no session manager."""
+from streamlit import runtime
+
+import telemetry
+
+
+def test_no_session_manager(monkeypatch):
+    # Like AppTest's runtime
+    monkeypatch.setattr(runtime, "exists", lambda: True)
+    monkeypatch.setattr(runtime, "get_instance", lambda: object())
+    assert "dashboard_active_sessions 0" in telemetry.render()
@@ -0,0 +1,32 @@
+"""Key validation report, on clean and corrupted datasets."""
+import pandas as pd
+
+import validate
+
+
+def duplicate_first_row(path):
+    df = pd.read_csv(path)
+    pd.concat([df, df.iloc[[0]]]).to_csv(path, index=False)
+
+
+def test_clean_datasets_run_every_check(datasets):
+    report = validate.validate_keys()
+    assert None not in report.values()
+    assert report["profiles: duplicate PlayerId"] == 0
+
+
+def test_report_with_duplicate_keys(datasets):
+    duplicate_first_row(datasets / "players_profiles_with_id.csv")
+    duplicate_first_row(datasets / "games_metadata_enriched.csv")
+
+    report = validate.validate_keys()
+    assert report["profiles: duplicate PlayerId"] == 1
+    assert report["games: duplicate GameId"] == 1
+    # Joins onto a non-unique key are reported as not run
+    assert report["career: PlayerId missing from profiles"] is None
+    assert report["career: handle differs from profile"] is None
+    assert report["career: GameName differs from games"] is None
+    assert report["tournaments: GameId missing from games"] is None
+    # The others still run
+    assert report["career: PlayerId missing from top 5000"] == 0
+    assert report["tournaments: PlayerId missing from career"] == 0
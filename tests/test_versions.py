@@ -0,0 +1,46 @@
+"""Memoized loaders after a dataset is rewritten on disk."""
+import os
+
+import pandas as pd
+
+import compute
+import schema
+
+
+def rewrite(path, transform):
+    """Rewrite a CSV through ``transform``, with a later mtime."""
+    mtime = path.stat().st_mtime_ns
+    transform(pd.read_csv(path)).to_csv(path, index=False)
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+
+
+def add_game(games):
+    new_game = games.iloc[[0]].assign(GameName="Chess960", GameType="Board Game", GameId=999_999)
+    return pd.concat([games, new_game])
+
+
+def test_loaders_serve_the_rewritten_file(datasets):
+    games = compute.load_games_data()
+    profiles = compute.load_players_profiles()
+    rewrite(datasets / "games_metadata_enriched.csv", add_game)
+
+    assert compute.load_games_data() is not games
+    assert "Chess960" in set(compute.load_games_data()["GameName"])
+    assert "Board Game" in compute.game_type_options()
+    # Rewriting one file also refreshes the frames of the others
+    assert compute.load_players_profiles() is not profiles
+
+
+def test_one_dictionary_after_a_rewrite(datasets):
+    import validate
+
+    validate.validate_keys()
+    rewrite(datasets / "games_metadata_enriched.csv", add_game)
+
+    dtypes = schema.category_dtypes()
+    frames = [compute.load_data(), compute.load_games_data(), compute.load_players_profiles(), compute.load_top_players()]
+    for frame in frames:
+        for column in set(schema.CATEGORY_COLUMNS) & set(frame.columns):
+            assert frame[column].dtype == dtypes[column]
+    # Compares categoricals across frames
+    validate.validate_keys()